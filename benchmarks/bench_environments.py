@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+"""Benchmark per-environment lookups of the gcp conversion path.
+
+Builds gcp configs with a growing number of environments (see
+``generate_gcp_environments`` in ``synthetic.py``) and times looking up
+every environment's ``projects`` and ``app_infra`` entries with the linear
+scans ``convert_environment_configs`` used to do, and with
+``config.converter.index_environments``. It also times a full conversion of
+every environment to tfvars files. Time per environment should stay flat
+for the index and grow with the environment count for the scans.
+
+Usage:
+    python3 benchmarks/bench_environments.py [--sizes 100 200 400 800]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+import main as cli  # noqa: E402
+from config.converter import index_environments  # noqa: E402
+from synthetic import generate_gcp_environments, write_config  # noqa: E402
+
+
+def legacy_lookup(config):
+    """The per-environment scans convert_environment_configs used before the index."""
+    for env in config.get('environments', []):
+        env_name = env.get('name')
+        {
+            'environment': env_name,
+            'projects': next((e['projects'] for e in config.get('projects', {}).get('environments', [])
+                              if e['environment'] == env_name), []),
+            'app_infra': next((e for e in config.get('app_infra', {}).get('environments', [])
+                               if e['environment'] == env_name), {}),
+        }
+
+
+def indexed_lookup(config):
+    """Look every environment up through the name-keyed index."""
+    index = index_environments(config)
+    for env_name in index.names:
+        index.environment_tfvars(env_name)
+
+
+def best_time(func, rounds=3):
+    """Return the best wall time of a function in seconds."""
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 200, 400, 800],
+                        help='Environment counts to generate')
+    args = parser.parse_args()
+
+    print(f"{'environments':>12} {'operation':>10} {'time (s)':>9} {'per env (us)':>13}")
+    with tempfile.TemporaryDirectory() as work_dir:
+        for size in args.sizes:
+            config = generate_gcp_environments(size)
+            base_dir = os.path.join(work_dir, f'gcp-{size}')
+            os.makedirs(base_dir)
+            config_file = os.path.join(base_dir, 'config.yaml')
+            write_config(config, config_file)
+
+            def convert():
+                with contextlib.redirect_stdout(io.StringIO()):
+                    if not cli.convert_environment_configs(base_dir, config, config_file, 'gcp', force=True):
+                        raise RuntimeError('conversion failed')
+
+            for name, func in [('scan', lambda: legacy_lookup(config)),
+                               ('index', lambda: indexed_lookup(config)),
+                               ('convert', convert)]:
+                seconds = best_time(func)
+                print(f"{size:>12} {name:>10} {seconds:>9.4f} {seconds / size * 1e6:>13.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+"""Benchmark the tfvars writers against the old JSON-based one.
+
+Builds pbmm-gcp tfvars for configs with a growing number of business units
+(see ``synthetic.py``) and writes them to a temporary file with the writer
+``yaml_to_tfvars`` used to have (``json.dumps(value, indent=2)`` per
+variable), with the streaming ``config.hcl.write_tfvars`` and with the
+compact ``.tfvars.json`` writer ``config.tfjson.write_tfvars``, reporting
+the best wall time and the peak Python memory of each.
+
+Usage:
+    python3 benchmarks/bench_hcl.py [--sizes 100 1000 5000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks.synthetic import generate_config  # noqa: E402
+from src.config import hcl, tfjson  # noqa: E402
+from src.config.converter import build_tfvars  # noqa: E402
+
+
+def legacy_write(tfvars, f):
+    """The writer yaml_to_tfvars used before the HCL emitter."""
+    for key, value in tfvars.items():
+        if isinstance(value, (dict, list)):
+            f.write(f'{key} = {json.dumps(value, indent=2)}\n')
+        else:
+            f.write(f'{key} = "{value}"\n')
+
+
+# Writers to compare: (name, function, file mode)
+WRITERS = [
+    ('json', legacy_write, 'w'),
+    ('hcl', hcl.write_tfvars, 'w'),
+    ('tfvars.json', tfjson.write_tfvars, 'wb'),
+]
+
+
+def measure(writer, mode, tfvars, path, rounds=3):
+    """Return (best wall time in seconds, peak traced memory in bytes)."""
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        with open(path, mode) as f:
+            writer(tfvars, f)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        with open(path, mode) as f:
+            writer(tfvars, f)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return min(timings), peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 5000],
+                        help='Business unit counts to generate')
+    args = parser.parse_args()
+
+    print(f"orjson available: {tfjson.ORJSON_AVAILABLE}")
+    print(f"{'business units':>15} {'writer':>12} {'time (s)':>9} {'peak (MiB)':>11} {'size (KiB)':>11}")
+    with tempfile.TemporaryDirectory() as work_dir:
+        path = os.path.join(work_dir, 'out.auto.tfvars')
+        for size in args.sizes:
+            tfvars = build_tfvars(generate_config('pbmm-gcp', size))
+            for name, writer, mode in WRITERS:
+                seconds, peak = measure(writer, mode, tfvars, path)
+                print(f"{size:>15} {name:>12} {seconds:>9.3f} {peak / 2**20:>11.1f} "
+                      f"{os.path.getsize(path) / 1024:>11.0f}")
+
+
+if __name__ == '__main__':
+    main()
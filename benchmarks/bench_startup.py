@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+
+"""Startup import-time budget check for the CLI.
+
+Runs ``src/main.py convert`` under ``python -X importtime`` and sums the
+cumulative import time of the modules the tool itself pulls in, leaving
+out everything the interpreter imports on a bare ``python -c pass``. Exits
+non-zero if that total exceeds the budget or if a module that only
+validate or deploy need (Cloud Build client, rich, jsonschema) is imported.
+
+Usage:
+    python3 benchmarks/bench_startup.py [--budget-ms 100] [--repeat 5]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+MAIN = os.path.join(ROOT, 'src', 'main.py')
+EXAMPLE = os.path.join(ROOT, 'examples', 'pbmm_config.yaml')
+
+# Modules that must stay out of the convert start-up path
+FORBIDDEN_PREFIXES = ('google.cloud', 'rich', 'jsonschema')
+
+# Default budget for the tool's own imports, in milliseconds
+DEFAULT_BUDGET_MS = 100.0
+
+
+def import_times(args):
+    """Run Python with -X importtime and return {module: (depth, cumulative_us)}."""
+    result = subprocess.run([sys.executable, '-X', 'importtime', *args],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True)
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative_us, name = line.split('|')
+        depth = (len(name) - len(name.lstrip(' ')) - 1) // 2
+        modules[name.strip()] = (depth, int(cumulative_us))
+    return modules
+
+
+def measure(output_file):
+    """Return (total_us, top-level modules, forbidden modules) for one run."""
+    baseline = import_times(['-c', 'pass'])
+    modules = import_times([MAIN, 'convert', EXAMPLE, output_file])
+    top_level = {name: us for name, (depth, us) in modules.items()
+                 if depth == 0 and name not in baseline}
+    forbidden = sorted(name for name in modules if name.startswith(FORBIDDEN_PREFIXES))
+    return sum(top_level.values()), top_level, forbidden
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS,
+                        help='Maximum import time for convert, in milliseconds')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs to take the best of')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output_file = os.path.join(tmp_dir, 'out.auto.tfvars')
+        runs = [measure(output_file) for _ in range(args.repeat)]
+    total_us, top_level, forbidden = min(runs, key=lambda run: run[0])
+
+    for name, us in sorted(top_level.items(), key=lambda item: -item[1])[:10]:
+        print(f"{us / 1000:8.1f} ms  {name}")
+    print(f"convert import time: {total_us / 1000:.1f} ms (budget {args.budget_ms:.1f} ms)")
+
+    failed = False
+    if forbidden:
+        print(f"❌ convert imports heavy modules: {', '.join(forbidden)}", file=sys.stderr)
+        failed = True
+    if total_us / 1000 > args.budget_ms:
+        print("❌ convert exceeds its import budget", file=sys.stderr)
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+
+"""Scaling benchmark suite for validation and conversion.
+
+Generates synthetic configs of increasing size (see ``synthetic.py``) and
+measures wall time and peak Python memory of ``ConfigValidator.validate_file``,
+``yaml_to_tfvars`` and ``convert_environment_configs`` for both landing zone
+types. Results are written as JSON, by default to
+``benchmarks/results/<commit>.json``, so runs can be compared across commits.
+
+Usage:
+    python3 benchmarks/bench_suite.py [--sizes 10 100 1000] [--repeat 3]
+    python3 benchmarks/bench_suite.py --compare benchmarks/results/<base>.json [--fail-above 1.25]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+import main as cli  # noqa: E402
+from config.validator import ConfigValidator  # noqa: E402
+from config.yaml_loader import CONFIG_STORE  # noqa: E402
+from synthetic import generate_config, write_config, write_pbmm_tree  # noqa: E402
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+
+def prepare(lz_type, size, work_dir):
+    """Write the input files for one landing zone type and size.
+
+    Returns:
+        Tuple of (config file path, parsed config, conversion base directory).
+    """
+    config = generate_config(lz_type, size)
+    base_dir = os.path.join(work_dir, f'{lz_type}-{size}')
+    os.makedirs(base_dir)
+    config_file = os.path.join(base_dir, 'config.yaml')
+    write_config(config, config_file)
+    if lz_type == 'pbmm-gcp':
+        write_pbmm_tree(config, base_dir)
+    return config_file, config, base_dir
+
+
+def cases(config_file, config, base_dir):
+    """Return the benchmarked operations as {name: callable}."""
+    lz_type = config['landing_zone']['type']
+    return {
+        'validate_file': lambda: ConfigValidator().validate_file(config_file),
+        'yaml_to_tfvars': lambda: cli.yaml_to_tfvars(
+            config_file, os.path.join(base_dir, 'out.auto.tfvars'), False, lz_type),
+        'convert_environment_configs': lambda: cli.convert_environment_configs(
+            base_dir, config, config_file, lz_type, force=True),
+    }
+
+
+def run_once(func):
+    """Run an operation from a cold config store, with its output silenced."""
+    CONFIG_STORE.clear()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = func()
+    if result is False:
+        raise RuntimeError('operation reported failure')
+
+
+def measure(func, repeat):
+    """Return (best wall time in seconds, peak traced memory in bytes)."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run_once(func)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        run_once(func)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return min(timings), peak
+
+
+def git_commit():
+    """Return the short commit hash of the working tree, if available."""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline_file, fail_above):
+    """Print time ratios against a baseline run; return True if within bounds."""
+    with open(baseline_file, 'r') as f:
+        baseline = {(r['benchmark'], r['landing_zone_type'], r['size']): r for r in json.load(f)['results']}
+
+    ok = True
+    print(f"\nComparison with {baseline_file}:")
+    for result in results:
+        base = baseline.get((result['benchmark'], result['landing_zone_type'], result['size']))
+        if base is None:
+            continue
+        ratio = result['seconds'] / base['seconds'] if base['seconds'] else float('inf')
+        regressed = fail_above is not None and ratio > fail_above
+        ok = ok and not regressed
+        print(f"{'❌' if regressed else '  '} {result['benchmark']:<28} {result['landing_zone_type']:<9} "
+              f"{result['size']:>6}  time x{ratio:.2f}  "
+              f"memory x{result['peak_bytes'] / max(base['peak_bytes'], 1):.2f}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1000],
+                        help='Business units / projects per environment to generate')
+    parser.add_argument('--types', nargs='+', default=['pbmm-gcp', 'gcp'], choices=['pbmm-gcp', 'gcp'])
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per case (best is kept)')
+    parser.add_argument('--output', help='Results file (default: benchmarks/results/<commit>.json)')
+    parser.add_argument('--compare', help='Baseline results file to compare against')
+    parser.add_argument('--fail-above', type=float, default=None,
+                        help='Exit non-zero if any case is slower than the baseline by this ratio')
+    args = parser.parse_args()
+
+    commit = git_commit()
+    results = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        for lz_type in args.types:
+            for size in args.sizes:
+                inputs = prepare(lz_type, size, work_dir)
+                for name, func in cases(*inputs).items():
+                    seconds, peak = measure(func, args.repeat)
+                    results.append({
+                        'benchmark': name,
+                        'landing_zone_type': lz_type,
+                        'size': size,
+                        'seconds': round(seconds, 6),
+                        'peak_bytes': peak,
+                    })
+                    print(f"{name:<28} {lz_type:<9} {size:>6}  {seconds:9.3f} s  {peak / 2**20:9.1f} MiB")
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{commit or 'local'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump({
+            'commit': commit,
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'results': results,
+        }, f, indent=2)
+    print(f"\nResults written to {output}")
+
+    if args.compare and not compare(results, args.compare, args.fail_above):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
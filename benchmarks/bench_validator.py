@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+"""Micro-benchmark for per-config schema validation cost.
+
+Compares the old approach of calling ``jsonschema.validate()`` for the base
+and landing zone schemas (which re-checks each schema against its metaschema
+and builds a fresh validator every time) with ``ConfigValidator``, which
+reuses the validators compiled by the process-wide schema registry.
+
+Usage:
+    python3 benchmarks/bench_validator.py [config.yaml] [--repeat N]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+import yaml
+from jsonschema import validate
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.config.validator import BASE_SCHEMA, LANDING_ZONE_SCHEMAS, ConfigValidator  # noqa: E402
+
+DEFAULT_CONFIG = os.path.join(os.path.dirname(__file__), '../examples/pbmm_config.yaml')
+
+
+def validate_uncached(config):
+    """Validate the way ConfigValidator did before the schema registry."""
+    validate(instance=config, schema=BASE_SCHEMA)
+    validate(instance=config, schema=LANDING_ZONE_SCHEMAS[config['landing_zone']['type']])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('config_file', nargs='?', default=DEFAULT_CONFIG)
+    parser.add_argument('--repeat', type=int, default=200, help='Validations per measurement')
+    args = parser.parse_args()
+
+    with open(args.config_file, 'r') as f:
+        config = yaml.safe_load(f)
+
+    validator = ConfigValidator()
+    validator.validate_config(config)  # compile outside the timed region
+
+    before = min(timeit.repeat(lambda: validate_uncached(config), number=args.repeat, repeat=5)) / args.repeat
+    after = min(timeit.repeat(lambda: validator.validate_config(config), number=args.repeat, repeat=5)) / args.repeat
+
+    print(f"Config: {args.config_file}")
+    print(f"jsonschema.validate (per config):     {before * 1e6:10.1f} us")
+    print(f"ConfigValidator (per config):         {after * 1e6:10.1f} us")
+    print(f"Speedup:                              {before / after:10.1f}x")
+
+
+if __name__ == '__main__':
+    main()
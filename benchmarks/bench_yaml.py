@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+
+"""Benchmark YAML parse time with and without libyaml.
+
+Generates pbmm-gcp configs with a growing number of business units (see
+``synthetic.py``) and times ``yaml.safe_load`` (pure Python) against the
+shared loader, which uses ``CSafeLoader`` when PyYAML was built with libyaml.
+
+Usage:
+    python3 benchmarks/bench_yaml.py [--sizes 100 1000 5000]
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+
+import yaml
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks.synthetic import dump_config, generate_config  # noqa: E402
+from src.config.yaml_loader import LIBYAML_AVAILABLE, safe_load  # noqa: E402
+
+
+def generate(size):
+    """Return YAML text for a config with ``size`` business units."""
+    stream = io.StringIO()
+    dump_config(generate_config('pbmm-gcp', size), stream)
+    return stream.getvalue()
+
+
+def best_of(func, text, rounds=3):
+    """Return the fastest of several timed parses."""
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func(text)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 5000],
+                        help='Business unit counts to generate')
+    args = parser.parse_args()
+
+    print(f"libyaml available: {LIBYAML_AVAILABLE}")
+    print(f"{'business units':>15} {'size (KiB)':>11} {'safe_load (s)':>14} {'shared (s)':>11} {'speedup':>8}")
+    for size in args.sizes:
+        text = generate(size)
+        pure = best_of(yaml.safe_load, text)
+        fast = best_of(safe_load, text)
+        print(f"{size:>15} {len(text) / 1024:>11.0f} {pure:>14.3f} {fast:>11.3f} {pure / fast:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+
+"""Synthetic landing zone config generator for performance testing.
+
+Builds schema-valid pbmm-gcp and gcp configs of arbitrary size: business
+units with per-environment settings, projects, subnets and GKE clusters.
+Every CIDR is allocated from a dedicated pool so generated configs never
+contain overlapping ranges; the pools fit roughly 10,000 business units.
+Output is deterministic for a given size.
+
+Usage:
+    python3 benchmarks/synthetic.py pbmm-gcp 1000 -o big_config.yaml
+    python3 benchmarks/synthetic.py pbmm-gcp 1000 --tree /tmp/lz
+"""
+
+import argparse
+import ipaddress
+import os
+import sys
+from typing import Any, Dict, Iterator, List
+
+import yaml
+
+# Environment names used by the schemas and by the 4-projects directory layout
+SCHEMA_ENVIRONMENTS = [('development', 'd'), ('non-production', 'n'), ('production', 'p')]
+BU_ENVIRONMENTS = [('development', 'd'), ('nonproduction', 'n'), ('production', 'p')]
+
+
+def cidr_pool(network: str, prefix: int) -> Iterator[str]:
+    """Yield consecutive, non-overlapping subnets of a network."""
+    for subnet in ipaddress.ip_network(network).subnets(new_prefix=prefix):
+        yield str(subnet)
+
+
+def _groups() -> Dict[str, Any]:
+    return {
+        'create_required_groups': True,
+        'create_optional_groups': True,
+        'billing_project': 'synthetic-billing',
+        'required_groups': {
+            'group_org_admins': 'gcp-organization-admins@example.com',
+            'group_billing_admins': 'gcp-billing-admins@example.com',
+            'billing_data_users': 'gcp-billing-data@example.com',
+            'audit_data_users': 'gcp-audit-data@example.com',
+            'monitoring_workspace_users': 'gcp-monitoring-workspace@example.com',
+        },
+        'optional_groups': {
+            'gcp_security_reviewer': 'gcp-security-reviewer@example.com',
+            'gcp_network_viewer': 'gcp-network-viewer@example.com',
+            'gcp_scc_admin': 'gcp-scc-admin@example.com',
+            'gcp_global_secrets_admin': 'gcp-global-secrets-admin@example.com',
+            'gcp_kms_admin': 'gcp-kms-admin@example.com',
+        },
+    }
+
+
+def _business_units(size: int, subnets: Iterator[str]) -> List[Dict[str, Any]]:
+    units = []
+    for i in range(size):
+        bu = {
+            'business_code': f'bu{i}',
+            'business_unit': f'Business Unit {i}',
+            'location_kms': 'ca',
+            'location_gcs': 'ca',
+            'tfc_org_name': 'synthetic-org',
+            'gcs_bucket_prefix': 'bkt',
+            'folder_prefix': 'fldr',
+            'primary_contact': f'owner{i}@example.com',
+            'secondary_contact': f'backup{i}@example.com',
+        }
+        for env, code in BU_ENVIRONMENTS:
+            bu[env] = {
+                'env_code': code,
+                'billing_code': f'{i:04d}',
+                'env_enabled': True,
+                'windows_activation_enabled': False,
+                'firewall_logging_enabled': True,
+                'optional_fw_rules_enabled': True,
+                'vpc_flow_logs_enabled': True,
+                'peering_iap_fw_rules_enabled': False,
+                'key_ring_name': f'{env}-keyring',
+                'key_name': f'{env}-key',
+                'key_rotation_period': '7776000s',
+                'base': {
+                    'enabled': True,
+                    'ip_ranges': {'subnet1': next(subnets), 'subnet2': next(subnets)},
+                    'projects': [{
+                        'id': f'{code}-bu{i}-base',
+                        'name': f'BU {i} {env} base',
+                        'services': ['compute.googleapis.com', 'container.googleapis.com'],
+                    }],
+                },
+                'restricted': {
+                    'enabled': True,
+                    'ip_ranges': {'subnet1': next(subnets)},
+                    'projects': [{
+                        'id': f'{code}-bu{i}-restricted',
+                        'name': f'BU {i} {env} restricted',
+                        'services': ['compute.googleapis.com'],
+                    }],
+                    'vpc_scp': True,
+                },
+            }
+        units.append(bu)
+    return units
+
+
+def _projects(size: int) -> Dict[str, Any]:
+    return {
+        'common': {'billing_account': 'ABCDEF-GHIJKL-MNOPQR', 'parent_folder': 'folders/12345678'},
+        'environments': [{
+            'environment': env,
+            'projects': [{
+                'name': f'app-{code}-{i}',
+                'apis': ['compute.googleapis.com', 'container.googleapis.com'],
+                'labels': {'environment': env, 'application': f'app-{i}'},
+            } for i in range(size)],
+        } for env, code in SCHEMA_ENVIRONMENTS],
+    }
+
+
+def _app_infra(size: int, pods: Iterator[str], services: Iterator[str], region: str) -> Dict[str, Any]:
+    return {
+        'environments': [{
+            'environment': env,
+            'business_units': [{
+                'name': f'bu{i}',
+                'gke_clusters': [{
+                    'name': f'gke-{code}-{i}',
+                    'region': region,
+                    'network_config': {
+                        'network': f'{code}-network',
+                        'subnetwork': f'{code}-subnet-{i}',
+                        'ip_range_pods': next(pods),
+                        'ip_range_services': next(services),
+                    },
+                }],
+            } for i in range(size)],
+        } for env, code in SCHEMA_ENVIRONMENTS],
+    }
+
+
+def generate_pbmm_config(size: int) -> Dict[str, Any]:
+    """Generate a valid pbmm-gcp config.
+
+    Args:
+        size: Number of business units; projects, subnets and GKE clusters
+            per environment scale with it.
+
+    Returns:
+        The configuration dictionary.
+    """
+    region = 'northamerica-northeast1'
+    subnets = cidr_pool('10.0.0.0/8', 26)
+    return {
+        'version': '1.0',
+        'landing_zone': {'type': 'pbmm-gcp'},
+        'regions': {'primary': region, 'secondary': 'northamerica-northeast2'},
+        'business_units': _business_units(size, subnets),
+        'bootstrap': {
+            'org_id': '123456789012',
+            'billing_account': 'ABCDEF-GHIJKL-MNOPQR',
+            'default_region': region,
+            'groups': _groups(),
+        },
+        'org': {
+            'parent_folder': 'folders/12345678',
+            'billing_data_users': 'gcp-billing-data@example.com',
+            'audit_data_users': 'gcp-audit-data@example.com',
+            'scc_notification_name': 'synthetic-scc',
+        },
+        'environments': [{
+            'name': env,
+            'environment_code': code,
+            'monitoring': {
+                'enable_monitoring': True,
+                'monitoring_workspace_users': 'gcp-monitoring-workspace@example.com',
+            },
+        } for env, code in SCHEMA_ENVIRONMENTS],
+        'networking': {
+            'enable_hub_and_spoke': True,
+            'enable_vpn': False,
+            'dns_enable_logging': True,
+            'shared_vpc_host_project_id': 'shared-vpc-host',
+            'base_network': {
+                'network_name': 'base-network',
+                'subnets': [{
+                    'subnet_name': f'subnet-{i}',
+                    'subnet_ip': next(subnets),
+                    'subnet_region': region,
+                } for i in range(size)],
+            },
+        },
+        'projects': _projects(size),
+        'app_infra': _app_infra(size, cidr_pool('100.64.0.0/10', 25),
+                                cidr_pool('172.16.0.0/12', 27), region),
+        'org_policies': {
+            'policy_boolean': {
+                'vmExternalIpAccess': False,
+                'skipDefaultNetworkCreation': True,
+                'disableSerialPortAccess': True,
+                'disableDefaultIamGrantsServiceAccounts': True,
+            },
+            'policy_list': {
+                'restrictVpcPeering': ['under:folders/12345678'],
+                'restrictSharedVpcSubnetworks': ['projects/host-project'],
+                'restrictSharedVpcHostProjects': ['projects/host-project'],
+            },
+        },
+        'fortigate': {
+            'enabled': True,
+            'version': '7.2.3',
+            'license_type': 'byol',
+            'config': {
+                'ha_enabled': True,
+                'regions': [region],
+                'machine_type': 'n2-standard-4',
+                'service_account': 'fortigate-sa@project-id.iam.gserviceaccount.com',
+                'networks': [{'name': name, 'cidr': cidr} for name, cidr in
+                             zip(['external', 'internal', 'hasync', 'mgmt'],
+                                 cidr_pool('192.168.0.0/16', 24))],
+            },
+        },
+    }
+
+
+def generate_gcp_config(size: int) -> Dict[str, Any]:
+    """Generate a valid gcp config.
+
+    Args:
+        size: Number of projects and GKE clusters per environment.
+
+    Returns:
+        The configuration dictionary.
+    """
+    region = 'us-central1'
+    return {
+        'version': '1.0',
+        'landing_zone': {'type': 'gcp'},
+        'bootstrap': {
+            'org_id': '123456789012',
+            'billing_account': 'ABC123-DEF456-GHI789',
+            'default_region': region,
+        },
+        'org': {'parent_folder': 'folders/987654321', 'scc_notification_name': 'synthetic-scc'},
+        'environments': [{'name': env, 'environment_code': code} for env, code in SCHEMA_ENVIRONMENTS],
+        'networking': {
+            'enable_hub_and_spoke': True,
+            'dns_enable_logging': True,
+            'shared_vpc_host_project_id': 'shared-vpc-host',
+        },
+        'projects': _projects(size),
+        'app_infra': _app_infra(size, cidr_pool('100.64.0.0/10', 25),
+                                cidr_pool('172.16.0.0/12', 27), region),
+    }
+
+
+def generate_gcp_environments(count: int, size: int = 1) -> Dict[str, Any]:
+    """Generate a gcp config with many environments.
+
+    The schema only allows three environment names, so the result is not
+    schema-valid; it exercises the per-environment conversion path.
+
+    Args:
+        count: Number of environments.
+        size: Number of projects and GKE clusters per environment.
+
+    Returns:
+        The configuration dictionary.
+    """
+    config = generate_gcp_config(size)
+    names = [f'env-{i:04d}' for i in range(count)]
+    project_template = config['projects']['environments'][0]
+    app_infra_template = config['app_infra']['environments'][0]
+    config['environments'] = [{'name': name, 'environment_code': 'd'} for name in names]
+    config['projects']['environments'] = [dict(project_template, environment=name) for name in names]
+    config['app_infra']['environments'] = [dict(app_infra_template, environment=name) for name in names]
+    return config
+
+
+GENERATORS = {
+    'pbmm-gcp': generate_pbmm_config,
+    'gcp': generate_gcp_config,
+}
+
+
+def generate_config(lz_type: str, size: int) -> Dict[str, Any]:
+    """Generate a valid config of the given landing zone type and size."""
+    return GENERATORS[lz_type](size)
+
+
+def dump_config(config: Dict[str, Any], stream) -> None:
+    """Serialize a config as YAML, using libyaml when available."""
+    yaml.dump(config, stream, Dumper=getattr(yaml, 'CSafeDumper', yaml.SafeDumper), sort_keys=False)
+
+
+def write_config(config: Dict[str, Any], path: str) -> None:
+    """Write a config to a YAML file."""
+    with open(path, 'w') as f:
+        dump_config(config, f)
+
+
+def write_pbmm_tree(config: Dict[str, Any], base_dir: str) -> None:
+    """Lay a pbmm-gcp config out as 4-projects/business_units/<env>/config.yaml.
+
+    This is the structure convert_environment_configs walks for pbmm-gcp.
+    """
+    for env, _ in BU_ENVIRONMENTS:
+        env_dir = os.path.join(base_dir, '4-projects', 'business_units', env)
+        os.makedirs(env_dir, exist_ok=True)
+        write_config(config, os.path.join(env_dir, 'config.yaml'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('landing_zone_type', choices=sorted(GENERATORS))
+    parser.add_argument('size', type=int, help='Number of business units / projects per environment')
+    parser.add_argument('-o', '--output', help='Write the config to this YAML file')
+    parser.add_argument('--tree', help='Write a pbmm-gcp 4-projects tree under this directory')
+    args = parser.parse_args()
+
+    config = generate_config(args.landing_zone_type, args.size)
+    if args.tree:
+        write_pbmm_tree(config, args.tree)
+    if args.output:
+        write_config(config, args.output)
+    elif not args.tree:
+        dump_config(config, sys.stdout)
+
+
+if __name__ == '__main__':
+    main()
@@ -24,11 +24,10 @@ chmod 755 ./tf-wrapper.sh
 # Convert YAML configurations to Terraform variables using main.py
 for env in development nonproduction production; do
   if [ -f "./business_units/${env}/config.yaml" ]; then
-    # Convert to environment-specific tfvars
-    python3 ../../src/main.py convert "./business_units/${env}/config.yaml" "./business_units/${env}/${env}.auto.tfvars"
-    
-    # Extract common configuration to common.auto.tfvars
-    python3 ../../src/main.py convert "./business_units/${env}/config.yaml" "./business_units/${env}/common.auto.tfvars" --common-only
+    # Convert to environment-specific tfvars and extract common configuration
+    # to common.auto.tfvars, parsing the config once
+    python3 ../../src/main.py convert "./business_units/${env}/config.yaml" "./business_units/${env}/${env}.auto.tfvars" \
+        --common-output "./business_units/${env}/common.auto.tfvars"
   fi
 done
 
@@ -9,6 +9,12 @@ setup(
         "pyyaml>=6.0.1",
         "jsonschema>=4.19.0"
     ],
+    extras_require={
+        # Faster encoder for convert --format json
+        "fast": ["orjson>=3.9"],
+        # Push-based build progress for deploy --subscription
+        "pubsub": ["google-cloud-pubsub>=2.18"],
+    },
     entry_points={
         'console_scripts': [
             'lz-config=main:main',
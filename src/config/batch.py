@@ -0,0 +1,111 @@
+"""Batch validation of many configuration files across worker processes."""
+
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .cache import ValidationCache
+from .validator import SCHEMA_REGISTRY, ConfigValidator, ValidationIssue
+
+# File extensions picked up when a directory is given
+CONFIG_EXTENSIONS = ('.yaml', '.yml')
+
+# Per-worker validator, created once by the pool initializer
+_worker_validator: Optional[ConfigValidator] = None
+
+
+class FileResult(NamedTuple):
+    """Outcome of validating a single configuration file."""
+
+    path: str
+    ok: bool
+    seconds: float
+    errors: Tuple[ValidationIssue, ...] = ()
+    warnings: Tuple[ValidationIssue, ...] = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable representation of the result."""
+        return {
+            'path': self.path,
+            'valid': self.ok,
+            'seconds': round(self.seconds, 6),
+            'errors': [issue._asdict() for issue in self.errors],
+            'warnings': [issue._asdict() for issue in self.warnings],
+        }
+
+
+def expand_config_paths(patterns: Iterable[str]) -> List[str]:
+    """Expand files, directories and glob patterns into config file paths.
+
+    Directories are searched recursively for YAML files. Paths that match
+    nothing are kept as-is so that they are reported as failures.
+
+    Args:
+        patterns: File paths, directory paths or glob patterns.
+
+    Returns:
+        De-duplicated list of paths, in the order they were given.
+    """
+    paths = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            for root, dirs, files in os.walk(pattern):
+                dirs.sort()
+                paths.extend(os.path.join(root, name) for name in sorted(files)
+                             if name.endswith(CONFIG_EXTENSIONS))
+        elif glob.has_magic(pattern):
+            paths.extend(sorted(glob.glob(pattern, recursive=True)))
+        else:
+            paths.append(pattern)
+    return list(dict.fromkeys(paths))
+
+
+def _init_worker(cache: Optional[ValidationCache] = None) -> None:
+    """Compile all schemas once per worker process."""
+    global _worker_validator
+    SCHEMA_REGISTRY.preload()
+    _worker_validator = ConfigValidator(cache=cache)
+
+
+def validate_one(path: str) -> FileResult:
+    """Validate one file with the worker's validator, collecting all errors and warnings.
+
+    Args:
+        path: Path to the YAML configuration file.
+
+    Returns:
+        FileResult describing the outcome; never raises.
+    """
+    validator = _worker_validator or ConfigValidator()
+    start = time.perf_counter()
+    warnings: Tuple[ValidationIssue, ...] = ()
+    try:
+        errors = tuple(validator.check_file(path))
+        warnings = tuple(validator.find_warnings(validator.store.load(path).data))
+    except Exception as e:
+        errors = (ValidationIssue('$', '', str(e)),)
+    return FileResult(path, not errors, time.perf_counter() - start, errors, warnings)
+
+
+def validate_files(paths: List[str], jobs: Optional[int] = None,
+                   cache: Optional[ValidationCache] = None) -> List[FileResult]:
+    """Validate many configuration files in parallel.
+
+    Args:
+        paths: Paths of the configuration files to validate.
+        jobs: Maximum number of worker processes; defaults to the CPU count.
+        cache: Optional validation result cache shared by all workers.
+
+    Returns:
+        One FileResult per path, in the same order as ``paths``.
+    """
+    jobs = min(jobs or os.cpu_count() or 1, len(paths))
+    if jobs <= 1:
+        _init_worker(cache)
+        return [validate_one(path) for path in paths]
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                             initargs=(cache,)) as executor:
+        return list(executor.map(validate_one, paths, chunksize=max(1, len(paths) // (jobs * 4))))
@@ -0,0 +1,150 @@
+"""Translation of cloudbuild.yaml steps and analysis of their dependencies.
+
+Cloud Build runs a step once every step in its ``waitFor`` list has
+finished. A step without ``waitFor`` waits for all steps before it, and
+``waitFor: ['-']`` starts a step as soon as the build starts, so steps
+form a DAG in which independent steps run concurrently.
+"""
+
+import datetime
+import re
+from typing import Any, Dict, List, NamedTuple, Sequence
+
+# cloudbuild.yaml step keys and the BuildStep fields they map to
+STEP_FIELDS = {
+    'name': 'name',
+    'id': 'id',
+    'args': 'args',
+    'env': 'env',
+    'dir': 'dir_',
+    'entrypoint': 'entrypoint',
+    'secretEnv': 'secret_env',
+    'volumes': 'volumes',
+    'waitFor': 'wait_for',
+    'timeout': 'timeout',
+    'script': 'script',
+    'allowFailure': 'allow_failure',
+    'allowExitCodes': 'allow_exit_codes',
+    'automapSubstitutions': 'automap_substitutions',
+}
+
+# waitFor entry that makes a step start with the build
+START_OF_BUILD = '-'
+
+_DURATION = re.compile(r'^(\d+(?:\.\d+)?)s$')
+
+
+class StepChain(NamedTuple):
+    """The longest chain of steps that must run one after another."""
+
+    steps: List[str]
+    total: int
+
+    def describe(self) -> str:
+        """Return e.g. ``2 of 3 steps: check-out-source -> deploy``."""
+        return f"{len(self.steps)} of {self.total} steps: {' -> '.join(self.steps)}"
+
+
+def parse_duration(value: Any) -> datetime.timedelta:
+    """Parse a Cloud Build duration such as ``600s`` or a number of seconds.
+
+    Raises:
+        ValueError: If the value is not a non-negative duration.
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool) and value >= 0:
+        return datetime.timedelta(seconds=value)
+    match = _DURATION.match(str(value))
+    if match is None:
+        raise ValueError(f"Invalid duration {value!r}, expected seconds such as '600s'")
+    return datetime.timedelta(seconds=float(match.group(1)))
+
+
+def step_label(step: Dict[str, Any], index: int) -> str:
+    """Return the id of a step, or its position and image if it has none."""
+    return step.get('id') or f"#{index} {step.get('name', '')}".rstrip()
+
+
+def translate_step(step: Dict[str, Any], index: int = 0) -> Dict[str, Any]:
+    """Map a cloudbuild.yaml step to ``cloudbuild_v1.BuildStep`` keyword arguments.
+
+    Args:
+        step: The step as written in cloudbuild.yaml.
+        index: Position of the step, used in error messages.
+
+    Raises:
+        ValueError: If the step has an unknown key, no name, or an invalid
+            timeout or volume.
+    """
+    unknown = sorted(set(step) - set(STEP_FIELDS))
+    if unknown:
+        raise ValueError(f"steps[{index}]: unsupported keys {', '.join(unknown)}")
+    if not step.get('name'):
+        raise ValueError(f"steps[{index}]: name is required")
+
+    fields = {STEP_FIELDS[key]: value for key, value in step.items()}
+    if 'timeout' in fields:
+        try:
+            fields['timeout'] = parse_duration(fields['timeout'])
+        except ValueError as e:
+            raise ValueError(f"steps[{index}].timeout: {e}")
+    for volume in fields.get('volumes', []):
+        if not isinstance(volume, dict) or set(volume) != {'name', 'path'}:
+            raise ValueError(f"steps[{index}].volumes: each volume needs exactly a name and a path")
+    return fields
+
+
+def step_dependencies(steps: Sequence[Dict[str, Any]]) -> List[List[int]]:
+    """Return the indices of the steps each step waits for.
+
+    Raises:
+        ValueError: If ids are duplicated or ``waitFor`` names a step that
+            is not defined before it.
+    """
+    ids: Dict[str, int] = {}
+    dependencies = []
+    for index, step in enumerate(steps):
+        wait_for = step.get('waitFor')
+        if wait_for is None:
+            dependencies.append(list(range(index)))
+        elif list(wait_for) == [START_OF_BUILD]:
+            dependencies.append([])
+        else:
+            waits = []
+            for step_id in wait_for:
+                if step_id not in ids:
+                    raise ValueError(f"steps[{index}].waitFor: '{step_id}' is not the id of an earlier step")
+                waits.append(ids[step_id])
+            dependencies.append(waits)
+
+        step_id = step.get('id')
+        if step_id is not None:
+            if step_id in ids:
+                raise ValueError(f"steps[{index}]: duplicate step id '{step_id}'")
+            ids[step_id] = index
+    return dependencies
+
+
+def longest_chain(steps: Sequence[Dict[str, Any]]) -> StepChain:
+    """Return the longest chain of dependent steps.
+
+    However many steps run concurrently, a build takes at least as long as
+    the steps on this chain take one after another.
+
+    Raises:
+        ValueError: If the dependencies are invalid (see step_dependencies).
+    """
+    dependencies = step_dependencies(steps)
+    # Steps only wait for earlier steps, so index order is a topological order
+    lengths: List[int] = []
+    previous: List[int] = []
+    for waits in dependencies:
+        before = max(waits, key=lambda i: lengths[i], default=-1)
+        lengths.append(lengths[before] + 1 if before >= 0 else 1)
+        previous.append(before)
+
+    chain = []
+    index = max(range(len(steps)), key=lambda i: lengths[i], default=-1)
+    while index >= 0:
+        chain.append(step_label(steps[index], index))
+        index = previous[index]
+    return StepChain(chain[::-1], len(steps))
@@ -0,0 +1,166 @@
+"""Content-addressed on-disk cache of configuration validation results."""
+
+import glob
+import hashlib
+import json
+import os
+import tempfile
+from importlib.metadata import version
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from .validator import ValidationIssue
+
+# Environment variable overriding the default cache location
+CACHE_DIR_ENV = 'LZ_CONFIG_CACHE_DIR'
+
+# Default upper bound on the total size of cached entries
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+_CONFIG_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Sources whose content decides validation results; changing any of them
+# changes the fingerprint and therefore every cache key
+FINGERPRINT_SOURCES = (
+    os.path.join(_CONFIG_DIR, 'lz_schemas', '*.py'),
+    os.path.join(_CONFIG_DIR, 'validator.py'),
+    os.path.join(_CONFIG_DIR, 'cidr.py'),
+)
+
+_fingerprint: Optional[str] = None
+
+
+def schema_fingerprint() -> str:
+    """Return a digest of the schema modules and validation code.
+
+    Computed once per process.
+
+    Returns:
+        Hex digest identifying the current schema set.
+    """
+    global _fingerprint
+    if _fingerprint is None:
+        digest = hashlib.sha256(version('jsonschema').encode())
+        for pattern in FINGERPRINT_SOURCES:
+            for path in sorted(glob.glob(pattern)):
+                digest.update(os.path.basename(path).encode())
+                with open(path, 'rb') as f:
+                    digest.update(f.read())
+        _fingerprint = digest.hexdigest()
+    return _fingerprint
+
+
+def default_cache_dir() -> str:
+    """Return the cache directory from the environment or the user cache."""
+    if os.environ.get(CACHE_DIR_ENV):
+        return os.environ[CACHE_DIR_ENV]
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'lz-config', 'validation')
+
+
+class CachedResult(NamedTuple):
+    """Validation result stored for one file content."""
+
+    issues: List[ValidationIssue]
+    config: Optional[Dict[str, Any]]
+
+
+class ValidationCache:
+    """Size-bounded cache of validation results keyed by file content.
+
+    Keys combine the file bytes with the schema fingerprint, so entries
+    written against older schemas are never hit again and age out through
+    least-recently-used eviction.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.max_bytes = max_bytes
+
+    def key(self, content_hash: str) -> str:
+        """Return the cache key for a configuration file.
+
+        Args:
+            content_hash: SHA-256 hex digest of the file bytes.
+        """
+        return hashlib.sha256(f'{schema_fingerprint()}:{content_hash}'.encode()).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f'{key}.json')
+
+    def get(self, key: str) -> Optional[CachedResult]:
+        """Look up a cached result.
+
+        Args:
+            key: Key returned by ``key()``.
+
+        Returns:
+            The cached result, or None on a miss or unreadable entry.
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, 'r') as f:
+                entry = json.load(f)
+            os.utime(path)  # mark as recently used
+        except (OSError, ValueError):
+            return None
+        return CachedResult([ValidationIssue(*issue) for issue in entry['issues']], entry.get('config'))
+
+    def put(self, key: str, issues: List[ValidationIssue], config: Any = None) -> None:
+        """Store a result, evicting old entries if the cache grows too large.
+
+        The parsed config is only stored when it survives a JSON round trip
+        unchanged, so a hit never returns a config that differs from what
+        parsing the YAML would have produced. Cache write failures are
+        ignored; the cache is purely an optimization.
+
+        Args:
+            key: Key returned by ``key()``.
+            issues: Issues found for the file; empty if it is valid.
+            config: The parsed configuration.
+        """
+        rows = [list(issue) for issue in issues]
+        try:
+            payload = json.dumps({'issues': rows, 'config': config})
+            if json.loads(payload)['config'] != config:
+                raise ValueError('config does not survive a JSON round trip')
+        except (TypeError, ValueError):
+            payload = json.dumps({'issues': rows, 'config': None})
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                f.write(payload)
+            os.replace(tmp_path, self._entry_path(key))
+            self.evict()
+        except OSError:
+            pass
+
+    def evict(self) -> None:
+        """Remove least recently used entries until under ``max_bytes``."""
+        entries = []
+        total = 0
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith('.json'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                    total += stat.st_size
+        if total <= self.max_bytes:
+            return
+        for _, size, path in sorted(entries):
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        for path in glob.glob(os.path.join(self.cache_dir, '*.json')):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
@@ -0,0 +1,189 @@
+"""Semantic checks of the CIDR ranges in a landing zone configuration.
+
+The schemas only check that CIDR strings look right. This module parses
+every range into an integer interval, sorts them once and sweeps them to
+find overlapping ranges in O(n log n), which keeps large configs with many
+subnets fast. Ranges outside private address space are reported as
+warnings only, since GCP VPCs may use public ranges privately.
+"""
+
+import bisect
+import ipaddress
+import re
+from typing import Any, Dict, Iterator, List, NamedTuple, Tuple
+
+# Private address space (RFC 1918 and the RFC 6598 shared address space);
+# IPv4 ranges outside it get a warning. IPv6 ranges are not checked.
+ALLOWED_RANGES = ('10.0.0.0/8', '172.16.0.0/12', '192.168.0.0/16', '100.64.0.0/10')
+
+# Environment blocks of a pbmm-gcp business unit
+BU_ENVIRONMENTS = ('development', 'nonproduction', 'production')
+
+_IPV4_CIDR = re.compile(r'(\d{1,3})\.(\d{1,3})\.(\d{1,3})\.(\d{1,3})/(\d{1,2})')
+
+
+class CidrRange(NamedTuple):
+    """A parsed range and the scope it must not overlap within."""
+
+    scope: Tuple[str, int]
+    start: int
+    end: int
+    cidr: str
+    path: str
+
+
+class CidrIssue(NamedTuple):
+    """A problem found with a CIDR range."""
+
+    path: str
+    rule: str
+    message: str
+
+
+def _items(value: Any) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Yield (index, item) for the dict items of a list, skipping anything else."""
+    if isinstance(value, list):
+        for i, item in enumerate(value):
+            if isinstance(item, dict):
+                yield i, item
+
+
+def _get(value: Any, *keys: str) -> Any:
+    """Follow dict keys, returning None as soon as one is missing."""
+    for key in keys:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def iter_cidrs(config: Dict[str, Any]) -> Iterator[Tuple[str, str, str, bool]]:
+    """Yield (scope, path, value, named_allowed) for every range in a config.
+
+    Ranges in the same scope share an address space and must not overlap.
+    ``named_allowed`` is True for fields that may also hold the name of a
+    secondary range instead of a CIDR.
+    """
+    for i, subnet in _items(_get(config, 'networking', 'base_network', 'subnets')):
+        yield ('networking.base_network', f'$.networking.base_network.subnets[{i}].subnet_ip',
+               subnet.get('subnet_ip'), False)
+
+    for i, network in _items(_get(config, 'fortigate', 'config', 'networks')):
+        yield 'fortigate.networks', f'$.fortigate.config.networks[{i}].cidr', network.get('cidr'), False
+
+    for i, bu in _items(config.get('business_units')):
+        for env in BU_ENVIRONMENTS:
+            for kind in ('base', 'restricted'):
+                ip_ranges = _get(bu, env, kind, 'ip_ranges')
+                if isinstance(ip_ranges, dict):
+                    for name, value in ip_ranges.items():
+                        yield (f'business_units.{env}.{kind}',
+                               f'$.business_units[{i}].{env}.{kind}.ip_ranges.{name}', value, False)
+
+    for i, env in _items(_get(config, 'app_infra', 'environments')):
+        for j, bu in _items(env.get('business_units')):
+            for k, cluster in _items(bu.get('gke_clusters')):
+                network_config = cluster.get('network_config')
+                if not isinstance(network_config, dict):
+                    continue
+                scope = f"gke.{env.get('environment')}.{network_config.get('network')}"
+                for field in ('ip_range_pods', 'ip_range_services'):
+                    path = (f'$.app_infra.environments[{i}].business_units[{j}]'
+                            f'.gke_clusters[{k}].network_config.{field}')
+                    yield scope, path, network_config.get(field), True
+
+
+def parse_cidr(value: str) -> Tuple[int, int, int]:
+    """Parse a CIDR range into an integer interval.
+
+    Well-formed IPv4 ranges are parsed directly, which is several times
+    faster than ``ipaddress``; everything else goes through ``ipaddress``.
+
+    Args:
+        value: CIDR range such as ``10.0.0.0/24``.
+
+    Returns:
+        Tuple of (IP version, first address, last address).
+
+    Raises:
+        ValueError: If the value is not a valid network, e.g. has host bits set.
+    """
+    match = _IPV4_CIDR.fullmatch(value)
+    if match:
+        a, b, c, d, prefix = map(int, match.groups())
+        if a < 256 and b < 256 and c < 256 and d < 256 and prefix <= 32:
+            start = (a << 24) | (b << 16) | (c << 8) | d
+            size = 1 << (32 - prefix)
+            if start & (size - 1) == 0:
+                return 4, start, start + size - 1
+    network = ipaddress.ip_network(value)
+    return network.version, int(network.network_address), int(network.broadcast_address)
+
+
+def _parse(config: Dict[str, Any]) -> Tuple[List[CidrRange], List[CidrIssue]]:
+    """Parse every range in a config into an integer interval."""
+    ranges = []
+    issues = []
+    for scope, path, value, named_allowed in iter_cidrs(config):
+        if not isinstance(value, str) or (named_allowed and '/' not in value):
+            continue
+        try:
+            version, start, end = parse_cidr(value)
+        except ValueError as e:
+            issues.append(CidrIssue(path, 'invalid', f"'{value}' is not a valid CIDR range: {e}"))
+            continue
+        ranges.append(CidrRange((scope, version), start, end, value, path))
+    return ranges, issues
+
+
+def _allowed_intervals() -> Tuple[List[int], List[int]]:
+    """Return the sorted starts and ends of the allowed IPv4 address space."""
+    intervals = sorted(parse_cidr(cidr)[1:] for cidr in ALLOWED_RANGES)
+    return [start for start, _ in intervals], [end for _, end in intervals]
+
+
+def find_cidr_warnings(config: Dict[str, Any]) -> List[CidrIssue]:
+    """Find valid IPv4 ranges outside private address space.
+
+    Args:
+        config: Dictionary containing the configuration.
+
+    Returns:
+        List of 'parent' issues; empty if every IPv4 range is private.
+    """
+    ranges, _ = _parse(config)
+    allowed_starts, allowed_ends = _allowed_intervals()
+    warnings = []
+    for r in ranges:
+        if r.scope[1] != 4:
+            continue
+        i = bisect.bisect_right(allowed_starts, r.start) - 1
+        if i < 0 or r.end > allowed_ends[i]:
+            warnings.append(CidrIssue(r.path, 'parent', f"{r.cidr} is outside private address space "
+                                                        f"({', '.join(ALLOWED_RANGES)})"))
+    return warnings
+
+
+def find_cidr_issues(config: Dict[str, Any]) -> List[CidrIssue]:
+    """Find invalid and overlapping CIDRs in a config.
+
+    Args:
+        config: Dictionary containing the configuration.
+
+    Returns:
+        List of issues; empty if every range is valid and disjoint.
+    """
+    ranges, issues = _parse(config)
+
+    # Sorted by scope then start, every overlap involves the range with the
+    # furthest end seen so far in the same scope
+    ranges.sort(key=lambda r: (r.scope, r.start, -r.end))
+    widest = None
+    for r in ranges:
+        if widest is not None and widest.scope == r.scope and r.start <= widest.end:
+            issues.append(CidrIssue(r.path, 'overlap', f"{r.cidr} overlaps {widest.cidr} at {widest.path}"))
+            if r.end > widest.end:
+                widest = r
+        else:
+            widest = r
+    return issues
@@ -0,0 +1,120 @@
+"""Long-lived Cloud Build clients shared by submission and monitoring."""
+
+import threading
+from collections import Counter
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Endpoint of the global Cloud Build API
+DEFAULT_ENDPOINT = 'cloudbuild.googleapis.com'
+
+# Creates a client for (credentials, endpoint), calling on_rpc with the
+# method name of every RPC the client issues
+ClientFactory = Callable[[Any, str, Callable[[str], None]], Any]
+
+
+def create_grpc_client(credentials: Any, endpoint: str, on_rpc: Callable[[str], None]) -> Any:
+    """Create a CloudBuildClient on its own gRPC channel, counting its RPCs.
+
+    Every RPC on the channel, including the long-running operation polls
+    of ``create_build``, goes through an interceptor that reports it.
+
+    Args:
+        credentials: Google auth credentials, or None for the defaults.
+        endpoint: API endpoint host, optionally with a port.
+        on_rpc: Called with the method name of every RPC.
+    """
+    import grpc
+    from google.cloud.devtools import cloudbuild_v1
+    from google.cloud.devtools.cloudbuild_v1.services.cloud_build.transports import CloudBuildGrpcTransport
+
+    class RpcCounter(grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamClientInterceptor):
+        def intercept_unary_unary(self, continuation, client_call_details, request):
+            on_rpc(client_call_details.method.rsplit('/', 1)[-1])
+            return continuation(client_call_details, request)
+
+        def intercept_unary_stream(self, continuation, client_call_details, request):
+            on_rpc(client_call_details.method.rsplit('/', 1)[-1])
+            return continuation(client_call_details, request)
+
+    host = endpoint if ':' in endpoint else f'{endpoint}:443'
+    channel = CloudBuildGrpcTransport.create_channel(host, credentials=credentials)
+    transport = CloudBuildGrpcTransport(host=host, channel=grpc.intercept_channel(channel, RpcCounter()))
+    return cloudbuild_v1.CloudBuildClient(transport=transport)
+
+
+class ClientStats:
+    """Connections opened and RPCs issued by the clients of a pool."""
+
+    def __init__(self):
+        self.connections_opened = 0
+        self.rpcs: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def record_rpc(self, method: str) -> None:
+        with self._lock:
+            self.rpcs[method] += 1
+
+    @property
+    def rpc_count(self) -> int:
+        """Total number of RPCs issued."""
+        return sum(self.rpcs.values())
+
+    def describe(self) -> str:
+        """Return a one-line summary such as ``1 connection, 12 RPCs (GetBuild: 11, CreateBuild: 1)``."""
+        summary = (f"{self.connections_opened} connection{'s' if self.connections_opened != 1 else ''}, "
+                   f"{self.rpc_count} RPC{'s' if self.rpc_count != 1 else ''}")
+        if self.rpcs:
+            summary += f" ({', '.join(f'{method}: {count}' for method, count in self.rpcs.most_common())})"
+        return summary
+
+
+class ClientPool:
+    """Cloud Build clients cached per credentials and endpoint.
+
+    The first request for a (credentials, endpoint) pair creates a client,
+    and with it a gRPC channel, authentication and TLS session; later
+    requests get the same client, which is safe to share between threads.
+    Credentials are compared by identity, so callers should reuse the
+    credentials object they were given.
+    """
+
+    def __init__(self, factory: ClientFactory = create_grpc_client):
+        """Create an empty pool.
+
+        Args:
+            factory: Creates a client for (credentials, endpoint, on_rpc).
+        """
+        self.factory = factory
+        self.stats = ClientStats()
+        self._clients: Dict[Tuple[int, str], Tuple[Any, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, credentials: Any = None, endpoint: Optional[str] = None) -> Any:
+        """Return the client for credentials and an endpoint, creating it once.
+
+        Args:
+            credentials: Google auth credentials, or None for the defaults.
+            endpoint: API endpoint host (default: the global endpoint).
+        """
+        key = (id(credentials), endpoint or DEFAULT_ENDPOINT)
+        with self._lock:
+            entry = self._clients.get(key)
+            if entry is None:
+                # The credentials are kept so their id is not reused
+                entry = (self.factory(credentials, key[1], self.stats.record_rpc), credentials)
+                self._clients[key] = entry
+                self.stats.connections_opened += 1
+            return entry[0]
+
+    def close(self) -> None:
+        """Close the channels of every client and empty the pool."""
+        with self._lock:
+            clients, self._clients = list(self._clients.values()), {}
+        for client, _ in clients:
+            transport = getattr(client, 'transport', None)
+            if transport is not None and hasattr(transport, 'close'):
+                transport.close()
+
+
+# Process-wide pool used by the deploy command
+CLIENT_POOL = ClientPool()
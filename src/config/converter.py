@@ -0,0 +1,367 @@
+"""Conversion of landing zone configurations to Terraform variables."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from . import hcl
+from .mapping import project_business_unit, project_section
+from .output import write_if_changed
+from .yaml_loader import load_config
+
+
+# Output formats: native HCL (.tfvars) or JSON (.tfvars.json)
+TFVARS_FORMATS = ('hcl', 'json')
+
+
+class ConversionError(ValueError):
+    """A configuration could not be converted to Terraform variables.
+
+    A ValueError, as conversion errors have always been.
+    """
+
+    def __init__(self, message: str, target: Optional[str] = None):
+        super().__init__(message)
+        self.target = target
+
+
+class LandingZoneTypeError(ConversionError):
+    """The landing zone type is missing or unsupported."""
+
+
+class RenderError(ConversionError):
+    """A value cannot be written in the requested tfvars format."""
+
+
+class ConversionTarget(NamedTuple):
+    """A tfvars file to produce from a configuration."""
+
+    output_file: str
+    common_only: bool = False
+    output_format: str = 'hcl'
+
+
+class ConversionFailure(NamedTuple):
+    """The first conversion task that failed and why."""
+
+    path: str
+    error: Exception
+
+
+class EnvironmentIssue(NamedTuple):
+    """A duplicate, missing or undeclared environment entry."""
+
+    path: str
+    message: str
+
+
+class EnvironmentIndex(NamedTuple):
+    """Per-environment entries of a gcp configuration, keyed by name.
+
+    Where an environment has several entries, the first one is used.
+    """
+
+    names: List[str]
+    projects: Dict[str, Any]
+    app_infra: Dict[str, Dict[str, Any]]
+    issues: List[EnvironmentIssue]
+
+    def environment_tfvars(self, name: str) -> Dict[str, Any]:
+        """Return the variables of an environment's own tfvars file."""
+        return {
+            'environment': name,
+            'projects': self.projects.get(name, []),
+            'app_infra': self.app_infra.get(name, {}),
+        }
+
+
+def _index_section(config: Dict[str, Any], section: str, declared: Dict[str, int],
+                   value: Callable[[Dict[str, Any]], Any], issues: List[EnvironmentIssue]) -> Dict[str, Any]:
+    """Index the ``environments`` list of a section by environment name."""
+    entries: Dict[str, Any] = {}
+    first: Dict[str, int] = {}
+    for i, entry in enumerate(config.get(section, {}).get('environments', [])):
+        path = f'{section}.environments[{i}]'
+        name = entry.get('environment')
+        if name in first:
+            issues.append(EnvironmentIssue(path, f"duplicate entry for environment '{name}', "
+                                                 f"using {section}.environments[{first[name]}]"))
+            continue
+        if name not in declared:
+            issues.append(EnvironmentIssue(path, f"environment '{name}' is not declared in environments"))
+        first[name] = i
+        entries[name] = value(entry)
+
+    issues.extend(EnvironmentIssue(f'{section}.environments', f"no entry for environment '{name}'")
+                  for name in declared if name not in entries)
+    return entries
+
+
+def index_environments(config: Dict[str, Any]) -> EnvironmentIndex:
+    """Index the environments of a gcp configuration by name in one pass.
+
+    Args:
+        config: The parsed configuration; it is not modified.
+
+    Returns:
+        EnvironmentIndex of the declared environment names, in order and
+        without duplicates, their ``projects`` and ``app_infra`` entries,
+        and any duplicate, missing or undeclared entries found.
+    """
+    issues: List[EnvironmentIssue] = []
+    declared: Dict[str, int] = {}
+    for i, env in enumerate(config.get('environments', [])):
+        name = env.get('name')
+        if not name:
+            continue
+        if name in declared:
+            issues.append(EnvironmentIssue(f'environments[{i}]', f"duplicate environment '{name}', "
+                                                                 f"already declared at environments[{declared[name]}]"))
+            continue
+        declared[name] = i
+
+    projects = _index_section(config, 'projects', declared, lambda entry: entry['projects'], issues)
+    app_infra = _index_section(config, 'app_infra', declared, lambda entry: entry, issues)
+    return EnvironmentIndex(list(declared), projects, app_infra, issues)
+
+
+def resolve_landing_zone_type(yaml_data: Dict[str, Any], landing_zone_type: Optional[str] = None) -> str:
+    """Return the landing zone type, with the override taking precedence.
+
+    Raises:
+        LandingZoneTypeError: If neither the override nor the config specifies a type.
+    """
+    lz_type = landing_zone_type or yaml_data.get('landing_zone', {}).get('type')
+    if not lz_type:
+        raise LandingZoneTypeError("Landing zone type not specified in configuration or command line")
+    return lz_type
+
+
+def build_tfvars(yaml_data: Dict[str, Any], common_only: bool = False,
+                 landing_zone_type: Optional[str] = None) -> Dict[str, Any]:
+    """Map a parsed configuration to Terraform variables.
+
+    Args:
+        yaml_data: The parsed configuration; it is not modified.
+        common_only: Whether to extract only common configuration.
+        landing_zone_type: Optional override for landing zone type.
+
+    Returns:
+        Dict of Terraform variable names to values.
+
+    Raises:
+        LandingZoneTypeError: If the landing zone type is missing or unsupported.
+    """
+    lz_type = resolve_landing_zone_type(yaml_data, landing_zone_type)
+
+    # Convert YAML data to Terraform format based on landing zone type
+    tfvars = {}
+
+    # Process common configurations for all landing zone types
+    if 'regions' in yaml_data:
+        tfvars['regions'] = yaml_data['regions']
+
+    if lz_type == "pbmm-gcp":
+        # Process PBMM-specific configurations
+        if 'business_units' in yaml_data:
+            tfvars['business_units'] = [project_business_unit(bu, common_only)
+                                        for bu in yaml_data['business_units']]
+
+    elif lz_type == "gcp":
+        # Process standard GCP configurations
+        if not common_only:
+            # Process projects configuration
+            if 'projects' in yaml_data:
+                tfvars['projects'] = yaml_data['projects']
+
+            # Process networking configuration
+            if 'networking' in yaml_data:
+                tfvars['networking'] = yaml_data['networking']
+
+            # Process app infrastructure
+            if 'app_infra' in yaml_data:
+                tfvars['app_infra'] = yaml_data['app_infra']
+
+        # Process common configurations
+        if 'bootstrap' in yaml_data:
+            tfvars['bootstrap'] = project_section('bootstrap', yaml_data['bootstrap'])
+
+        if 'org' in yaml_data:
+            tfvars['org'] = project_section('org', yaml_data['org'])
+
+    else:
+        raise LandingZoneTypeError(f"Unsupported landing zone type: {lz_type}")
+
+    return tfvars
+
+
+def tfvars_filename(name: str, output_format: str = 'hcl') -> str:
+    """Return the file name Terraform expects for a tfvars file in a format.
+
+    Args:
+        name: File name in HCL format, e.g. ``development.auto.tfvars``.
+        output_format: One of TFVARS_FORMATS.
+    """
+    return f'{name}.json' if output_format == 'json' else name
+
+
+def write_tfvars(tfvars: Dict[str, Any], output_file: str, output_format: str = 'hcl') -> bool:
+    """Write Terraform variables to a .tfvars file.
+
+    The file is replaced atomically, and only if its content changed.
+
+    Args:
+        tfvars: Variable names mapped to values.
+        output_file: Path to the output file.
+        output_format: 'hcl' for native syntax, 'json' for compact JSON.
+
+    Returns:
+        True if the file was written, False if it was already up to date.
+
+    Raises:
+        ConversionError: If the format is unknown.
+        RenderError: If a value cannot be written in the format.
+    """
+    if output_format == 'hcl':
+        writer = hcl.write_tfvars
+    elif output_format == 'json':
+        from . import tfjson
+        writer = tfjson.write_tfvars
+    else:
+        raise ConversionError(f"Unsupported tfvars format: {output_format}")
+    try:
+        return write_if_changed(output_file, lambda f: writer(tfvars, f))
+    except (TypeError, ValueError) as e:
+        raise RenderError(f"Cannot write {output_file}: {e}", output_file) from e
+
+
+def render_tfvars(tfvars: Dict[str, Any], output_format: str = 'hcl') -> Union[str, bytes]:
+    """Render Terraform variables in memory.
+
+    Args:
+        tfvars: Variable names mapped to values.
+        output_format: 'hcl' for native syntax, 'json' for compact JSON.
+
+    Returns:
+        The HCL text as str, or the UTF-8 JSON document as bytes.
+
+    Raises:
+        ConversionError: If the format is unknown.
+        RenderError: If a value cannot be written in the format.
+    """
+    try:
+        if output_format == 'hcl':
+            return hcl.dumps(tfvars)
+        if output_format == 'json':
+            from . import tfjson
+            return tfjson.dumps(tfvars)
+    except (TypeError, ValueError) as e:
+        raise RenderError(str(e)) from e
+    raise ConversionError(f"Unsupported tfvars format: {output_format}")
+
+
+def convert_config(config: Dict[str, Any], targets: Iterable[ConversionTarget],
+                   landing_zone_type: Optional[str] = None) -> Dict[str, Union[str, bytes]]:
+    """Convert a parsed configuration to tfvars content, without touching disk.
+
+    Nothing is printed, and the configuration is not modified, so many
+    configurations can be converted concurrently in one process. The
+    content for each target is the same as ``convert_file`` would write.
+
+    Args:
+        config: The parsed configuration.
+        targets: The tfvars files to render; ``output_file`` only names
+            each result.
+        landing_zone_type: Optional override for landing zone type.
+
+    Returns:
+        Dict mapping each target's output_file to its content: str for
+        the 'hcl' format, UTF-8 bytes for 'json'.
+
+    Raises:
+        LandingZoneTypeError: If the landing zone type is missing or unsupported.
+        RenderError: If a value cannot be written in a target's format.
+        ConversionError: If the configuration is not a mapping of the
+            expected shape or a target's format is unknown.
+    """
+    if not isinstance(config, dict):
+        raise ConversionError(f"Configuration must be a mapping, not {type(config).__name__}")
+
+    results: Dict[str, Union[str, bytes]] = {}
+    for target in targets:
+        try:
+            tfvars = build_tfvars(config, target.common_only, landing_zone_type)
+        except ConversionError:
+            raise
+        except (AttributeError, KeyError, TypeError) as e:
+            raise ConversionError(f"Malformed configuration: {e!r}", target.output_file) from e
+        try:
+            results[target.output_file] = render_tfvars(tfvars, target.output_format)
+        except RenderError as e:
+            raise RenderError(f"Cannot render {target.output_file}: {e}", target.output_file) from e
+    return results
+
+
+def convert_file(yaml_file: str, targets: Iterable[ConversionTarget],
+                 landing_zone_type: Optional[str] = None) -> Dict[str, bool]:
+    """Convert a configuration file to one or more tfvars files.
+
+    The file is parsed once and every target is produced from the same
+    in-memory configuration.
+
+    Args:
+        yaml_file: Path to the YAML configuration file.
+        targets: The tfvars files to write.
+        landing_zone_type: Optional override for landing zone type.
+
+    Returns:
+        Dict mapping each output file to True if it was written, or False
+        if it was left untouched because its content did not change.
+
+    Raises:
+        ValueError: If the YAML is invalid.
+        ConversionError: If the landing zone type is missing or
+            unsupported, or a value cannot be written.
+        FileNotFoundError: If the configuration file is not found.
+    """
+    yaml_data = load_config(yaml_file)
+    return {target.output_file: write_tfvars(build_tfvars(yaml_data, target.common_only, landing_zone_type),
+                                             target.output_file, target.output_format)
+            for target in targets}
+
+
+def run_conversions(tasks: Sequence[Tuple[str, Callable[[], Any]]],
+                    jobs: Optional[int] = None) -> Optional[ConversionFailure]:
+    """Run independent conversion tasks on a bounded pool of threads.
+
+    Each task writes its own files, so the output does not depend on the
+    order in which tasks finish. Threads share the parsed configs in the
+    config store, which processes could not. Once a task fails, tasks that
+    have not started yet are cancelled.
+
+    Args:
+        tasks: (path, callable) pairs; the path identifies the task in errors.
+        jobs: Maximum number of concurrent tasks; defaults to the CPU count.
+
+    Returns:
+        The failure of the earliest task in ``tasks`` order that failed,
+        or None if every task succeeded.
+    """
+    jobs = min(jobs or os.cpu_count() or 1, len(tasks))
+    if jobs <= 1:
+        for path, task in tasks:
+            try:
+                task()
+            except Exception as e:
+                return ConversionFailure(path, e)
+        return None
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = [(path, executor.submit(task)) for path, task in tasks]
+        for path, future in futures:
+            error = future.exception()
+            if error is not None:
+                for _, pending in futures:
+                    pending.cancel()
+                return ConversionFailure(path, error)
+    return None
@@ -0,0 +1,201 @@
+"""Deployment of one configuration to many projects at once.
+
+A matrix file lists deployment targets, each a project ID with overrides
+merged into the base configuration::
+
+    targets:
+      - name: org-a
+        project_id: seed-project-a
+        overrides:
+          bootstrap:
+            org_id: "111111111111"
+      - project_id: seed-project-b
+
+Builds check out the landing zone source and receive the configuration
+only through their substitutions, so only the settings in
+OVERRIDABLE_PATHS can be overridden.
+
+``run_matrix`` submits a build per target and follows it until it
+finishes, with a limit on how many builds run at once and a token bucket
+on submissions.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Sequence
+
+from .monitor import build_state
+from .yaml_loader import load_config
+
+# Outcome of a target whose build could not be submitted or followed
+ERROR_STATUS = 'ERROR'
+
+# Settings passed to a build as substitutions by create_build_request in
+# main.py; overriding anything else would not change the deployment
+OVERRIDABLE_PATHS = (
+    'bootstrap.default_region',
+    'bootstrap.org_id',
+    'bootstrap.billing_account',
+    'bootstrap.groups.required_groups.group_org_admins',
+    'org.parent_folder',
+)
+
+
+class MatrixTarget(NamedTuple):
+    """A project to deploy to and its configuration overrides."""
+
+    name: str
+    project_id: str
+    overrides: Dict[str, Any] = {}
+
+
+class TargetResult(NamedTuple):
+    """How the deployment to one target went.
+
+    Times are seconds since the matrix started; ``submitted`` is None if
+    the build was never submitted.
+    """
+
+    target: MatrixTarget
+    build_id: Optional[str]
+    status: str
+    started: float
+    submitted: Optional[float]
+    finished: float
+    error: Optional[str] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.status == 'SUCCESS'
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Seconds from submission until the build finished."""
+        return None if self.submitted is None else self.finished - self.submitted
+
+
+def _override_paths(overrides: Dict[str, Any], prefix: str = '') -> List[str]:
+    """Return the dotted paths of the values set by overrides."""
+    paths = []
+    for key, value in overrides.items():
+        path = f'{prefix}{key}'
+        if isinstance(value, dict) and value and any(allowed.startswith(f'{path}.') for allowed in OVERRIDABLE_PATHS):
+            paths.extend(_override_paths(value, f'{path}.'))
+        else:
+            paths.append(path)
+    return paths
+
+
+def parse_matrix(matrix: Any) -> List[MatrixTarget]:
+    """Read the targets of a parsed matrix file.
+
+    The file is either a mapping with a ``targets`` list or the list itself.
+    Targets are named after their project unless given a ``name``.
+
+    Raises:
+        ValueError: If the matrix is malformed, names a target twice or
+            overrides a setting that is not in OVERRIDABLE_PATHS.
+    """
+    entries = matrix.get('targets') if isinstance(matrix, dict) else matrix
+    if not isinstance(entries, list) or not entries:
+        raise ValueError("Matrix must be a non-empty list of targets or a mapping with a 'targets' list")
+
+    targets = []
+    names = set()
+    for i, entry in enumerate(entries):
+        if not isinstance(entry, dict):
+            raise ValueError(f"targets[{i}]: must be a mapping")
+        project_id = entry.get('project_id')
+        if not isinstance(project_id, str) or not project_id:
+            raise ValueError(f"targets[{i}]: project_id is required")
+        overrides = entry.get('overrides', {})
+        if not isinstance(overrides, dict):
+            raise ValueError(f"targets[{i}]: overrides must be a mapping")
+        for path in _override_paths(overrides):
+            if path not in OVERRIDABLE_PATHS:
+                raise ValueError(f"targets[{i}].overrides.{path}: cannot be overridden, since builds only "
+                                 f"receive {', '.join(OVERRIDABLE_PATHS)}")
+        name = str(entry.get('name', project_id))
+        if name in names:
+            raise ValueError(f"targets[{i}]: duplicate target name '{name}'")
+        names.add(name)
+        targets.append(MatrixTarget(name, project_id, overrides))
+    return targets
+
+
+def load_matrix(path: str) -> List[MatrixTarget]:
+    """Load the targets of a YAML or JSON matrix file.
+
+    Raises:
+        ValueError: If the file is not valid YAML or the matrix is malformed.
+        FileNotFoundError: If the file does not exist.
+    """
+    return parse_matrix(load_config(path))
+
+
+def merge_overrides(config: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a configuration with overrides merged in.
+
+    Mappings are merged key by key; any other value, including a list,
+    replaces the value in the configuration. Neither argument is modified,
+    and parts of the configuration that are not overridden are shared.
+    """
+    merged = dict(config)
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = merge_overrides(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+async def run_matrix(targets: Sequence[MatrixTarget],
+                     submit: Callable[[MatrixTarget], Awaitable[str]],
+                     watch: Callable[[MatrixTarget, str], Awaitable[Any]],
+                     concurrency: int = 4, limiter: Any = None,
+                     on_submitted: Optional[Callable[[MatrixTarget, str], None]] = None,
+                     on_result: Optional[Callable[[TargetResult], None]] = None,
+                     clock: Callable[[], float] = time.monotonic) -> List[TargetResult]:
+    """Deploy to every target, running at most ``concurrency`` builds at once.
+
+    A target that fails to submit or to be followed does not stop the
+    others; its result has the ERROR_STATUS and the error message.
+
+    Args:
+        targets: The targets, in report order.
+        submit: Submits the build of a target and returns its build ID.
+        watch: Follows a submitted build until it finishes and returns it.
+        concurrency: Maximum number of builds submitted and not yet finished.
+        limiter: Rate limiter, such as a TokenBucket, whose ``acquire``
+            coroutine is awaited before every submission.
+        on_submitted: Called with the target and build ID after submission.
+        on_result: Called with each target's result as it finishes.
+        clock: Returns the current time in seconds.
+
+    Returns:
+        The result of every target, in ``targets`` order.
+    """
+    start = clock()
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def deploy(target: MatrixTarget) -> TargetResult:
+        async with semaphore:
+            started = clock() - start
+            build_id = submitted = None
+            try:
+                if limiter is not None:
+                    await limiter.acquire()
+                build_id = await submit(target)
+                submitted = clock() - start
+                if on_submitted is not None:
+                    on_submitted(target, build_id)
+                status = build_state(await watch(target, build_id))[0]
+                error = None
+            except Exception as e:
+                status, error = ERROR_STATUS, str(e) or type(e).__name__
+            result = TargetResult(target, build_id, status, started, submitted, clock() - start, error)
+        if on_result is not None:
+            on_result(result)
+        return result
+
+    return list(await asyncio.gather(*(deploy(target) for target in targets)))
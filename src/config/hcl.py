@@ -0,0 +1,144 @@
+"""Streaming writer for Terraform variable files in native HCL syntax."""
+
+import io
+import math
+import re
+from typing import IO, Any, Dict, List
+
+# Object keys written without quotes
+_IDENTIFIER = re.compile(r'[A-Za-z_][A-Za-z0-9_-]*')
+
+# Keywords that would not be read back as a literal key if left unquoted
+_KEYWORDS = frozenset(('true', 'false', 'null', 'for', 'in', 'if', 'endfor', 'endif', 'else'))
+
+# Characters that need escaping in a quoted string, plus the start of
+# template interpolations and directives
+_SPECIAL = re.compile(r'["\\\x00-\x1f\x7f]|[$%]\{')
+
+_ESCAPES = {
+    '"': '\\"',
+    '\\': '\\\\',
+    '\n': '\\n',
+    '\r': '\\r',
+    '\t': '\\t',
+    '${': '$${',
+    '%{': '%%{',
+}
+
+# Pieces of output collected before they are written to the stream
+_CHUNK = 4096
+
+
+def _escape(match: 're.Match[str]') -> str:
+    text = match.group()
+    escaped = _ESCAPES.get(text)
+    return escaped if escaped is not None else f'\\u{ord(text):04x}'
+
+
+def quote(value: str) -> str:
+    """Return a string as an HCL quoted string literal.
+
+    Quotes, backslashes and control characters are escaped, and ``${`` and
+    ``%{`` are doubled so that Terraform does not treat them as templates.
+    """
+    if _SPECIAL.search(value) is None:
+        return f'"{value}"'
+    return f'"{_SPECIAL.sub(_escape, value)}"'
+
+
+def _key(key: Any) -> str:
+    key = str(key)
+    if _IDENTIFIER.fullmatch(key) and key not in _KEYWORDS:
+        return key
+    return quote(key)
+
+
+def _scalar(value: Any) -> str:
+    if value is None:
+        return 'null'
+    if value is True:
+        return 'true'
+    if value is False:
+        return 'false'
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        if not math.isfinite(value):
+            raise ValueError(f"Cannot represent {value} in HCL")
+        return repr(value)
+    # Strings, and YAML timestamps, which Terraform has no type for
+    return quote(value if isinstance(value, str) else str(value))
+
+
+class _Emitter:
+    """Appends the HCL text of a value to a buffer flushed in chunks."""
+
+    def __init__(self, stream: IO[str]):
+        self.stream = stream
+        self.parts: List[str] = []
+
+    def flush(self) -> None:
+        self.stream.write(''.join(self.parts))
+        self.parts.clear()
+
+    def value(self, value: Any, indent: str) -> None:
+        parts = self.parts
+        if isinstance(value, dict):
+            if not value:
+                parts.append('{}')
+                return
+            inner = indent + '  '
+            parts.append('{\n')
+            for key, item in value.items():
+                parts.append(f'{inner}{_key(key)} = ')
+                self.value(item, inner)
+                parts.append('\n')
+                if len(parts) >= _CHUNK:
+                    self.flush()
+            parts.append(f'{indent}}}')
+        elif isinstance(value, (list, tuple)):
+            if not value:
+                parts.append('[]')
+                return
+            inner = indent + '  '
+            parts.append('[\n')
+            for item in value:
+                parts.append(inner)
+                self.value(item, inner)
+                parts.append(',\n')
+                if len(parts) >= _CHUNK:
+                    self.flush()
+            parts.append(f'{indent}]')
+        else:
+            parts.append(_scalar(value))
+
+
+def write_tfvars(tfvars: Dict[str, Any], stream: IO[str]) -> None:
+    """Write Terraform variables to a stream as HCL.
+
+    Output is written in chunks as the values are walked, so no complete
+    copy of the file is built in memory.
+
+    Args:
+        tfvars: Variable names mapped to values made of dicts, lists and scalars.
+        stream: Text stream to write to.
+
+    Raises:
+        ValueError: If a variable name is not a valid identifier or a value
+            cannot be represented in HCL.
+    """
+    emitter = _Emitter(stream)
+    for name, value in tfvars.items():
+        if not _IDENTIFIER.fullmatch(name):
+            raise ValueError(f"Invalid Terraform variable name: {name}")
+        emitter.parts.append(f'{name} = ')
+        emitter.value(value, '')
+        emitter.parts.append('\n')
+    emitter.flush()
+
+
+def dumps(tfvars: Dict[str, Any]) -> str:
+    """Return Terraform variables as HCL text."""
+    buffer = io.StringIO()
+    write_tfvars(tfvars, buffer)
+    return buffer.getvalue()
@@ -0,0 +1,143 @@
+"""Manifest of generated files and the inputs they were generated from."""
+
+import glob
+import hashlib
+import json
+import os
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from .output import write_if_changed
+
+# Name of the manifest file kept in the conversion base directory
+MANIFEST_NAME = '.lz-convert-manifest.json'
+
+_SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Sources whose content decides conversion output; changing any of them
+# invalidates every manifest entry
+FINGERPRINT_SOURCES = (
+    os.path.join(_SRC_DIR, 'main.py'),
+    os.path.join(_SRC_DIR, 'config', 'converter.py'),
+    os.path.join(_SRC_DIR, 'config', 'hcl.py'),
+    os.path.join(_SRC_DIR, 'config', 'mapping.py'),
+    os.path.join(_SRC_DIR, 'config', 'tfjson.py'),
+)
+
+_fingerprint: Optional[str] = None
+
+
+def converter_fingerprint() -> str:
+    """Return a digest of the conversion code and JSON encoder in use.
+
+    Computed once per process.
+    """
+    global _fingerprint
+    if _fingerprint is None:
+        from .tfjson import ORJSON_AVAILABLE
+
+        digest = hashlib.sha256(f'orjson={ORJSON_AVAILABLE}'.encode())
+        for pattern in FINGERPRINT_SOURCES:
+            for path in sorted(glob.glob(pattern)):
+                digest.update(os.path.basename(path).encode())
+                with open(path, 'rb') as f:
+                    digest.update(f.read())
+        _fingerprint = digest.hexdigest()
+    return _fingerprint
+
+
+def section_hashes(config: Dict[str, Any], sections: Iterable[str]) -> Dict[str, str]:
+    """Return a content hash of each named top-level section of a config.
+
+    Args:
+        config: The parsed configuration.
+        sections: Top-level keys to hash; missing keys hash as null.
+    """
+    return {section: hashlib.sha256(json.dumps(config.get(section), sort_keys=True, separators=(',', ':'),
+                                               default=str).encode()).hexdigest()
+            for section in sections}
+
+
+def _output_signature(path: str) -> Optional[list]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+class ConversionManifest:
+    """Record of generated outputs and the inputs they depend on.
+
+    Each output maps to the conversion options, the content hash of every
+    source file, the hash of every config section it reads, and the size
+    and mtime it had when it was generated. An output is up to date when
+    it was not modified since and either its source files are unchanged,
+    which needs no parsing, or the sections it reads are unchanged.
+    """
+
+    def __init__(self, base_dir: str):
+        """Load the manifest of a conversion base directory, if any.
+
+        An unreadable manifest, or one written by different conversion
+        code, is treated as empty.
+        """
+        self.path = os.path.join(base_dir, MANIFEST_NAME)
+        self.base_dir = base_dir
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        try:
+            with open(self.path, 'r') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(manifest, dict) and manifest.get('fingerprint') == converter_fingerprint():
+            self.entries = manifest.get('outputs', {})
+
+    def _key(self, output: str) -> str:
+        return os.path.relpath(output, self.base_dir)
+
+    def is_fresh(self, output: str, options: Dict[str, Any], files: Dict[str, str],
+                 sections: Callable[[], Dict[str, str]]) -> bool:
+        """Return whether an output is up to date with its inputs.
+
+        Args:
+            output: Path of the generated file.
+            options: Conversion options the output depends on.
+            files: Content hash of each source file.
+            sections: Returns the hash of each config section the output
+                reads; only called if a source file changed.
+        """
+        entry = self.entries.get(self._key(output))
+        if (entry is None or entry.get('options') != options
+                or entry.get('output') != _output_signature(output)):
+            return False
+        if entry.get('files') == files:
+            return True
+        if entry.get('sections') != sections():
+            return False
+        # Only unrelated parts of the sources changed
+        entry['files'] = files
+        self._dirty = True
+        return True
+
+    def record(self, output: str, options: Dict[str, Any], files: Dict[str, str],
+               sections: Dict[str, str]) -> None:
+        """Record the inputs an output was just generated from."""
+        self.entries[self._key(output)] = {
+            'options': options,
+            'files': files,
+            'sections': sections,
+            'output': _output_signature(output),
+        }
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the manifest if it changed; failures are ignored."""
+        if not self._dirty:
+            return
+        manifest = {'fingerprint': converter_fingerprint(), 'outputs': self.entries}
+        try:
+            write_if_changed(self.path, lambda f: json.dump(manifest, f, indent=2, sort_keys=True))
+        except OSError:
+            pass
+        self._dirty = False
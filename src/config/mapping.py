@@ -0,0 +1,135 @@
+"""Declarative mapping of configuration sections to Terraform variables.
+
+Each output field is declared once in ``FIELDS`` with its section, default
+and type. The fields of a section are compiled into a projection function
+whose body is a single dict literal of ``source.get(name, default)``
+calls, so converting thousands of business units does not loop over the
+field table for every record.
+"""
+
+import ast
+from typing import Any, Callable, Dict, NamedTuple, Sequence
+
+# Business unit environment blocks copied into the full tfvars
+ENVIRONMENT_KEYS = ['development', 'nonproduction', 'production']
+
+
+class Field(NamedTuple):
+    """An output field, copied from the source or set to its default."""
+
+    section: str
+    name: str
+    default: Any
+    type: type
+
+
+FIELDS = (
+    # Business unit settings shared by every environment
+    Field('business_unit', 'business_code', '', str),
+    Field('business_unit', 'business_unit', '', str),
+    Field('business_unit', 'location_kms', 'ca', str),
+    Field('business_unit', 'location_gcs', 'ca', str),
+    Field('business_unit', 'tfc_org_name', '', str),
+    Field('business_unit', 'gcs_bucket_prefix', 'bkt', str),
+    Field('business_unit', 'folder_prefix', 'fldr', str),
+    Field('business_unit', 'primary_contact', 'none@no.ne', str),
+    Field('business_unit', 'secondary_contact', 'none@no.ne', str),
+
+    # Per-environment business unit settings
+    Field('environment', 'env_code', '', str),
+    Field('environment', 'billing_code', 'none', str),
+    Field('environment', 'env_enabled', False, bool),
+    Field('environment', 'windows_activation_enabled', False, bool),
+    Field('environment', 'firewall_logging_enabled', False, bool),
+    Field('environment', 'optional_fw_rules_enabled', False, bool),
+    Field('environment', 'vpc_flow_logs_enabled', False, bool),
+    Field('environment', 'peering_iap_fw_rules_enabled', False, bool),
+    Field('environment', 'key_ring_name', 'simple-keyring', str),
+    Field('environment', 'key_name', 'simple-keyname', str),
+    Field('environment', 'key_rotation_period', '7776000s', str),
+    Field('environment', 'base', {}, dict),
+    Field('environment', 'restricted', {}, dict),
+
+    # gcp landing zone settings
+    Field('bootstrap', 'org_id', '', str),
+    Field('bootstrap', 'billing_account', '', str),
+    Field('bootstrap', 'default_region', '', str),
+    Field('org', 'parent_folder', '', str),
+    Field('org', 'scc_notification_name', '', str),
+)
+
+
+def _default_source(field: Field) -> str:
+    """Return a literal expression that evaluates to a fresh copy of the default."""
+    if not isinstance(field.default, field.type):
+        raise TypeError(f"Default of {field.section}.{field.name} is not a {field.type.__name__}")
+    source = repr(field.default)
+    try:
+        literal = ast.literal_eval(source)
+    except (ValueError, SyntaxError):
+        literal = None
+    if literal != field.default:
+        raise ValueError(f"Default of {field.section}.{field.name} is not a literal")
+    return source
+
+
+def compile_projection(fields: Sequence[Field], name: str = 'project') -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """Compile fields into a function mapping a source dict to an output dict.
+
+    Mutable defaults are written as literals, so every call gets its own copy.
+
+    Args:
+        fields: Output fields, in output order.
+        name: Name of the generated function, shown in tracebacks.
+
+    Returns:
+        Function taking the source dict and returning the projected dict.
+
+    Raises:
+        TypeError: If a default does not match the field type.
+        ValueError: If a default cannot be written as a literal.
+    """
+    lines = [f'def {name}(source):', '    get = source.get', '    return {']
+    lines.extend(f'        {field.name!r}: get({field.name!r}, {_default_source(field)}),' for field in fields)
+    lines.append('    }')
+    namespace: Dict[str, Any] = {}
+    exec(compile('\n'.join(lines), f'<projection {name}>', 'exec'), namespace)
+    return namespace[name]
+
+
+def compile_sections(fields: Sequence[Field]) -> Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]]:
+    """Compile one projection per section, keeping the declared field order."""
+    sections: Dict[str, list] = {}
+    for field in fields:
+        sections.setdefault(field.section, []).append(field)
+    return {section: compile_projection(section_fields, f'project_{section}')
+            for section, section_fields in sections.items()}
+
+
+# Compiled once per process
+PROJECTIONS = compile_sections(FIELDS)
+
+_project_business_unit = PROJECTIONS['business_unit']
+_project_environment = PROJECTIONS['environment']
+
+
+def project_business_unit(bu: Dict[str, Any], common_only: bool = False) -> Dict[str, Any]:
+    """Map a business unit to its Terraform variables.
+
+    Args:
+        bu: The business unit from the configuration; it is not modified.
+        common_only: Whether to leave out the per-environment settings.
+
+    Returns:
+        The business unit settings, plus an ``environments`` map unless
+        ``common_only`` is set.
+    """
+    result = _project_business_unit(bu)
+    if not common_only:
+        result['environments'] = {env: _project_environment(bu[env]) for env in ENVIRONMENT_KEYS if env in bu}
+    return result
+
+
+def project_section(section: str, source: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a configuration section such as ``bootstrap`` to its Terraform variables."""
+    return PROJECTIONS[section](source)
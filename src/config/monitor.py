@@ -0,0 +1,347 @@
+"""Asynchronous monitoring of Cloud Build builds.
+
+Builds are followed either by adaptive polling of ``get_build``
+(BuildMonitor) or by the status messages Cloud Build publishes to the
+``cloud-builds`` Pub/Sub topic (PushBuildMonitor).
+"""
+
+import asyncio
+import inspect
+import json
+import sys
+from types import SimpleNamespace
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+# Build statuses after which a build no longer changes
+TERMINAL_STATUSES = frozenset({'SUCCESS', 'FAILURE', 'INTERNAL_ERROR', 'TIMEOUT', 'CANCELLED', 'EXPIRED'})
+
+# Order of build statuses, to recognise messages delivered out of order
+_STATUS_RANK = {'QUEUED': 0, 'PENDING': 0, 'WORKING': 1}
+
+
+class PollPolicy(NamedTuple):
+    """How often to poll a build.
+
+    After a poll that saw the build or one of its steps change status, the
+    next poll comes ``min_interval`` seconds later. Every poll that sees no
+    change multiplies the interval by ``backoff``, up to ``max_interval``,
+    so a long-running step is polled less and less often.
+    """
+
+    min_interval: float = 1.0
+    max_interval: float = 30.0
+    backoff: float = 1.5
+
+    def next_interval(self, interval: float, changed: bool) -> float:
+        """Return the delay before the next poll."""
+        if changed:
+            return self.min_interval
+        return min(interval * self.backoff, self.max_interval)
+
+
+def _status_name(status: Any) -> str:
+    """Return the name of a Build.Status enum, or QUEUED when unset."""
+    name = getattr(status, 'name', None)
+    return name if name and name != 'STATUS_UNKNOWN' else 'QUEUED'
+
+
+def build_state(build: Any) -> Tuple[str, Tuple[str, ...]]:
+    """Return the status of a build and of each of its steps, by name."""
+    return _status_name(build.status), tuple(_status_name(step.status) for step in build.steps)
+
+
+def _progress(state: Tuple[str, Tuple[str, ...]]) -> Tuple[int, int]:
+    """Return how far a build has come, which never decreases over its life."""
+    return _STATUS_RANK.get(state[0], 2), sum(_STATUS_RANK.get(status, 2) for status in state[1])
+
+
+async def _watch_each(build_ids: Iterable[str], watch: Callable[[str], Awaitable[Any]]) -> Dict[str, Any]:
+    """Run one watch coroutine per build, stopping all of them if one fails."""
+    tasks = {build_id: asyncio.ensure_future(watch(build_id)) for build_id in dict.fromkeys(build_ids)}
+    if not tasks:
+        return {}
+    try:
+        done, _ = await asyncio.wait(tasks.values(), return_when=asyncio.FIRST_EXCEPTION)
+        for task in tasks.values():
+            if task in done and task.exception() is not None:
+                raise task.exception()
+    finally:
+        for task in tasks.values():
+            task.cancel()
+    return {build_id: task.result() for build_id, task in tasks.items()}
+
+
+class BuildMonitor:
+    """Follows Cloud Build builds until they finish, in one event loop.
+
+    Each build is polled on its own schedule (see PollPolicy), so any
+    number of builds can be followed concurrently. Blocking clients such as
+    ``CloudBuildClient`` are called in a worker thread; the ``get_build``
+    coroutine of ``CloudBuildAsyncClient`` is awaited directly.
+    """
+
+    def __init__(self, client: Any, project_id: str, policy: PollPolicy = PollPolicy(),
+                 on_update: Optional[Callable[[str, Any], None]] = None,
+                 sleep: Callable[[float], Awaitable[None]] = asyncio.sleep, limiter: Any = None):
+        """Create a monitor.
+
+        Args:
+            client: Cloud Build client with a ``get_build(project_id, id)``
+                method, blocking or async.
+            project_id: Project the builds run in.
+            policy: Polling intervals.
+            on_update: Called with the build ID and build whenever the
+                status of the build or of one of its steps changes,
+                including on the first poll.
+            sleep: Coroutine function that waits for a number of seconds.
+            limiter: Rate limiter, such as a TokenBucket, whose ``acquire``
+                coroutine is awaited before every API call.
+        """
+        self.client = client
+        self.project_id = project_id
+        self.policy = policy
+        self.on_update = on_update
+        self.sleep = sleep
+        self.limiter = limiter
+        self.polls = 0
+
+    async def get_build(self, build_id: str, project_id: Optional[str] = None) -> Any:
+        """Fetch the current state of a build without blocking the event loop.
+
+        Args:
+            build_id: ID of the build.
+            project_id: Project the build runs in (default: the monitor's).
+        """
+        if self.limiter is not None:
+            await self.limiter.acquire()
+        self.polls += 1
+        project_id = project_id or self.project_id
+        if inspect.iscoroutinefunction(self.client.get_build):
+            return await self.client.get_build(project_id=project_id, id=build_id)
+        return await asyncio.to_thread(self.client.get_build, project_id=project_id, id=build_id)
+
+    async def watch(self, build_id: str, project_id: Optional[str] = None) -> Any:
+        """Poll a build until it reaches a terminal status.
+
+        Args:
+            build_id: ID of the build.
+            project_id: Project the build runs in (default: the monitor's).
+
+        Returns:
+            The finished build.
+        """
+        state = None
+        interval = self.policy.min_interval
+        while True:
+            build = await self.get_build(build_id, project_id)
+            previous, state = state, build_state(build)
+            changed = state != previous
+            if changed and self.on_update is not None:
+                self.on_update(build_id, build)
+            if state[0] in TERMINAL_STATUSES:
+                return build
+            interval = self.policy.next_interval(interval, changed)
+            await self.sleep(interval)
+
+    async def watch_all(self, build_ids: Iterable[str]) -> Dict[str, Any]:
+        """Poll several builds concurrently until all of them finish.
+
+        If polling a build fails, the other builds stop being polled and
+        the error is raised.
+
+        Args:
+            build_ids: IDs of the builds.
+
+        Returns:
+            Dict mapping each build ID to its finished build, in the given order.
+        """
+        return await _watch_each(build_ids, self.watch)
+
+
+def decode_build_message(data: bytes) -> Any:
+    """Decode the JSON build in a ``cloud-builds`` message.
+
+    Returns:
+        An object with the ``id``, ``status.name`` and
+        ``steps[].status.name`` attributes monitors read; the decoded JSON
+        is kept as ``resource``.
+    """
+    resource = json.loads(data)
+    return SimpleNamespace(
+        id=resource.get('id'),
+        status=SimpleNamespace(name=resource.get('status', 'STATUS_UNKNOWN')),
+        steps=[SimpleNamespace(name=step.get('name', ''), status=SimpleNamespace(name=step.get('status', 'STATUS_UNKNOWN')))
+               for step in resource.get('steps', [])],
+        resource=resource,
+    )
+
+
+class PushBuildMonitor:
+    """Follows builds through the status messages Cloud Build publishes.
+
+    Cloud Build publishes the build to the ``cloud-builds`` topic whenever
+    its status changes. Each build is fetched once when monitoring starts,
+    and after that only when no message arrived for ``heartbeat`` seconds,
+    in case a message was lost. Messages for other builds are acknowledged
+    and ignored, so the subscription should be dedicated to this tool.
+    Pub/Sub does not guarantee ordering; a message that would move a build
+    or its steps back to an earlier status is ignored.
+
+    Concurrent ``watch`` calls share one streaming pull, opened by the first
+    and closed when the last one returns, and every message is routed to
+    the calls watching its build. Pub/Sub spreads the messages of a
+    subscription over its pulls, so all builds reporting to a subscription
+    must be followed by the same monitor.
+    """
+
+    def __init__(self, subscriber: Any, subscription: str, client: Any, project_id: str,
+                 on_update: Optional[Callable[[str, Any], None]] = None, heartbeat: float = 60.0,
+                 decode: Callable[[bytes], Any] = decode_build_message, limiter: Any = None):
+        """Create a monitor.
+
+        Args:
+            subscriber: Pub/Sub subscriber client with a
+                ``subscribe(subscription, callback)`` method returning a
+                future that stops the subscription when cancelled.
+            subscription: Path of a subscription to the ``cloud-builds`` topic.
+            client: Cloud Build client, used for the initial and heartbeat fetches.
+            project_id: Project the builds run in.
+            on_update: Called with the build ID and build whenever the
+                status of the build or of one of its steps changes,
+                including when monitoring starts.
+            heartbeat: Seconds without a message after which a build is
+                fetched.
+            decode: Turns message data into a build.
+            limiter: Rate limiter for the Cloud Build API calls.
+        """
+        self.subscriber = subscriber
+        self.subscription = subscription
+        self.poller = BuildMonitor(client, project_id, limiter=limiter)
+        self.on_update = on_update
+        self.heartbeat = heartbeat
+        self.decode = decode
+        self.messages = 0
+        self._queues: Dict[str, List['asyncio.Queue[bytes]']] = {}
+        self._future: Any = None
+
+    @property
+    def polls(self) -> int:
+        """Number of builds fetched from the Cloud Build API."""
+        return self.poller.polls
+
+    async def _watch(self, build_id: str, queue: 'asyncio.Queue[bytes]', project_id: Optional[str]) -> Any:
+        build = await self.poller.get_build(build_id, project_id)
+        state = build_state(build)
+        if self.on_update is not None:
+            self.on_update(build_id, build)
+        while state[0] not in TERMINAL_STATUSES:
+            try:
+                candidate = self.decode(await asyncio.wait_for(queue.get(), self.heartbeat))
+                self.messages += 1
+            except asyncio.TimeoutError:
+                candidate = await self.poller.get_build(build_id, project_id)
+            candidate_state = build_state(candidate)
+            if _progress(candidate_state) < _progress(state):
+                continue
+            previous, state, build = state, candidate_state, candidate
+            if state != previous and self.on_update is not None:
+                self.on_update(build_id, build)
+        return build
+
+    def _subscribe(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        def callback(message):
+            # Runs on the subscriber's threads
+            message.ack()
+            for queue in tuple(self._queues.get(message.attributes.get('buildId'), ())):
+                loop.call_soon_threadsafe(queue.put_nowait, message.data)
+
+        self._future = self.subscriber.subscribe(self.subscription, callback)
+
+    async def watch(self, build_id: str, project_id: Optional[str] = None) -> Any:
+        """Follow a build until it reaches a terminal status and return it.
+
+        Args:
+            build_id: ID of the build.
+            project_id: Project the build runs in (default: the monitor's).
+        """
+        queue: 'asyncio.Queue[bytes]' = asyncio.Queue()
+        self._queues.setdefault(build_id, []).append(queue)
+        if self._future is None:
+            self._subscribe()
+        try:
+            return await self._watch(build_id, queue, project_id)
+        finally:
+            self._queues[build_id].remove(queue)
+            if not self._queues[build_id]:
+                del self._queues[build_id]
+            if not self._queues:
+                self._future.cancel()
+                self._future = None
+
+    async def watch_all(self, build_ids: Iterable[str]) -> Dict[str, Any]:
+        """Follow several builds through one subscription until all finish.
+
+        Args:
+            build_ids: IDs of the builds.
+
+        Returns:
+            Dict mapping each build ID to its finished build, in the given order.
+        """
+        return await _watch_each(build_ids, self.watch)
+
+
+def subscription_path(project_id: str, subscription: str) -> str:
+    """Return the full path of a subscription given by name or path."""
+    if '/' in subscription:
+        return subscription
+    return f'projects/{project_id}/subscriptions/{subscription}'
+
+
+def create_monitor(client: Any, project_id: str, subscription: Optional[str] = None,
+                   on_update: Optional[Callable[[str, Any], None]] = None, subscriber: Any = None,
+                   **options: Any) -> Union[BuildMonitor, PushBuildMonitor]:
+    """Return a push monitor if a subscription is configured, else a polling one.
+
+    Falls back to polling, with a warning, when the Pub/Sub client library
+    is not installed.
+
+    Args:
+        client: Cloud Build client.
+        project_id: Project the builds run in.
+        subscription: Name or path of a subscription to the ``cloud-builds``
+            topic; None to poll.
+        on_update: Called with the build ID and build on every status change.
+        subscriber: Pub/Sub subscriber client (default: a new SubscriberClient).
+        **options: Passed on to the monitor, e.g. ``decode``, ``policy`` or ``limiter``.
+    """
+    if subscription is not None and subscriber is None:
+        try:
+            from google.cloud import pubsub_v1
+        except ImportError:
+            print("⚠️  google-cloud-pubsub is not installed; polling for build status instead",
+                  file=sys.stderr)
+            subscription = None
+        else:
+            subscriber = pubsub_v1.SubscriberClient()
+    if subscription is None:
+        options.pop('decode', None)
+        options.pop('heartbeat', None)
+        return BuildMonitor(client, project_id, on_update=on_update, **options)
+    options.pop('policy', None)
+    return PushBuildMonitor(subscriber, subscription_path(project_id, subscription), client, project_id,
+                            on_update, **options)
+
+
+def monitor_builds(monitor: Union[BuildMonitor, PushBuildMonitor], build_ids: Iterable[str]) -> Dict[str, Any]:
+    """Follow builds until they finish, from synchronous code.
+
+    Args:
+        monitor: The polling or push monitor to follow them with.
+        build_ids: IDs of the builds.
+
+    Returns:
+        Dict mapping each build ID to its finished build.
+    """
+    return asyncio.run(monitor.watch_all(build_ids))
@@ -0,0 +1,85 @@
+"""Atomic writes of generated files that leave unchanged files untouched."""
+
+import hashlib
+import os
+import tempfile
+from typing import IO, Any, Callable, Optional, Union
+
+# Permissions of newly created files, as open() would create them
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_DEFAULT_MODE = 0o666 & ~_UMASK
+
+_READ_SIZE = 1024 * 1024
+
+
+class _HashingWriter:
+    """Stream that hashes and writes text (as UTF-8) or bytes to a binary file."""
+
+    def __init__(self, raw: IO[bytes]):
+        self.raw = raw
+        self.digest = hashlib.sha256()
+        self.size = 0
+
+    def write(self, text: Union[str, bytes]) -> int:
+        data = text.encode('utf-8') if isinstance(text, str) else text
+        self.digest.update(data)
+        self.size += len(data)
+        self.raw.write(data)
+        return len(text)
+
+
+def file_digest(path: str) -> Optional[str]:
+    """Return the SHA-256 hex digest of a file, or None if it does not exist."""
+    digest = hashlib.sha256()
+    try:
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(_READ_SIZE), b''):
+                digest.update(block)
+    except FileNotFoundError:
+        return None
+    return digest.hexdigest()
+
+
+def write_if_changed(path: str, render: Callable[[Any], None]) -> bool:
+    """Write a generated file only if its content changed.
+
+    The content is streamed to a temporary file next to ``path`` while it
+    is hashed. If the hash matches the existing file, the temporary file is
+    discarded and the existing file, including its mtime, is left as is;
+    otherwise the temporary file atomically replaces it, so readers never
+    see a partially written file.
+
+    Args:
+        path: Path of the file to write.
+        render: Writes the content to the stream it is given, which accepts
+            both str (encoded as UTF-8) and bytes.
+
+    Returns:
+        True if the file was written, False if it was already up to date.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f'.{os.path.basename(path)}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            writer = _HashingWriter(f)
+            render(writer)
+
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            stat = None
+        if (stat is not None and stat.st_size == writer.size
+                and file_digest(path) == writer.digest.hexdigest()):
+            os.remove(tmp_path)
+            return False
+
+        os.chmod(tmp_path, stat.st_mode & 0o7777 if stat is not None else _DEFAULT_MODE)
+        os.replace(tmp_path, path)
+        return True
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,64 @@
+"""Token-bucket rate limiting of API calls made from asyncio code."""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Optional
+
+
+class TokenBucket:
+    """Limits calls to ``rate`` per second on average, in bursts of up to ``capacity``.
+
+    The bucket starts full. Callers wait in ``acquire`` in the order they
+    arrived, so a burst of callers is spread out rather than retried.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], Awaitable[None]] = asyncio.sleep):
+        """Create a full bucket.
+
+        Args:
+            rate: Tokens added per second.
+            capacity: Maximum number of tokens (default: ``rate``, at least 1).
+            clock: Returns the current time in seconds.
+            sleep: Coroutine function that waits for a number of seconds.
+
+        Raises:
+            ValueError: If the rate or capacity is not positive.
+        """
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive, got {rate}")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        if self.capacity <= 0:
+            raise ValueError(f"Capacity must be positive, got {self.capacity}")
+        self.clock = clock
+        self.sleep = sleep
+        self.tokens = self.capacity
+        self.updated = clock()
+        self.waited = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """Wait until ``tokens`` are available and take them.
+
+        Raises:
+            ValueError: If more tokens are requested than the bucket holds.
+        """
+        if tokens > self.capacity:
+            raise ValueError(f"Cannot acquire {tokens} tokens from a bucket of {self.capacity}")
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            self._refill()
+            while self.tokens < tokens:
+                delay = (tokens - self.tokens) / self.rate
+                self.waited += delay
+                await self.sleep(delay)
+                self._refill()
+            self.tokens -= tokens
@@ -0,0 +1,65 @@
+"""Compact JSON encoding of Terraform variables for ``*.tfvars.json`` files."""
+
+import json
+import math
+from typing import IO, Any, Dict
+
+try:
+    import orjson
+except ImportError:  # optional; install the 'fast' extra
+    orjson = None
+
+# True when encoding goes through orjson
+ORJSON_AVAILABLE = orjson is not None
+
+
+def _check_finite(value: Any) -> None:
+    """Raise like ``json.dumps(allow_nan=False)`` for NaN and infinities.
+
+    orjson writes them as ``null``, which would turn them into a different
+    Terraform value depending on whether orjson is installed.
+    """
+    if isinstance(value, float):
+        if not math.isfinite(value):
+            raise ValueError(f"Out of range float values are not JSON compliant: {value!r}")
+    elif isinstance(value, dict):
+        for item in value.values():
+            _check_finite(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _check_finite(item)
+
+
+def dumps(tfvars: Dict[str, Any]) -> bytes:
+    """Encode Terraform variables as compact UTF-8 JSON.
+
+    Uses orjson when available and the standard library otherwise; both
+    produce the same bytes. Values JSON has no type for, such as YAML
+    timestamps, are written as strings, and integers beyond 64 bits, which
+    orjson cannot encode, go through the standard library.
+
+    Args:
+        tfvars: Variable names mapped to values.
+
+    Returns:
+        The encoded JSON document.
+
+    Raises:
+        TypeError: If a value cannot be encoded.
+        ValueError: If a value is a non-finite float.
+    """
+    if orjson is not None:
+        _check_finite(tfvars)
+        try:
+            # Datetimes go through default=str, as with the standard library
+            return orjson.dumps(tfvars, default=str,
+                                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME)
+        except TypeError:
+            pass
+    return json.dumps(tfvars, separators=(',', ':'), ensure_ascii=False, allow_nan=False,
+                      default=str).encode('utf-8')
+
+
+def write_tfvars(tfvars: Dict[str, Any], stream: IO[bytes]) -> None:
+    """Write Terraform variables to a binary stream as compact JSON."""
+    stream.write(dumps(tfvars))
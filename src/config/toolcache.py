@@ -0,0 +1,161 @@
+"""Caching of the Terraform binary and provider plugins between deploy builds.
+
+Every deploy build installs Terraform and every ``terraform init`` downloads
+its providers. With a tool cache, two steps are added to the build:
+
+- ``restore-tool-cache`` runs once the source is checked out. It restores
+  the Terraform binary of the configured version, downloading and caching
+  it on a miss, and unpacks the providers cached for the lock files.
+- ``save-tool-cache`` runs last and archives the providers that
+  ``terraform init`` put in ``TF_PLUGIN_CACHE_DIR``, unless they are
+  exactly the ones restored from the cache.
+
+Providers are keyed by what determines them before ``terraform init``
+runs: the ``.terraform.lock.hcl`` files in the source, if any, and the
+``source`` and ``version`` lines of its ``.tf`` files, which include the
+``required_providers`` constraints. Changing a constraint or a lock file
+starts a new cache entry. Init generates lock files, but the key is
+computed before it runs.
+
+The cache is a ``gs://bucket/prefix`` location, or a local directory when
+the scripts are run outside Cloud Build. Both steps may fail without
+failing the build, in which case the deployment installs Terraform itself.
+"""
+
+from typing import Any, Dict, List, NamedTuple, Sequence
+
+# Terraform version installed by the landing zone builds
+TERRAFORM_VERSION = '1.6.0'
+
+# Step that checks out the landing zone source in both cloudbuild.yaml files
+SOURCE_STEP = 'check-out-source'
+RESTORE_STEP = 'restore-tool-cache'
+SAVE_STEP = 'save-tool-cache'
+
+# Under /workspace, which is shared by the steps of a build
+TOOLS_DIR = '/workspace/.tools/bin'
+PLUGIN_CACHE_DIR = '/workspace/.terraform.d/plugin-cache'
+
+CACHE_IMAGE = 'gcr.io/cloud-builders/gcloud'
+
+# Shell functions shared by both scripts. fetch fails if the source is not
+# in the cache; store writes to the cache.
+_COPY_FUNCTIONS = r'''set -euo pipefail
+fetch() {
+  case "$1" in
+    gs://*) gcloud storage cp --quiet "$1" "$2" 2>/dev/null ;;
+    *) [ -f "$1" ] && cp "$1" "$2" ;;
+  esac
+}
+store() {
+  case "$2" in
+    gs://*) gcloud storage cp --quiet "$1" "$2" ;;
+    *) mkdir -p "$(dirname "$2")" && cp "$1" "$2" ;;
+  esac
+}
+tmp=$(mktemp -d)
+'''
+
+RESTORE_SCRIPT = _COPY_FUNCTIONS + r'''mkdir -p "$TOOLS_DIR" "$TF_PLUGIN_CACHE_DIR"
+
+binary="$TOOL_CACHE/terraform/$TERRAFORM_VERSION/terraform"
+if fetch "$binary" "$tmp/terraform"; then
+  echo "Restored Terraform $TERRAFORM_VERSION from the tool cache"
+else
+  url="${TERRAFORM_URL:-https://releases.hashicorp.com/terraform/$TERRAFORM_VERSION/terraform_${TERRAFORM_VERSION}_linux_amd64.zip}"
+  curl -fsSL -o "$tmp/terraform.zip" "$url"
+  python3 -m zipfile -e "$tmp/terraform.zip" "$tmp"
+  store "$tmp/terraform" "$binary" || echo "Could not save Terraform $TERRAFORM_VERSION to the tool cache"
+  echo "Downloaded Terraform $TERRAFORM_VERSION"
+fi
+chmod +x "$tmp/terraform"
+mv "$tmp/terraform" "$TOOLS_DIR/terraform"
+
+sources() { find . -name "$1" -not -path '*/.terraform/*' -not -path '*/.terraform.d/*' | LC_ALL=C sort; }
+key=$( {
+  sources .terraform.lock.hcl | xargs -r sha256sum
+  sources '*.tf' | xargs -r grep -hE '^[[:space:]]*(source|version)[[:space:]]*=' | tr -d ' \t' | LC_ALL=C sort -u || true
+} | sha256sum | cut -c1-16)
+echo "$key" > "$TF_PLUGIN_CACHE_DIR.key"
+if fetch "$TOOL_CACHE/providers/$key.tar.gz" "$tmp/providers.tar.gz"; then
+  tar -xzf "$tmp/providers.tar.gz" -C "$TF_PLUGIN_CACHE_DIR"
+  echo "Restored providers for key $key"
+else
+  echo "No providers cached for key $key"
+fi
+# What was restored, so the save step can tell whether init added providers
+(cd "$TF_PLUGIN_CACHE_DIR" && find . -type f | LC_ALL=C sort) > "$TF_PLUGIN_CACHE_DIR.restored"
+'''
+
+SAVE_SCRIPT = _COPY_FUNCTIONS + r'''key=$(cat "$TF_PLUGIN_CACHE_DIR.key")
+(cd "$TF_PLUGIN_CACHE_DIR" && find . -type f | LC_ALL=C sort) > "$tmp/providers.list"
+if [ ! -s "$tmp/providers.list" ]; then
+  echo "No providers to cache"
+elif cmp -s "$tmp/providers.list" "$TF_PLUGIN_CACHE_DIR.restored"; then
+  echo "Providers for key $key are already cached"
+else
+  tar -czf "$tmp/providers.tar.gz" -C "$TF_PLUGIN_CACHE_DIR" .
+  store "$tmp/providers.tar.gz" "$TOOL_CACHE/providers/$key.tar.gz"
+  echo "Saved providers for key $key"
+fi
+'''
+
+
+class ToolCache(NamedTuple):
+    """Where Terraform and its providers are kept between builds."""
+
+    location: str
+    terraform_version: str = TERRAFORM_VERSION
+
+    def env(self) -> List[str]:
+        """Return the environment shared by the cache steps and the deployment."""
+        return [
+            f"TOOL_CACHE={self.location.rstrip('/')}",
+            f"TERRAFORM_VERSION={self.terraform_version}",
+            f"TOOLS_DIR={TOOLS_DIR}",
+            f"TF_PLUGIN_CACHE_DIR={PLUGIN_CACHE_DIR}",
+        ]
+
+
+def escape_substitutions(script: str) -> str:
+    """Escape ``$`` so Cloud Build passes shell variables through unchanged."""
+    return script.replace('$', '$$')
+
+
+def _cache_step(step_id: str, script: str, cache: ToolCache) -> Dict[str, Any]:
+    return {
+        'name': CACHE_IMAGE,
+        'id': step_id,
+        'entrypoint': 'bash',
+        'args': ['-c', escape_substitutions(script)],
+        'env': cache.env(),
+        'allowFailure': True,
+    }
+
+
+def add_cache_steps(steps: Sequence[Dict[str, Any]], cache: ToolCache,
+                    after: str = SOURCE_STEP) -> List[Dict[str, Any]]:
+    """Return cloudbuild.yaml steps with the tool cache restored and saved.
+
+    The restore step is inserted after the step with id ``after`` and waits
+    for it. Steps after it get the cache environment, and those that wait
+    for ``after`` explicitly also wait for the restore. The save step is
+    appended and waits for every step. ``steps`` is not modified.
+
+    Raises:
+        ValueError: If no step has the id ``after``.
+    """
+    ids = [step.get('id') for step in steps]
+    if after not in ids:
+        raise ValueError(f"Cannot add the tool cache: no step has the id '{after}'")
+    position = ids.index(after) + 1
+
+    restored = []
+    for step in steps[position:]:
+        step = dict(step, env=list(step.get('env', [])) + cache.env())
+        if after in step.get('waitFor', []):
+            step['waitFor'] = list(step['waitFor']) + [RESTORE_STEP]
+        restored.append(step)
+
+    restore = dict(_cache_step(RESTORE_STEP, RESTORE_SCRIPT, cache), waitFor=[after])
+    return list(steps[:position]) + [restore] + restored + [_cache_step(SAVE_STEP, SAVE_SCRIPT, cache)]
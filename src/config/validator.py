@@ -1,9 +1,12 @@
 """Validator for the landing zone configuration YAML."""
 
-import yaml
-from jsonschema import validate, ValidationError
-from typing import Dict, Any
+from jsonschema import ValidationError
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
+from typing import Dict, Any, List, NamedTuple, Optional
 
+from .cidr import find_cidr_issues, find_cidr_warnings
+from .yaml_loader import CONFIG_STORE, ConfigStore, LoadedConfig, load_config
 from .lz_schemas.base import BASE_SCHEMA
 from .lz_schemas.pbmm_gcp import SCHEMA as PBMM_GCP_SCHEMA
 from .lz_schemas.gcp import SCHEMA as GCP_SCHEMA
@@ -14,9 +17,116 @@ LANDING_ZONE_SCHEMAS = {
     "gcp": GCP_SCHEMA
 }
 
+# Registry key under which the base schema is compiled
+BASE_SCHEMA_NAME = "base"
+
+# Schema name reported for issues found by the CIDR semantic stage
+CIDR_CHECK_NAME = "cidr"
+
+
+class ValidationIssue(NamedTuple):
+    """A single violation found while validating a configuration."""
+
+    path: str
+    schema_path: str
+    message: str
+    schema: Optional[str] = None
+
+    @classmethod
+    def from_error(cls, error: ValidationError, schema: str) -> "ValidationIssue":
+        """Build an issue from a jsonschema error.
+
+        Args:
+            error: The error reported by the validator.
+            schema: Registry key of the schema that reported it.
+
+        Returns:
+            ValidationIssue with a JSON path such as ``$.bootstrap.org_id``.
+        """
+        schema_path = "/".join(str(p) for p in error.absolute_schema_path)
+        return cls(error.json_path, schema_path, error.message, schema)
+
+    def describe(self) -> str:
+        """Return a user-friendly, single line description of the issue."""
+        return f"Validation error in {self.path}: {self.message}"
+
+
+class SchemaRegistry:
+    """Process-wide cache of compiled schema validators.
+
+    Checking a schema against its metaschema and building a validator is
+    far more expensive than validating a typical config, so each schema is
+    compiled once on first use and the validator is reused afterwards.
+    """
+
+    def __init__(self, schemas: Dict[str, Dict[str, Any]]):
+        self._schemas = schemas
+        self._validators: Dict[str, Any] = {}
+
+    def get(self, name: str) -> Any:
+        """Return the compiled validator for a schema.
+
+        Args:
+            name: Registry key of the schema.
+
+        Returns:
+            A jsonschema validator instance bound to the schema.
+
+        Raises:
+            KeyError: If no schema is registered under the name.
+        """
+        validator = self._validators.get(name)
+        if validator is None:
+            schema = self._schemas[name]
+            cls = validator_for(schema)
+            cls.check_schema(schema)
+            validator = self._validators[name] = cls(schema)
+        return validator
+
+    def preload(self) -> None:
+        """Compile every registered schema up front."""
+        for name in self._schemas:
+            self.get(name)
+
+
+# Shared by every ConfigValidator in the process
+SCHEMA_REGISTRY = SchemaRegistry({BASE_SCHEMA_NAME: BASE_SCHEMA, **LANDING_ZONE_SCHEMAS})
+
+
 class ConfigValidator:
     """Validator for the landing zone configuration."""
 
+    def __init__(self, registry: Optional[SchemaRegistry] = None, cache: Optional[Any] = None,
+                 store: Optional[ConfigStore] = None):
+        """Initialize the validator.
+
+        Args:
+            registry: Schema registry to use; defaults to the process-wide one.
+            cache: Optional ValidationCache consulted by validate_file and
+                check_file before parsing and validating a file.
+            store: Store that files are loaded through; defaults to the
+                process-wide one so later readers reuse the parsed config.
+        """
+        self.registry = registry or SCHEMA_REGISTRY
+        self.cache = cache
+        self.store = store or CONFIG_STORE
+
+    def _lookup(self, loaded: LoadedConfig):
+        """Return the cache key and cached result for a loaded file."""
+        if self.cache is None:
+            return None, None
+        key = self.cache.key(loaded.content_hash)
+        cached = self.cache.get(key)
+        if cached is not None and cached.config is not None and not loaded.parsed:
+            loaded.set_data(cached.config)
+        return key, cached
+
+    def _check(self, name: str, config: Dict[str, Any]) -> None:
+        """Raise the most relevant error of a config against one schema."""
+        error = best_match(self.registry.get(name).iter_errors(config))
+        if error is not None:
+            raise error
+
     @staticmethod
     def load_yaml(config_path: str) -> Dict[str, Any]:
         """Load YAML configuration from file.
@@ -28,16 +138,10 @@ class ConfigValidator:
             Dict containing the configuration.
 
         Raises:
-            yaml.YAMLError: If the YAML file is invalid.
+            ValueError: If the YAML file is invalid.
             FileNotFoundError: If the configuration file is not found.
         """
-        try:
-            with open(config_path, 'r') as f:
-                return yaml.safe_load(f)
-        except yaml.YAMLError as e:
-            raise ValueError(f"Invalid YAML file: {str(e)}")
-        except FileNotFoundError:
-            raise FileNotFoundError(f"Configuration file not found: {config_path}")
+        return load_config(config_path)
 
     def validate_config(self, config: Dict[str, Any]) -> None:
         """Validate the configuration against the schema.
@@ -50,7 +154,7 @@ class ConfigValidator:
         """
         try:
             # First validate against base schema
-            validate(instance=config, schema=BASE_SCHEMA)
+            self._check(BASE_SCHEMA_NAME, config)
             
             # Get the landing zone type
             lz_type = config["landing_zone"]["type"]
@@ -60,7 +164,7 @@ class ConfigValidator:
                 raise ValidationError(f"Unsupported landing zone type: {lz_type}")
             
             # Validate against the specific landing zone schema
-            validate(instance=config, schema=LANDING_ZONE_SCHEMAS[lz_type])
+            self._check(lz_type, config)
             
         except ValidationError as e:
             # Create a more user-friendly error message
@@ -68,6 +172,68 @@ class ConfigValidator:
             message = f"Validation error in {path}: {e.message}"
             raise ValidationError(message)
 
+        # Semantic checks need a structurally valid config
+        issues = self.find_semantic_errors(config)
+        if issues:
+            raise ValidationError(issues[0].describe())
+
+    def find_semantic_errors(self, config: Dict[str, Any]) -> List[ValidationIssue]:
+        """Collect the violations the schemas cannot express.
+
+        Currently checks that CIDR ranges are well formed and do not overlap
+        within the same address space.
+
+        Args:
+            config: Dictionary containing the configuration.
+
+        Returns:
+            List of issues; empty if none were found.
+        """
+        if not isinstance(config, dict):
+            return []
+        return [ValidationIssue(issue.path, f"{CIDR_CHECK_NAME}/{issue.rule}", issue.message, CIDR_CHECK_NAME)
+                for issue in find_cidr_issues(config)]
+
+    def find_warnings(self, config: Dict[str, Any]) -> List[ValidationIssue]:
+        """Collect findings that are worth a look but do not make a config invalid.
+
+        Currently reports IPv4 ranges outside private address space.
+
+        Args:
+            config: Dictionary containing the configuration.
+
+        Returns:
+            List of warnings; empty if none were found.
+        """
+        if not isinstance(config, dict):
+            return []
+        return [ValidationIssue(issue.path, f"{CIDR_CHECK_NAME}/{issue.rule}", issue.message, CIDR_CHECK_NAME)
+                for issue in find_cidr_warnings(config)]
+
+    def find_errors(self, config: Dict[str, Any]) -> List[ValidationIssue]:
+        """Collect every violation of the schemas and semantic checks.
+
+        Unlike validate_config, this does not stop at the first error, so a
+        single run reports everything that needs fixing in a config.
+
+        Args:
+            config: Dictionary containing the configuration.
+
+        Returns:
+            List of issues in traversal order; empty if the config is valid.
+        """
+        issues = [ValidationIssue.from_error(e, BASE_SCHEMA_NAME)
+                  for e in self.registry.get(BASE_SCHEMA_NAME).iter_errors(config)]
+
+        # The landing zone schema can only be picked once the type is known
+        landing_zone = config.get("landing_zone") if isinstance(config, dict) else None
+        lz_type = landing_zone.get("type") if isinstance(landing_zone, dict) else None
+        if lz_type in LANDING_ZONE_SCHEMAS:
+            issues.extend(ValidationIssue.from_error(e, lz_type)
+                          for e in self.registry.get(lz_type).iter_errors(config))
+        issues.extend(self.find_semantic_errors(config))
+        return issues
+
     def validate_file(self, config_path: str) -> Dict[str, Any]:
         """Load and validate a configuration file.
 
@@ -82,6 +248,42 @@ class ConfigValidator:
             ValueError: If the YAML file is invalid.
             FileNotFoundError: If the configuration file is not found.
         """
-        config = self.load_yaml(config_path)
-        self.validate_config(config)
+        loaded = self.store.load(config_path)
+        key, cached = self._lookup(loaded)
+        if cached is not None and not cached.issues and loaded.parsed:
+            return loaded.data
+
+        config = loaded.data
+        try:
+            self.validate_config(config)
+        except ValidationError:
+            if key is not None:
+                self.cache.put(key, self.find_errors(config), config)
+            raise
+        if key is not None:
+            self.cache.put(key, [], config)
         return config
+
+    def check_file(self, config_path: str) -> List[ValidationIssue]:
+        """Load a configuration file and collect all of its violations.
+
+        Args:
+            config_path: Path to the YAML configuration file.
+
+        Returns:
+            List of issues; empty if the file is valid.
+
+        Raises:
+            ValueError: If the YAML file is invalid.
+            FileNotFoundError: If the configuration file is not found.
+        """
+        loaded = self.store.load(config_path)
+        key, cached = self._lookup(loaded)
+        if cached is not None:
+            return cached.issues
+
+        config = loaded.data
+        issues = self.find_errors(config)
+        if key is not None:
+            self.cache.put(key, issues, config)
+        return issues
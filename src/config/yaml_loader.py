@@ -0,0 +1,164 @@
+"""Shared YAML loading with the libyaml fast path when available."""
+
+import hashlib
+import os
+import threading
+from typing import IO, Any, Dict, Optional, Tuple, Union
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+# True when parsing goes through the C extension
+LIBYAML_AVAILABLE = SafeLoader.__name__ == 'CSafeLoader'
+
+
+def safe_load(stream: Union[str, bytes, IO]) -> Any:
+    """Parse YAML like ``yaml.safe_load``, using libyaml when available.
+
+    Args:
+        stream: YAML content or an open file.
+
+    Returns:
+        The parsed document.
+
+    Raises:
+        yaml.YAMLError: If the content is not valid YAML.
+    """
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def load_file(path: str) -> Any:
+    """Read and parse a YAML file.
+
+    Args:
+        path: Path to the YAML file.
+
+    Returns:
+        The parsed document.
+
+    Raises:
+        yaml.YAMLError: If the file is not valid YAML.
+        FileNotFoundError: If the file does not exist.
+    """
+    with open(path, 'rb') as f:
+        return safe_load(f)
+
+
+class LoadedConfig:
+    """A configuration file read from disk once and parsed on first use.
+
+    The parsed document is shared by every reader in the process and must
+    be treated as read-only.
+    """
+
+    __slots__ = ('path', 'signature', 'content_hash', '_raw', '_data', '_parsed')
+
+    def __init__(self, path: str, signature: Tuple[int, int], raw: bytes):
+        self.path = path
+        self.signature = signature
+        self.content_hash = hashlib.sha256(raw).hexdigest()
+        self._raw: Optional[bytes] = raw
+        self._data: Any = None
+        self._parsed = False
+
+    @property
+    def parsed(self) -> bool:
+        """Whether the document has been parsed or provided yet."""
+        return self._parsed
+
+    @property
+    def data(self) -> Any:
+        """The parsed document.
+
+        Raises:
+            ValueError: If the file is not valid YAML.
+        """
+        if not self._parsed:
+            try:
+                self.set_data(safe_load(self._raw))
+            except yaml.YAMLError as e:
+                raise ValueError(f"Invalid YAML file: {str(e)}")
+        return self._data
+
+    def set_data(self, data: Any) -> None:
+        """Provide the parsed document, e.g. from a validation cache hit."""
+        self._data = data
+        self._parsed = True
+        self._raw = None
+
+
+class ConfigStore:
+    """Parsed configuration files memoized by path and modification time.
+
+    Each file is read and parsed at most once per process for as long as
+    its mtime and size are unchanged, so validation, conversion and build
+    construction can all load the same path without repeating the work.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, LoadedConfig] = {}
+        self._lock = threading.Lock()
+
+    def load(self, path: str) -> LoadedConfig:
+        """Return the loaded config for a path, reading it if it changed.
+
+        Args:
+            path: Path to the YAML file.
+
+        Returns:
+            LoadedConfig for the current content of the file.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        key = os.path.realpath(path)
+        try:
+            stat = os.stat(key)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {path}")
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry.signature == signature:
+            return entry
+
+        with open(key, 'rb') as f:
+            entry = LoadedConfig(path, signature, f.read())
+        with self._lock:
+            self._entries[key] = entry
+        return entry
+
+    def forget(self, path: str) -> None:
+        """Drop the memoized entry for a path."""
+        with self._lock:
+            self._entries.pop(os.path.realpath(path), None)
+
+    def clear(self) -> None:
+        """Drop every memoized entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared by every reader in the process
+CONFIG_STORE = ConfigStore()
+
+
+def load_config(path: str) -> Any:
+    """Return the parsed content of a YAML file through the shared store.
+
+    Args:
+        path: Path to the YAML file.
+
+    Returns:
+        The parsed document; shared, so it must not be modified.
+
+    Raises:
+        ValueError: If the file is not valid YAML.
+        FileNotFoundError: If the file does not exist.
+    """
+    return CONFIG_STORE.load(path).data
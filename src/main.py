@@ -4,21 +4,37 @@
 
 import argparse
 import sys
-import yaml
 import json
 import os
 import time
-from typing import Dict, Any
-from pathlib import Path
-from google.cloud.devtools import cloudbuild_v1
-from config.validator import ConfigValidator
-from rich.console import Console
-from rich.live import Live
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
-from datetime import datetime
-
-console = Console()
+from typing import TYPE_CHECKING, Collection, Dict, Any, List, Tuple
+from config.converter import (TFVARS_FORMATS, ConversionTarget, convert_file, index_environments, run_conversions,
+                              tfvars_filename, write_tfvars)
+from config.manifest import ConversionManifest, section_hashes
+from config.output import write_if_changed
+from config.yaml_loader import CONFIG_STORE, load_config
+
+# Heavy dependencies (Cloud Build client, rich, jsonschema) are imported by
+# the commands that need them so that convert starts quickly.
+if TYPE_CHECKING:
+    from google.cloud.devtools import cloudbuild_v1
+    from config.fanout import TargetResult
+
+_console = None
+
+def get_console():
+    """Return the shared rich console, creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+def gcs_location(value: str) -> str:
+    """Argument type accepting a gs://bucket or gs://bucket/prefix location."""
+    if not value.startswith('gs://') or not value[len('gs://'):].strip('/'):
+        raise argparse.ArgumentTypeError(f"expected gs://bucket or gs://bucket/prefix, got '{value}'")
+    return value
 
 def parse_args():
     """Parse command line arguments."""
@@ -29,12 +45,30 @@ def parse_args():
 Examples:
   Validate a configuration:
     %(prog)s validate path/to/config.yaml [--landing-zone-type=pbmm-gcp]
+
+  Validate many configurations in parallel:
+    %(prog)s validate examples/ 'business_units/*/config.yaml' [--jobs=8]
+
+  Re-validate configurations whenever they are saved:
+    %(prog)s validate business_units/ --watch
   
   Deploy a configuration:
     %(prog)s deploy path/to/config.yaml --project-id=my-project [--progress] [--landing-zone-type=pbmm-gcp]
+
+  Deploy a configuration to many projects concurrently:
+    %(prog)s deploy path/to/config.yaml --matrix=targets.yaml [--concurrency=4] [--rate=2]
+
+  Deploy with Terraform and its providers cached in a bucket:
+    %(prog)s deploy path/to/config.yaml --project-id=my-project --tool-cache=gs://my-bucket/terraform
   
   Convert YAML to Terraform variables:
     %(prog)s convert path/to/config.yaml path/to/output.tfvars [--common-only] [--landing-zone-type=pbmm-gcp]
+
+  Convert to JSON Terraform variables:
+    %(prog)s convert path/to/config.yaml path/to/output.auto.tfvars.json --format=json
+
+  Convert to full and common Terraform variables in one pass:
+    %(prog)s convert path/to/config.yaml path/to/development.auto.tfvars --common-output=path/to/common.auto.tfvars
         """
     )
 
@@ -46,21 +80,62 @@ Examples:
                              choices=['pbmm-gcp', 'gcp'],
                              help='Type of landing zone (overrides value in config file)')
 
+    # Arguments for commands that validate configuration files
+    cache_parser = argparse.ArgumentParser(add_help=False)
+    cache_parser.add_argument('--no-cache', action='store_true',
+                              help='Do not read or write the validation result cache')
+
+    # Arguments for commands that can keep running and re-process changed files
+    watch_parser = argparse.ArgumentParser(add_help=False)
+    watch_parser.add_argument('--watch', action='store_true',
+                              help='Keep running and re-process files whenever they change')
+    watch_parser.add_argument('--interval', type=float, default=0.1,
+                              help='Seconds between checks for changed files in watch mode')
+
     # Validate command
-    validate_parser = subparsers.add_parser('validate', parents=[parent_parser], help='Validate a configuration file')
-    validate_parser.add_argument('config_file', help='Path to the configuration YAML file')
+    validate_parser = subparsers.add_parser('validate', parents=[parent_parser, cache_parser, watch_parser], help='Validate a configuration file')
+    validate_parser.add_argument('config_files', nargs='+', metavar='config_file',
+                                 help='Configuration YAML files, directories or glob patterns')
+    validate_parser.add_argument('--jobs', '-j', type=int, default=None,
+                                 help='Number of worker processes (default: CPU count)')
+    validate_parser.add_argument('--format', choices=['text', 'json'], default='text',
+                                 help='Report format; json emits every error as a structured record')
 
     # Deploy command
-    deploy_parser = subparsers.add_parser('deploy', parents=[parent_parser], help='Deploy a configuration using Cloud Build')
+    deploy_parser = subparsers.add_parser('deploy', parents=[parent_parser, cache_parser], help='Deploy a configuration using Cloud Build')
     deploy_parser.add_argument('config_file', help='Path to the configuration YAML file')
-    deploy_parser.add_argument('--project-id', required=True, help='GCP project ID')
+    deploy_target = deploy_parser.add_mutually_exclusive_group(required=True)
+    deploy_target.add_argument('--project-id', help='GCP project ID')
+    deploy_target.add_argument('--matrix',
+                               help='YAML or JSON file of project IDs and config overrides to deploy to concurrently')
     deploy_parser.add_argument('--progress', action='store_true', help='Show build progress')
+    deploy_parser.add_argument('--jobs', '-j', type=int, default=None,
+                               help='Number of environments converted concurrently (default: CPU count)')
+    deploy_parser.add_argument('--format', choices=TFVARS_FORMATS, default='hcl',
+                               help='Format of the generated tfvars; json writes *.tfvars.json files')
+    deploy_parser.add_argument('--force', action='store_true',
+                               help='Regenerate every tfvars file, even if its inputs did not change')
+    deploy_parser.add_argument('--subscription',
+                               help='Pub/Sub subscription to the cloud-builds topic; with --progress, '
+                                    'build status is pushed instead of polled')
+    deploy_parser.add_argument('--concurrency', type=int, default=4,
+                               help='With --matrix, maximum number of builds running at once (default: 4)')
+    deploy_parser.add_argument('--rate', type=float, default=2.0,
+                               help='With --matrix, Cloud Build API calls per second across all targets (default: 2)')
+    deploy_parser.add_argument('--burst', type=int, default=5,
+                               help='With --matrix, Cloud Build API calls that may be made at once (default: 5)')
+    deploy_parser.add_argument('--tool-cache', type=gcs_location, metavar='gs://BUCKET[/PREFIX]',
+                               help='Restore Terraform and its providers from this bucket and save them after '
+                                    'the build; providers are keyed by the lock files')
 
     # Convert command
-    convert_parser = subparsers.add_parser('convert', parents=[parent_parser], help='Convert YAML configuration to Terraform variables')
+    convert_parser = subparsers.add_parser('convert', parents=[parent_parser, watch_parser], help='Convert YAML configuration to Terraform variables')
     convert_parser.add_argument('config_file', help='Path to the configuration YAML file')
     convert_parser.add_argument('output_file', help='Path to the output .tfvars file')
     convert_parser.add_argument('--common-only', action='store_true', help='Extract only common configuration')
+    convert_parser.add_argument('--common-output', help='Also write the common configuration to this .tfvars file')
+    convert_parser.add_argument('--format', choices=TFVARS_FORMATS, default='hcl',
+                                help='Output format; json writes compact JSON for *.tfvars.json files')
 
     return parser.parse_args()
 
@@ -73,129 +148,76 @@ def yaml_to_tfvars(yaml_file: str, output_file: str, common_only: bool = False,
         common_only: Whether to extract only common configuration.
         landing_zone_type: Optional override for landing zone type.
     
+    Returns:
+        bool: True if conversion succeeds, False otherwise.
+    """
+    return convert_outputs(yaml_file, [ConversionTarget(output_file, common_only)], landing_zone_type)
+
+def convert_outputs(yaml_file: str, targets: List[ConversionTarget], landing_zone_type: str = None) -> bool:
+    """Convert YAML configuration to several Terraform variable files at once.
+    
+    The configuration is parsed once and every output is produced from it.
+    Outputs whose content did not change are left untouched.
+    
+    Args:
+        yaml_file: Path to the YAML configuration file.
+        targets: The .tfvars files to write and whether each is common-only.
+        landing_zone_type: Optional override for landing zone type.
+    
     Returns:
         bool: True if conversion succeeds, False otherwise.
     """
     try:
-        with open(yaml_file, 'r') as f:
-            yaml_data = yaml.safe_load(f)
-        
-        # Determine landing zone type, with CLI override taking precedence
-        lz_type = landing_zone_type or yaml_data.get('landing_zone', {}).get('type')
-        if not lz_type:
-            raise ValueError("Landing zone type not specified in configuration or command line")
-        
-        # Convert YAML data to Terraform format based on landing zone type
-        tfvars = {}
-        
-        # Process common configurations for all landing zone types
-        if 'regions' in yaml_data:
-            tfvars['regions'] = yaml_data['regions']
-            
-        if lz_type == "pbmm-gcp":
-            # Process PBMM-specific configurations
-            if 'business_units' in yaml_data:
-                tfvars['business_units'] = []
-                for bu in yaml_data['business_units']:
-                    # Common business unit configuration
-                    bu_config = {
-                        'business_code': bu.get('business_code', ''),
-                        'business_unit': bu.get('business_unit', ''),
-                        'location_kms': bu.get('location_kms', 'ca'),
-                        'location_gcs': bu.get('location_gcs', 'ca'),
-                        'tfc_org_name': bu.get('tfc_org_name', ''),
-                        'gcs_bucket_prefix': bu.get('gcs_bucket_prefix', 'bkt'),
-                        'folder_prefix': bu.get('folder_prefix', 'fldr'),
-                        'primary_contact': bu.get('primary_contact', 'none@no.ne'),
-                        'secondary_contact': bu.get('secondary_contact', 'none@no.ne'),
-                    }
-                    
-                    # Add environment-specific configuration if not common_only
-                    if not common_only:
-                        env_keys = ['development', 'nonproduction', 'production']
-                        bu_config['environments'] = {}
-                        
-                        for env in env_keys:
-                            if env in bu:
-                                env_config = bu[env]
-                                bu_config['environments'][env] = {
-                                    'env_code': env_config.get('env_code', ''),
-                                    'billing_code': env_config.get('billing_code', 'none'),
-                                    'env_enabled': env_config.get('env_enabled', False),
-                                    'windows_activation_enabled': env_config.get('windows_activation_enabled', False),
-                                    'firewall_logging_enabled': env_config.get('firewall_logging_enabled', False),
-                                    'optional_fw_rules_enabled': env_config.get('optional_fw_rules_enabled', False),
-                                    'vpc_flow_logs_enabled': env_config.get('vpc_flow_logs_enabled', False),
-                                    'peering_iap_fw_rules_enabled': env_config.get('peering_iap_fw_rules_enabled', False),
-                                    'key_ring_name': env_config.get('key_ring_name', 'simple-keyring'),
-                                    'key_name': env_config.get('key_name', 'simple-keyname'),
-                                    'key_rotation_period': env_config.get('key_rotation_period', '7776000s'),
-                                    'base': env_config.get('base', {}),
-                                    'restricted': env_config.get('restricted', {})
-                                }
-                    
-                    tfvars['business_units'].append(bu_config)
-                    
-        elif lz_type == "gcp":
-            # Process standard GCP configurations
-            if not common_only:
-                # Process projects configuration
-                if 'projects' in yaml_data:
-                    tfvars['projects'] = yaml_data['projects']
-                
-                # Process networking configuration
-                if 'networking' in yaml_data:
-                    tfvars['networking'] = yaml_data['networking']
-                
-                # Process app infrastructure
-                if 'app_infra' in yaml_data:
-                    tfvars['app_infra'] = yaml_data['app_infra']
-            
-            # Process common configurations
-            if 'bootstrap' in yaml_data:
-                tfvars['bootstrap'] = {
-                    'org_id': yaml_data['bootstrap'].get('org_id', ''),
-                    'billing_account': yaml_data['bootstrap'].get('billing_account', ''),
-                    'default_region': yaml_data['bootstrap'].get('default_region', '')
-                }
-            
-            if 'org' in yaml_data:
-                tfvars['org'] = {
-                    'parent_folder': yaml_data['org'].get('parent_folder', ''),
-                    'scc_notification_name': yaml_data['org'].get('scc_notification_name', '')
-                }
-        
-        else:
-            raise ValueError(f"Unsupported landing zone type: {lz_type}")
-        
-        # Write to tfvars file
-        with open(output_file, 'w') as f:
-            for key, value in tfvars.items():
-                if isinstance(value, (dict, list)):
-                    f.write(f'{key} = {json.dumps(value, indent=2)}\n')
-                else:
-                    f.write(f'{key} = "{value}"\n')
-        
-        print(f"✅ Successfully converted {yaml_file} to {output_file}")
-        return True
+        written = convert_file(yaml_file, targets, landing_zone_type)
     except Exception as e:
         print(f"❌ Error converting YAML to Terraform variables: {str(e)}", file=sys.stderr)
         return False
+    print_conversion_report([(yaml_file, target.output_file) for target in targets], written)
+    return True
 
-def validate_config(config_file: str) -> tuple[bool, Dict[str, Any] | None]:
+def print_conversion_report(converted: List[Tuple[str, str]], written: Dict[str, bool],
+                            up_to_date: Collection[str] = ()) -> None:
+    """Print which outputs were written and how many were skipped as unchanged.
+    
+    Args:
+        converted: (source, output) file pairs in the order to report them.
+        written: Whether each output file was written.
+        up_to_date: Outputs not regenerated because their inputs did not change.
+    """
+    for source, output in converted:
+        if output in up_to_date:
+            print(f"⏭️  {output} is up to date")
+        elif written.get(output, True):
+            print(f"✅ Successfully converted {source} to {output}")
+        else:
+            print(f"⏭️  {output} is unchanged")
+    skipped = sum(1 for _, output in converted if output not in up_to_date and not written.get(output, True))
+    summary = (f"Converted {len(converted)} file(s): {len(converted) - skipped - len(up_to_date)} written, "
+               f"{skipped} skipped as unchanged")
+    if up_to_date:
+        summary += f", {len(up_to_date)} up to date"
+    print(summary, flush=True)
+
+def validate_config(config_file: str, use_cache: bool = True) -> tuple[bool, Dict[str, Any] | None]:
     """Validate the configuration file.
     
     Args:
         config_file: Path to the configuration file.
+        use_cache: Whether to consult the validation result cache.
     
     Returns:
         Tuple of (success, config) where success is True if validation succeeds,
         and config is the validated configuration if successful.
     """
+    from config.cache import ValidationCache
+    from config.validator import ConfigValidator
+
     try:
-        validator = ConfigValidator()
+        validator = ConfigValidator(cache=ValidationCache() if use_cache else None)
         config = validator.validate_file(config_file)
         print(f"✅ Configuration file {config_file} is valid")
+        for issue in validator.find_warnings(config):
+            print(f"⚠️  {issue.path}: {issue.message}", file=sys.stderr)
         print("\nConfiguration details:")
         print(f"Landing Zone Type: {config['landing_zone']['type']}")
         print(f"Version: {config['version']}")
@@ -204,7 +226,135 @@ def validate_config(config_file: str) -> tuple[bool, Dict[str, Any] | None]:
         print(f"❌ Error validating configuration: {str(e)}", file=sys.stderr)
         return False, None
 
-def format_build_step(step: cloudbuild_v1.BuildStep, status: str) -> str:
+def validate_many(patterns: List[str], jobs: int = None, output_format: str = 'text', use_cache: bool = True) -> bool:
+    """Validate many configuration files and print an aggregated report.
+    
+    Every violation in each file is reported, not just the first one.
+    
+    Args:
+        patterns: Configuration files, directories or glob patterns.
+        jobs: Maximum number of worker processes.
+        output_format: 'text' for a human-readable report, 'json' for records.
+        use_cache: Whether to consult the validation result cache.
+    
+    Returns:
+        bool: True if every file is valid, False otherwise.
+    """
+    from config.batch import expand_config_paths, validate_files
+    from config.cache import ValidationCache
+
+    paths = expand_config_paths(patterns)
+    if not paths:
+        print("❌ No configuration files found", file=sys.stderr)
+        return False
+
+    start = time.perf_counter()
+    results = validate_files(paths, jobs, ValidationCache() if use_cache else None)
+    return print_validation_report(results, time.perf_counter() - start, output_format)
+
+def print_validation_report(results: List[Any], elapsed: float, output_format: str = 'text',
+                            indent: int = 2) -> bool:
+    """Print the outcome of validating a set of files.
+    
+    Args:
+        results: FileResult for each validated file.
+        elapsed: Wall time taken to validate the files, in seconds.
+        output_format: 'text' for a human-readable report, 'json' for records.
+        indent: JSON indentation; None prints the report on a single line.
+    
+    Returns:
+        bool: True if every file is valid, False otherwise.
+    """
+    failed = sum(1 for result in results if not result.ok)
+
+    if output_format == 'json':
+        json.dump({
+            'files': [result.to_dict() for result in results],
+            'passed': len(results) - failed,
+            'failed': failed,
+            'seconds': round(elapsed, 6),
+        }, sys.stdout, indent=indent)
+        print(flush=True)
+        return failed == 0
+
+    for result in results:
+        timing = f"{result.seconds * 1000:.1f} ms"
+        if result.ok:
+            print(f"✅ {result.path} ({timing})")
+            for issue in result.warnings:
+                print(f"   ⚠️  {issue.path}: {issue.message}", file=sys.stderr)
+        else:
+            print(f"❌ {result.path} ({timing}): {len(result.errors)} error(s)", file=sys.stderr)
+            for issue in result.errors:
+                print(f"   - {issue.describe()}", file=sys.stderr)
+
+    print(f"\nValidated {len(results)} file(s) in {elapsed:.2f}s: "
+          f"{len(results) - failed} passed, {failed} failed", flush=True)
+    return failed == 0
+
+def watch_validate(patterns: List[str], jobs: int = None, output_format: str = 'text',
+                   use_cache: bool = True, interval: float = 0.1) -> None:
+    """Validate configuration files and re-validate them whenever they change.
+    
+    Schemas stay compiled and unchanged files stay parsed between runs, so
+    only the files that were saved are validated again. In json format each
+    run is reported on a single line. Runs until interrupted.
+    
+    Args:
+        patterns: Configuration files, directories or glob patterns.
+        jobs: Worker processes per run; by default files are validated in-process.
+        output_format: 'text' for a human-readable report, 'json' for records.
+        use_cache: Whether to consult the validation result cache.
+        interval: Seconds between checks for changed files.
+    """
+    from config.batch import expand_config_paths, validate_files
+    from config.cache import ValidationCache
+    from config.watch import FileWatcher, watch
+
+    cache = ValidationCache() if use_cache else None
+
+    def on_change(changes):
+        for path in changes.removed:
+            CONFIG_STORE.forget(path)
+            print(f"🗑️  {path} removed", file=sys.stderr)
+        if changes.changed:
+            start = time.perf_counter()
+            results = validate_files(changes.changed, jobs or 1, cache)
+            print_validation_report(results, time.perf_counter() - start, output_format,
+                                    None if output_format == 'json' else 2)
+
+    print(f"👀 Watching {', '.join(patterns)} for changes (Ctrl+C to stop)", file=sys.stderr)
+    watch(FileWatcher(lambda: expand_config_paths(patterns)), on_change, interval)
+
+def watch_convert(yaml_file: str, targets: List[ConversionTarget],
+                  landing_zone_type: str = None, interval: float = 0.1) -> None:
+    """Convert a configuration file and convert it again whenever it changes.
+    
+    Runs until interrupted.
+    
+    Args:
+        yaml_file: Path to the YAML configuration file.
+        targets: The .tfvars files to write and whether each is common-only.
+        landing_zone_type: Optional override for landing zone type.
+        interval: Seconds between checks for changes.
+    """
+    from config.watch import FileWatcher, watch
+
+    print(f"👀 Watching {yaml_file} for changes (Ctrl+C to stop)", file=sys.stderr)
+    watch(FileWatcher(lambda: [yaml_file]),
+          lambda changes: convert_outputs(yaml_file, targets, landing_zone_type),
+          interval)
+
+# Icons of build, step and matrix target statuses
+STATUS_ICONS = {
+    'SUCCESS': '✅',
+    'FAILURE': '❌',
+    'ERROR': '❌',
+    'WORKING': '🔄',
+    'QUEUED': '⏳',
+}
+
+def format_build_step(step: 'cloudbuild_v1.BuildStep', status: str) -> str:
     """Format a build step for display.
     
     Args:
@@ -214,75 +364,105 @@ def format_build_step(step: cloudbuild_v1.BuildStep, status: str) -> str:
     Returns:
         str: Formatted step string
     """
-    status_icons = {
-        'SUCCESS': '✅',
-        'FAILURE': '❌',
-        'WORKING': '🔄',
-        'QUEUED': '⏳',
-    }
-    icon = status_icons.get(status, '⚪')
+    icon = STATUS_ICONS.get(status, '⚪')
     return f"{icon} {step.name}"
 
-def monitor_build_progress(operation, project_id: str):
+def build_panel(build_id: str, build: 'cloudbuild_v1.Build'):
+    """Render the status of a build and its steps as a rich panel.
+    
+    Args:
+        build_id: ID of the build
+        build: The build as last fetched
+    
+    Returns:
+        rich.panel.Panel: The panel to display
+    """
+    from google.cloud.devtools import cloudbuild_v1
+    from rich.panel import Panel
+
+    # Create progress display
+    status = f"[bold]Build Status:[/bold] {build.status.name}"
+    if build.status == cloudbuild_v1.Build.Status.WORKING:
+        status += f" ({len([s for s in build.steps if s.status == cloudbuild_v1.Build.Status.SUCCESS])}/{len(build.steps)} steps complete)"
+    
+    steps_display = []
+    for step in build.steps:
+        step_status = step.status.name if step.status else 'QUEUED'
+        steps_display.append(format_build_step(step, step_status))
+        if step.status == cloudbuild_v1.Build.Status.WORKING and hasattr(step, 'timing'):
+            steps_display.append(f"  > {step.timing.start_time.strftime('%H:%M:%S')}: Running...")
+    
+    return Panel(
+        "\n".join([
+            status,
+            "",
+            *steps_display,
+            "",
+            f"[bold]Time Elapsed:[/bold] {build.timing.start_time.strftime('%H:%M:%S') if build.timing and build.timing.start_time else 'Not started'}"
+        ]),
+        title=f"Build ID: {build_id}",
+        border_style="blue"
+    )
+
+def monitor_build_progress(operation, project_id: str, client: 'cloudbuild_v1.CloudBuildClient' = None,
+                           subscription: str = None):
     """Monitor build progress and display in terminal.
     
+    With a subscription to the cloud-builds Pub/Sub topic, the display is
+    updated as status messages arrive. Otherwise the build is polled often
+    while its steps change status and less often while a long step runs;
+    see config.monitor.
+    
     Args:
         operation: The build operation to monitor
         project_id: GCP project ID
+        client: Cloud Build client to poll with (default: the shared pooled client)
+        subscription: Name or path of a subscription to the cloud-builds topic
     """
-    client = cloudbuild_v1.CloudBuildClient()
+    from google.cloud.devtools import cloudbuild_v1
+    from rich.live import Live
+    from config.clients import CLIENT_POOL
+    from config.monitor import create_monitor, monitor_builds
+
+    if client is None:
+        client = CLIENT_POOL.get()
     build_id = operation.metadata.build.id
     
-    with Live(console=console, refresh_per_second=1) as live:
-        while True:
-            build = client.get_build(project_id=project_id, id=build_id)
-            
-            # Create progress display
-            status = f"[bold]Build Status:[/bold] {build.status.name}"
-            if build.status == cloudbuild_v1.Build.Status.WORKING:
-                status += f" ({len([s for s in build.steps if s.status == cloudbuild_v1.Build.Status.SUCCESS])}/{len(build.steps)} steps complete)"
-            
-            steps_display = []
-            for step in build.steps:
-                step_status = step.status.name if step.status else 'QUEUED'
-                steps_display.append(format_build_step(step, step_status))
-                if step.status == cloudbuild_v1.Build.Status.WORKING and hasattr(step, 'timing'):
-                    steps_display.append(f"  > {step.timing.start_time.strftime('%H:%M:%S')}: Running...")
-            
-            # Update display
-            live.update(
-                Panel(
-                    "\n".join([
-                        status,
-                        "",
-                        *steps_display,
-                        "",
-                        f"[bold]Time Elapsed:[/bold] {build.timing.start_time.strftime('%H:%M:%S') if build.timing and build.timing.start_time else 'Not started'}"
-                    ]),
-                    title=f"Build ID: {build_id}",
-                    border_style="blue"
-                )
-            )
-            
-            # Check if build is complete
-            if build.status in [
-                cloudbuild_v1.Build.Status.SUCCESS,
-                cloudbuild_v1.Build.Status.FAILURE,
-                cloudbuild_v1.Build.Status.CANCELLED,
-                cloudbuild_v1.Build.Status.TIMEOUT
-            ]:
-                break
-            
-            time.sleep(5)  # Poll every 5 seconds
+    with Live(console=get_console(), refresh_per_second=1) as live:
+        monitor = create_monitor(client, project_id, subscription,
+                                 lambda build_id, build: live.update(build_panel(build_id, build)),
+                                 decode=lambda data: cloudbuild_v1.Build.from_json(data, ignore_unknown_fields=True))
+        monitor_builds(monitor, [build_id])
 
-def convert_environment_configs(base_dir: str, config: Dict[str, Any], config_file: str, landing_zone_type: str = None) -> bool:
+def write_json(path: str, data: Any) -> bool:
+    """Write data to a file as indented JSON, only if its content changed.
+    
+    Returns:
+        bool: True if the file was written, False if it was already up to date.
+    """
+    return write_if_changed(path, lambda f: json.dump(data, f, indent=2))
+
+# Config sections each kind of generated file is built from
+PBMM_SECTIONS = ('landing_zone', 'regions', 'business_units')
+GCP_SECTIONS = ('landing_zone', 'regions', 'projects', 'networking', 'app_infra', 'bootstrap', 'org')
+
+def convert_environment_configs(base_dir: str, config: Dict[str, Any], config_file: str, landing_zone_type: str = None,
+                                jobs: int = None, output_format: str = 'hcl', force: bool = False) -> bool:
     """Convert YAML configurations for all environments to Terraform variables.
     
+    Environments are converted concurrently; if any fails, the first one
+    (in environment order) is reported with its path. A manifest in the
+    base directory records what each output was generated from, and
+    outputs whose inputs did not change since are not regenerated.
+    
     Args:
         base_dir: Base directory containing the business_units directory
         config: The validated configuration dictionary
         config_file: Path to the configuration YAML file
         landing_zone_type: Optional override for landing zone type
+        jobs: Maximum number of environments converted at once (default: CPU count)
+        output_format: 'hcl' for *.tfvars files, 'json' for compact *.tfvars.json files
+        force: Regenerate every output, ignoring the manifest
         
     Returns:
         bool: True if conversion succeeds, False otherwise
@@ -293,6 +473,38 @@ def convert_environment_configs(base_dir: str, config: Dict[str, Any], config_fi
         if not lz_type:
             raise ValueError("Landing zone type not specified in configuration or command line")
 
+        def write_environment(path, data):
+            # Environment files have always been indented JSON; the json
+            # format writes them compactly instead
+            if output_format == 'json':
+                return write_tfvars(data, path, 'json')
+            return write_json(path, data)
+
+        manifest = ConversionManifest(base_dir)
+
+        # Outputs with their manifest options, source file hashes and a
+        # function returning the hashes of the sections they read
+        dependencies = {}
+        up_to_date = set()
+
+        def is_stale(output, options, source, sections):
+            files = {os.path.relpath(source, base_dir): CONFIG_STORE.load(source).content_hash}
+            dependencies[output] = (options, files, sections)
+            if not force and manifest.is_fresh(output, options, files, sections):
+                up_to_date.add(output)
+                return False
+            return True
+
+        def file_sections(source, names):
+            return lambda: section_hashes(CONFIG_STORE.load(source).data, names)
+
+        # (path, task) pairs run concurrently, and (source, output) pairs
+        # reported in order once every task succeeded; tasks record whether
+        # each output was written or skipped as unchanged
+        tasks = []
+        converted = []
+        written = {}
+
         if lz_type == "pbmm-gcp":
             # PBMM GCP structure
             business_units_dir = os.path.join(base_dir, '4-projects/business_units')
@@ -307,15 +519,22 @@ def convert_environment_configs(base_dir: str, config: Dict[str, Any], config_fi
                 if not os.path.exists(env_config_file):
                     continue
                 
-                # Convert to environment-specific tfvars
-                env_tfvars = os.path.join(env_dir, f'{env}.auto.tfvars')
-                if not yaml_to_tfvars(env_config_file, env_tfvars, False, lz_type):
-                    return False
-                
-                # Extract common configuration
-                common_tfvars = os.path.join(env_dir, 'common.auto.tfvars')
-                if not yaml_to_tfvars(env_config_file, common_tfvars, True, lz_type):
-                    return False
+                # Convert to environment-specific and common tfvars in one pass
+                targets = [
+                    ConversionTarget(os.path.join(env_dir, tfvars_filename(f'{env}.auto.tfvars', output_format)),
+                                     output_format=output_format),
+                    ConversionTarget(os.path.join(env_dir, tfvars_filename('common.auto.tfvars', output_format)),
+                                     common_only=True, output_format=output_format),
+                ]
+                converted.extend((env_config_file, target.output_file) for target in targets)
+                targets = [target for target in targets
+                           if is_stale(target.output_file,
+                                       {'landing_zone_type': lz_type, 'common_only': target.common_only,
+                                        'format': output_format},
+                                       env_config_file, file_sections(env_config_file, PBMM_SECTIONS))]
+                if targets:
+                    tasks.append((env_config_file, lambda path=env_config_file, targets=targets:
+                                  written.update(convert_file(path, targets, lz_type))))
 
         elif lz_type == "gcp":
             # Standard GCP structure
@@ -323,38 +542,167 @@ def convert_environment_configs(base_dir: str, config: Dict[str, Any], config_fi
             os.makedirs(environments_dir, exist_ok=True)
             
             # Convert main config to tfvars
-            main_tfvars = os.path.join(base_dir, 'terraform.tfvars')
-            if not yaml_to_tfvars(config_file, main_tfvars, False, lz_type):
-                return False
+            main_tfvars = os.path.join(base_dir, tfvars_filename('terraform.tfvars', output_format))
+            converted.append((config_file, main_tfvars))
+            if is_stale(main_tfvars, {'landing_zone_type': lz_type, 'format': output_format},
+                        config_file, file_sections(config_file, GCP_SECTIONS)):
+                tasks.append((config_file, lambda: written.update(
+                    convert_file(config_file, [ConversionTarget(main_tfvars, output_format=output_format)], lz_type))))
             
+            # Look every environment's entries up by name, reporting
+            # duplicate and missing ones
+            index = index_environments(config)
+            for issue in index.issues:
+                print(f"⚠️  {issue.path}: {issue.message}", file=sys.stderr)
+
             # Process each environment
-            for env in config.get('environments', []):
-                env_name = env.get('name')
-                if not env_name:
-                    continue
-                
+            for env_name in index.names:
                 env_dir = os.path.join(environments_dir, env_name)
                 os.makedirs(env_dir, exist_ok=True)
                 
                 # Create environment-specific tfvars
-                env_tfvars = os.path.join(env_dir, f'{env_name}.auto.tfvars')
-                env_config = {
-                    'environment': env_name,
-                    'projects': next((e['projects'] for e in config.get('projects', {}).get('environments', []) 
-                                   if e['environment'] == env_name), []),
-                    'app_infra': next((e for e in config.get('app_infra', {}).get('environments', [])
-                                     if e['environment'] == env_name), {})
-                }
+                env_tfvars = os.path.join(env_dir, tfvars_filename(f'{env_name}.auto.tfvars', output_format))
+                env_config = index.environment_tfvars(env_name)
                 
-                with open(env_tfvars, 'w') as f:
-                    json.dump(env_config, f, indent=2)
-    
+                converted.append((config_file, env_tfvars))
+                if is_stale(env_tfvars, {'environment': env_name, 'format': output_format}, config_file,
+                            lambda data=env_config: section_hashes(data, ('projects', 'app_infra'))):
+                    tasks.append((env_tfvars, lambda path=env_tfvars, data=env_config:
+                                  written.__setitem__(path, write_environment(path, data))))
+
+        failure = run_conversions(tasks, jobs)
+        if failure is not None:
+            print(f"❌ Error converting {failure.path}: {str(failure.error)}", file=sys.stderr)
+            return False
+
+        for output, (options, files, sections) in dependencies.items():
+            if output not in up_to_date:
+                manifest.record(output, options, files, sections())
+        manifest.save()
+
+        print_conversion_report(converted, written, up_to_date)
         return True
     except Exception as e:
         print(f"❌ Error converting environment configurations: {str(e)}", file=sys.stderr)
         return False
 
-def submit_build(project_id: str, config: Dict[str, Any], config_file: str, show_progress: bool = False, landing_zone_type: str = None) -> bool:
+# Map landing zone types to their directories
+LZ_DIRECTORIES = {
+    'pbmm-gcp': 'landing-zones/pbmm-gcp',
+    'gcp': 'landing-zones/gcp-landing-zone'
+}
+
+def resolve_landing_zone(config: Dict[str, Any], landing_zone_type: str = None) -> Tuple[str, str]:
+    """Return the landing zone type and its directory.
+    
+    Args:
+        config: Validated configuration
+        landing_zone_type: Optional override for landing zone type
+        
+    Returns:
+        Tuple of (landing zone type, landing zone directory)
+        
+    Raises:
+        ValueError: If the type is missing or unsupported
+    """
+    lz_type = landing_zone_type or config.get('landing_zone', {}).get('type')
+    if not lz_type:
+        raise ValueError("Landing zone type not specified in configuration or command line")
+    
+    if lz_type not in LZ_DIRECTORIES:
+        raise ValueError(f"Unsupported landing zone type: {lz_type}")
+    
+    return lz_type, LZ_DIRECTORIES[lz_type]
+
+def load_build_steps(lz_dir: str, tool_cache: str = None) -> List[Dict[str, Any]]:
+    """Load the steps of the landing zone's cloudbuild.yaml.
+    
+    Args:
+        lz_dir: Landing zone directory containing cloudbuild.yaml
+        tool_cache: Optional location caching Terraform and its providers
+        
+    Raises:
+        FileNotFoundError: If cloudbuild.yaml is missing
+        ValueError: If the source checkout step is missing with a tool cache
+    """
+    cloudbuild_path = os.path.join(lz_dir, 'cloudbuild.yaml')
+    if not os.path.exists(cloudbuild_path):
+        raise FileNotFoundError(f"cloudbuild.yaml not found in {lz_dir}")
+
+    steps = load_config(cloudbuild_path).get('steps', [])
+    if tool_cache:
+        from config.toolcache import ToolCache, add_cache_steps
+        steps = add_cache_steps(steps, ToolCache(tool_cache))
+    return steps
+
+def print_step_chain(steps: List[Dict[str, Any]]) -> None:
+    """Print the longest chain of dependent build steps.
+    
+    Raises:
+        ValueError: If a step waits for an unknown or later step
+    """
+    from config.buildsteps import longest_chain
+
+    print(f"🔗 Longest chain of dependent build steps: {longest_chain(steps).describe()}")
+
+def create_build_request(project_id: str, config: Dict[str, Any], lz_type: str, lz_dir: str,
+                         tool_cache: str = None) -> 'cloudbuild_v1.Build':
+    """Create the Cloud Build request from the landing zone's cloudbuild.yaml.
+    
+    Args:
+        project_id: GCP project ID
+        config: Validated configuration
+        lz_type: Landing zone type
+        lz_dir: Landing zone directory containing cloudbuild.yaml
+        tool_cache: Optional location caching Terraform and its providers
+        
+    Returns:
+        cloudbuild_v1.Build: The build to submit
+        
+    Raises:
+        FileNotFoundError: If cloudbuild.yaml is missing
+        ValueError: If a step is invalid
+    """
+    from google.cloud.devtools import cloudbuild_v1
+    from config.buildsteps import translate_step
+
+    # Create the build request
+    build = cloudbuild_v1.Build()
+    
+    # Add steps with their ids and waitFor, so independent steps run concurrently
+    for index, step in enumerate(load_build_steps(lz_dir, tool_cache)):
+        build.steps.append(cloudbuild_v1.BuildStep(**translate_step(step, index)))
+
+    # Add substitutions based on landing zone type; matrix targets may
+    # override exactly these settings (config.fanout.OVERRIDABLE_PATHS)
+    build.substitutions = {
+        "_PROJECT_ID": project_id,
+        "_REGION": config["bootstrap"]["default_region"],
+        "_ORG_ID": config["bootstrap"]["org_id"],
+        "_ROOT_FOLDER_ID": config["org"]["parent_folder"],
+        "_BILLING_ID": config["bootstrap"]["billing_account"],
+    }
+    
+    # Add PBMM-specific substitutions
+    if lz_type == "pbmm-gcp":
+        build.substitutions.update({
+            "_SUPER_ADMIN_EMAIL": config["bootstrap"]["groups"]["required_groups"]["group_org_admins"],
+            "_DOMAIN": "www.neosecai.com"  # This could be made configurable if needed
+        })
+
+    # Add secrets
+    available_secrets = cloudbuild_v1.types.Secrets()
+    secret_manager_secret = cloudbuild_v1.types.SecretManagerSecret()
+    secret_manager_secret.version_name = f"projects/816268782019/secrets/sa-111-secops/versions/latest"
+    secret_manager_secret.env = 'SECRET'  # Specify which env var will use this secret
+    available_secrets.secret_manager = [secret_manager_secret]
+    build.available_secrets = available_secrets
+
+    return build
+
+def submit_build(project_id: str, config: Dict[str, Any], config_file: str, show_progress: bool = False, landing_zone_type: str = None,
+                 jobs: int = None, tfvars_format: str = 'hcl', force: bool = False, subscription: str = None,
+                 tool_cache: str = None) -> bool:
     """Submit a Cloud Build job using the existing cloudbuild.yaml.
     
     Args:
@@ -363,82 +711,30 @@ def submit_build(project_id: str, config: Dict[str, Any], config_file: str, show
         config_file: Path to the configuration YAML file
         show_progress: Whether to show build progress
         landing_zone_type: Optional override for landing zone type
+        jobs: Maximum number of environments converted concurrently
+        tfvars_format: Format of the generated tfvars, 'hcl' or 'json'
+        force: Regenerate every tfvars file, even if its inputs did not change
+        subscription: Pub/Sub subscription to the cloud-builds topic for progress updates
+        tool_cache: gs:// location caching Terraform and its providers between builds
         
     Returns:
         bool: True if submission succeeds, False otherwise
     """
+    from config.clients import CLIENT_POOL
+
     try:
         # Determine landing zone type and directory
-        lz_type = landing_zone_type or config.get('landing_zone', {}).get('type')
-        if not lz_type:
-            raise ValueError("Landing zone type not specified in configuration or command line")
-        
-        # Map landing zone types to their directories
-        lz_directories = {
-            'pbmm-gcp': 'landing-zones/pbmm-gcp',
-            'gcp': 'landing-zones/gcp-landing-zone'
-        }
-        
-        if lz_type not in lz_directories:
-            raise ValueError(f"Unsupported landing zone type: {lz_type}")
-            
-        lz_dir = lz_directories[lz_type]
+        lz_type, lz_dir = resolve_landing_zone(config, landing_zone_type)
         
         # First convert all environment configurations
-        if not convert_environment_configs(lz_dir, config, config_file, landing_zone_type):
+        if not convert_environment_configs(lz_dir, config, config_file, landing_zone_type, jobs, tfvars_format, force):
             return False
 
-        # Create the Cloud Build client
-        client = cloudbuild_v1.CloudBuildClient()
-
-        # Read the cloudbuild.yaml file
-        cloudbuild_path = os.path.join(lz_dir, 'cloudbuild.yaml')
-        if not os.path.exists(cloudbuild_path):
-            raise FileNotFoundError(f"cloudbuild.yaml not found in {lz_dir}")
-            
-        with open(cloudbuild_path, 'r') as f:
-            yaml_config = yaml.safe_load(f)
+        # Get the shared Cloud Build client, also used to monitor the build
+        client = CLIENT_POOL.get()
 
-        # Create the build request
-        build = cloudbuild_v1.Build()
-        
-        # Add steps
-        for step in yaml_config.get('steps', []):
-            build_step = cloudbuild_v1.BuildStep()
-            build_step.name = step['name']
-            if 'entrypoint' in step:
-                build_step.entrypoint = step['entrypoint']
-            if 'args' in step:
-                build_step.args = step['args']
-            if 'env' in step:
-                build_step.env = step['env']
-            if 'secretEnv' in step:
-                build_step.secret_env = step['secretEnv']
-            build.steps.append(build_step)
-
-        # Add substitutions based on landing zone type
-        build.substitutions = {
-            "_PROJECT_ID": project_id,
-            "_REGION": config["bootstrap"]["default_region"],
-            "_ORG_ID": config["bootstrap"]["org_id"],
-            "_ROOT_FOLDER_ID": config["org"]["parent_folder"],
-            "_BILLING_ID": config["bootstrap"]["billing_account"],
-        }
-        
-        # Add PBMM-specific substitutions
-        if lz_type == "pbmm-gcp":
-            build.substitutions.update({
-                "_SUPER_ADMIN_EMAIL": config["bootstrap"]["groups"]["required_groups"]["group_org_admins"],
-                "_DOMAIN": "www.neosecai.com"  # This could be made configurable if needed
-            })
-
-        # Add secrets
-        available_secrets = cloudbuild_v1.types.Secrets()
-        secret_manager_secret = cloudbuild_v1.types.SecretManagerSecret()
-        secret_manager_secret.version_name = f"projects/816268782019/secrets/sa-111-secops/versions/latest"
-        secret_manager_secret.env = 'SECRET'  # Specify which env var will use this secret
-        available_secrets.secret_manager = [secret_manager_secret]
-        build.available_secrets = available_secrets
+        build = create_build_request(project_id, config, lz_type, lz_dir, tool_cache)
+        print_step_chain(load_build_steps(lz_dir, tool_cache))
 
         # Create the build
         operation = client.create_build(
@@ -454,7 +750,7 @@ def submit_build(project_id: str, config: Dict[str, Any], config_file: str, show
         
         if show_progress:
             print("\nMonitoring build progress...")
-            monitor_build_progress(operation, project_id)
+            monitor_build_progress(operation, project_id, client, subscription)
         else:
             print("\nYou can monitor the build progress in the Cloud Console")
         
@@ -464,6 +760,170 @@ def submit_build(project_id: str, config: Dict[str, Any], config_file: str, show
         print(f"❌ Error submitting build: {str(e)}", file=sys.stderr)
         return False
 
+def matrix_table(rows: Dict[str, Dict[str, Any]]):
+    """Render the state of every matrix target as one rich table.
+    
+    Args:
+        rows: Target name mapped to its project, build ID, status, finished
+            and total step counts and start time
+    
+    Returns:
+        rich.table.Table: The table to display
+    """
+    from rich.table import Table
+
+    table = Table(title="Matrix deployment", border_style="blue")
+    for column in ("Target", "Project", "Build ID", "Status", "Steps", "Elapsed"):
+        table.add_column(column)
+    now = time.monotonic()
+    for name, row in rows.items():
+        steps = f"{row['steps_done']}/{row['steps']}" if row['steps'] else ""
+        elapsed = f"{(row.get('finished') or now) - row['started']:.0f}s" if row.get('started') else ""
+        table.add_row(name, row['project_id'], row.get('build_id') or "",
+                      f"{STATUS_ICONS.get(row['status'], '⚪')} {row['status']}", steps, elapsed)
+    return table
+
+def print_matrix_report(results: List['TargetResult'], elapsed: float) -> None:
+    """Print the outcome and timing of every matrix target.
+    
+    Args:
+        results: Result of every target, in matrix order
+        elapsed: Wall time of the whole deployment in seconds
+    """
+    for result in results:
+        target = result.target
+        icon = '✅' if result.succeeded else '❌'
+        line = f"{icon} {target.name} ({target.project_id}): {result.status}"
+        if result.duration is not None:
+            line += f" in {result.duration:.1f}s, submitted after {result.submitted:.1f}s"
+        if result.build_id:
+            line += f" [build {result.build_id}]"
+        if result.error:
+            line += f" - {result.error}"
+        print(line)
+    failed = sum(1 for result in results if not result.succeeded)
+    print(f"Deployed {len(results)} target(s) in {elapsed:.1f}s: {len(results) - failed} succeeded, "
+          f"{failed} failed", flush=True)
+
+def deploy_matrix(matrix_file: str, config: Dict[str, Any], config_file: str, landing_zone_type: str = None,
+                  jobs: int = None, tfvars_format: str = 'hcl', force: bool = False, subscription: str = None,
+                  concurrency: int = 4, rate: float = 2.0, burst: int = 5, tool_cache: str = None) -> bool:
+    """Submit the configuration to every target of a matrix file and follow the builds.
+    
+    Every target's configuration, with its overrides merged in, is validated
+    before anything is submitted. Builds are submitted concurrently, and all
+    of them are followed in one table until they finish.
+    
+    Args:
+        matrix_file: Path to the YAML or JSON matrix file
+        config: Validated base configuration
+        config_file: Path to the configuration YAML file
+        landing_zone_type: Optional override for landing zone type
+        jobs: Maximum number of environments converted concurrently
+        tfvars_format: Format of the generated tfvars, 'hcl' or 'json'
+        force: Regenerate every tfvars file, even if its inputs did not change
+        subscription: Pub/Sub subscription name to the cloud-builds topic in
+            every target project, for progress updates
+        concurrency: Maximum number of builds running at once
+        rate: Cloud Build API calls per second, across all targets
+        burst: Cloud Build API calls that may be made at once
+        tool_cache: gs:// location caching Terraform and its providers between builds
+        
+    Returns:
+        bool: True if every build succeeded, False otherwise
+    """
+    import asyncio
+    from google.cloud.devtools import cloudbuild_v1
+    from rich.live import Live
+    from config.clients import CLIENT_POOL
+    from config.fanout import load_matrix, merge_overrides, run_matrix
+    from config.monitor import build_state, create_monitor, subscription_path
+    from config.ratelimit import TokenBucket
+    from config.validator import ConfigValidator
+
+    try:
+        targets = load_matrix(matrix_file)
+        lz_type, lz_dir = resolve_landing_zone(config, landing_zone_type)
+
+        # Validate every target before submitting anything
+        validator = ConfigValidator()
+        configs = {}
+        invalid = False
+        for target in targets:
+            configs[target.name] = merge_overrides(config, target.overrides)
+            for issue in validator.find_errors(configs[target.name]):
+                print(f"❌ {target.name}: {issue.describe()}", file=sys.stderr)
+                invalid = True
+        if invalid:
+            return False
+
+        # The tfvars are generated once, from the base configuration;
+        # parse_matrix only accepts overrides that reach the builds through
+        # their substitutions
+        if not convert_environment_configs(lz_dir, config, config_file, landing_zone_type, jobs, tfvars_format, force):
+            return False
+
+        client = CLIENT_POOL.get()
+        requests = {target.name: create_build_request(target.project_id, configs[target.name], lz_type, lz_dir,
+                                                      tool_cache)
+                    for target in targets}
+        print_step_chain(load_build_steps(lz_dir, tool_cache))
+        limiter = TokenBucket(rate, burst)
+        rows = {target.name: {'project_id': target.project_id, 'status': 'PENDING', 'steps': 0, 'steps_done': 0}
+                for target in targets}
+        names = {}
+
+        with Live(matrix_table(rows), console=get_console(), refresh_per_second=1) as live:
+            def on_update(build_id, build):
+                status, steps = build_state(build)
+                row = rows[names[build_id]]
+                row.update(status=status, steps=len(steps), steps_done=steps.count('SUCCESS'))
+                live.update(matrix_table(rows))
+
+            def on_submitted(target, build_id):
+                names[build_id] = target.name
+                rows[target.name].update(build_id=build_id, status='QUEUED', started=time.monotonic())
+                live.update(matrix_table(rows))
+
+            def on_result(result):
+                rows[result.target.name].update(status=result.status, finished=time.monotonic())
+                live.update(matrix_table(rows))
+
+            async def submit(target):
+                operation = await asyncio.to_thread(client.create_build, project_id=target.project_id,
+                                                    build=requests[target.name])
+                return operation.metadata.build.id
+
+            # Pub/Sub spreads a subscription's messages over its pulls, so the
+            # targets reporting to one subscription share one monitor
+            monitors = {}
+
+            async def watch(target, build_id):
+                key = subscription_path(target.project_id, subscription) if subscription else target.project_id
+                if key not in monitors:
+                    monitors[key] = create_monitor(
+                        client, target.project_id, subscription, on_update, limiter=limiter,
+                        decode=lambda data: cloudbuild_v1.Build.from_json(data, ignore_unknown_fields=True))
+                return await monitors[key].watch(build_id, target.project_id)
+
+            start = time.monotonic()
+            results = asyncio.run(run_matrix(targets, submit, watch, concurrency, limiter,
+                                             on_submitted, on_result))
+
+        print_matrix_report(results, time.monotonic() - start)
+        return all(result.succeeded for result in results)
+
+    except Exception as e:
+        print(f"❌ Error deploying matrix: {str(e)}", file=sys.stderr)
+        return False
+
+def print_client_stats() -> None:
+    """Print how many Cloud Build connections and RPCs the deploy used, if any."""
+    from config.clients import CLIENT_POOL
+
+    if CLIENT_POOL.stats.connections_opened:
+        print(f"Cloud Build API: {CLIENT_POOL.stats.describe()}", file=sys.stderr)
+
 def main():
     """Main entry point."""
     args = parse_args()
@@ -472,20 +932,42 @@ def main():
         print("Error: No command specified", file=sys.stderr)
         sys.exit(1)
 
+    if args.command == 'convert':
+        targets = [ConversionTarget(args.output_file, args.common_only, args.format)]
+        if args.common_output:
+            targets.append(ConversionTarget(args.common_output, True, args.format))
+
+    if getattr(args, 'watch', False):
+        try:
+            if args.command == 'validate':
+                watch_validate(args.config_files, args.jobs, args.format, not args.no_cache, args.interval)
+            else:
+                watch_convert(args.config_file, targets, args.landing_zone_type, args.interval)
+        except KeyboardInterrupt:
+            print("\nStopped watching", file=sys.stderr)
+        sys.exit(0)
+
     if args.command == 'validate':
-        success, _ = validate_config(args.config_file)
+        success = validate_many(args.config_files, args.jobs, args.format, not args.no_cache)
         sys.exit(0 if success else 1)
     elif args.command == 'deploy':
         # First validate the configuration
-        success, config = validate_config(args.config_file)
+        success, config = validate_config(args.config_file, not args.no_cache)
         if not success:
             sys.exit(1)
         
-        # Then submit the build
-        success = submit_build(args.project_id, config, args.config_file, args.progress, args.landing_zone_type)
+        # Then submit the builds
+        if args.matrix:
+            success = deploy_matrix(args.matrix, config, args.config_file, args.landing_zone_type, args.jobs,
+                                    args.format, args.force, args.subscription, args.concurrency, args.rate,
+                                    args.burst, args.tool_cache)
+        else:
+            success = submit_build(args.project_id, config, args.config_file, args.progress, args.landing_zone_type,
+                                   args.jobs, args.format, args.force, args.subscription, args.tool_cache)
+        print_client_stats()
         sys.exit(0 if success else 1)
     elif args.command == 'convert':
-        success = yaml_to_tfvars(args.config_file, args.output_file, args.common_only, args.landing_zone_type)
+        success = convert_outputs(args.config_file, targets, args.landing_zone_type)
         sys.exit(0 if success else 1)
 
 if __name__ == '__main__':
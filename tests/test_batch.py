@@ -0,0 +1,33 @@
+"""Tests for batch validation of configuration files."""
+
+import os
+import shutil
+
+from src.config.batch import expand_config_paths, validate_files
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(__file__), '../examples')
+
+
+def test_expand_config_paths(tmp_path):
+    """Test that directories and globs expand to unique YAML files."""
+    (tmp_path / 'nested').mkdir()
+    (tmp_path / 'a.yaml').write_text('version: "1.0"')
+    (tmp_path / 'nested' / 'b.yml').write_text('version: "1.0"')
+    (tmp_path / 'notes.txt').write_text('ignored')
+
+    paths = expand_config_paths([str(tmp_path), str(tmp_path / '*.yaml')])
+    assert paths == [str(tmp_path / 'a.yaml'), str(tmp_path / 'nested' / 'b.yml')]
+
+
+def test_validate_files_in_parallel(tmp_path):
+    """Test that results keep input order and report failures."""
+    shutil.copy(os.path.join(EXAMPLES_DIR, 'pbmm_config.yaml'), tmp_path / 'pbmm.yaml')
+    shutil.copy(os.path.join(EXAMPLES_DIR, 'gcp_config.yaml'), tmp_path / 'gcp.yaml')
+    (tmp_path / 'bad.yaml').write_text('version: "1.0"\n')
+    paths = [str(tmp_path / name) for name in ('pbmm.yaml', 'bad.yaml', 'gcp.yaml')]
+
+    results = validate_files(paths, jobs=2)
+    assert [r.path for r in results] == paths
+    assert [r.ok for r in results] == [True, False, True]
+    assert [e.path for e in results[1].errors] == ['$']
+    assert 'landing_zone' in results[1].errors[0].message
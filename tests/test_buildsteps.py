@@ -0,0 +1,74 @@
+"""Tests for cloudbuild.yaml step translation and dependency analysis."""
+
+import datetime
+import os
+
+import pytest
+
+from src.config.buildsteps import longest_chain, step_dependencies, translate_step
+from src.config.yaml_loader import load_file
+
+PBMM_CLOUDBUILD = os.path.join(os.path.dirname(__file__), '../landing-zones/pbmm-gcp/cloudbuild.yaml')
+
+
+def test_translate_step_keeps_the_full_schema():
+    """Test that ids, waitFor, timeout, dir and volumes reach the BuildStep fields."""
+    fields = translate_step({
+        'name': 'hashicorp/terraform', 'id': 'plan', 'waitFor': ['init'], 'timeout': '1200s',
+        'dir': 'landing-zones/pbmm-gcp', 'volumes': [{'name': 'plugins', 'path': '/plugins'}],
+        'args': ['plan'], 'env': ['TF_IN_AUTOMATION=1'], 'secretEnv': ['SECRET'], 'allowFailure': True,
+    })
+    assert fields == {
+        'name': 'hashicorp/terraform', 'id': 'plan', 'wait_for': ['init'], 'timeout': datetime.timedelta(seconds=1200),
+        'dir_': 'landing-zones/pbmm-gcp', 'volumes': [{'name': 'plugins', 'path': '/plugins'}],
+        'args': ['plan'], 'env': ['TF_IN_AUTOMATION=1'], 'secret_env': ['SECRET'], 'allow_failure': True,
+    }
+    assert translate_step({'name': 'x', 'timeout': 90})['timeout'] == datetime.timedelta(seconds=90)
+
+
+@pytest.mark.parametrize('step, message', [
+    ({'name': 'x', 'waitfor': ['a']}, 'unsupported keys waitfor'),
+    ({'id': 'x'}, 'name is required'),
+    ({'name': 'x', 'timeout': '10m'}, 'timeout'),
+    ({'name': 'x', 'volumes': [{'name': 'v'}]}, 'volumes'),
+])
+def test_translate_step_rejects_invalid_steps(step, message):
+    """Test that typos and malformed values are reported instead of dropped."""
+    with pytest.raises(ValueError, match=message):
+        translate_step(step, 3)
+
+
+def test_dependencies_follow_cloud_build_semantics():
+    """Test implicit waits on all earlier steps, '-' and explicit ids."""
+    steps = [{'id': 'a'}, {'id': 'b', 'waitFor': ['-']}, {'id': 'c', 'waitFor': ['a']}, {'id': 'd'}]
+    assert step_dependencies(steps) == [[], [], [0], [0, 1, 2]]
+
+    with pytest.raises(ValueError, match="'d' is not the id of an earlier step"):
+        step_dependencies([{'id': 'a', 'waitFor': ['d']}, {'id': 'd'}])
+    with pytest.raises(ValueError, match="duplicate step id 'a'"):
+        step_dependencies([{'id': 'a'}, {'id': 'a'}])
+
+
+def test_longest_chain():
+    """Test that the longest chain is found through parallel branches."""
+    steps = [
+        {'id': 'checkout'},
+        {'id': 'key', 'waitFor': ['-']},
+        {'id': 'lint', 'waitFor': ['checkout']},
+        {'id': 'init', 'waitFor': ['checkout', 'key']},
+        {'id': 'plan', 'waitFor': ['init']},
+        {'name': 'gcr.io/cloud-builders/gcloud', 'waitFor': ['lint']},
+    ]
+    chain = longest_chain(steps)
+    assert chain.steps == ['checkout', 'init', 'plan']
+    assert chain.describe() == '3 of 6 steps: checkout -> init -> plan'
+    assert longest_chain([{'name': 'a'}, {'name': 'b'}]).steps == ['#0 a', '#1 b']
+    assert longest_chain([]).steps == []
+
+
+def test_landing_zone_build_fetches_key_while_cloning():
+    """Test that the pbmm-gcp build runs the key and clone steps concurrently."""
+    steps = load_file(PBMM_CLOUDBUILD)['steps']
+    for index, step in enumerate(steps):
+        translate_step(step, index)
+    assert longest_chain(steps).steps == ['check-out-source', 'Install Tools and Perform Deployment']
@@ -0,0 +1,74 @@
+"""Tests for the validation result cache."""
+
+import os
+import shutil
+
+import pytest
+from jsonschema import ValidationError
+
+from src.config import cache as cache_module
+from src.config import yaml_loader
+from src.config.cache import ValidationCache
+from src.config.validator import ConfigValidator, ValidationIssue
+from src.config.yaml_loader import ConfigStore
+
+EXAMPLE = os.path.join(os.path.dirname(__file__), '../examples/pbmm_config.yaml')
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / 'config.yaml'
+    shutil.copy(EXAMPLE, path)
+    return str(path)
+
+
+def test_hit_skips_parsing_and_validation(tmp_path, config_file, monkeypatch):
+    """Test that a cache hit returns the config without re-validating."""
+    cache = ValidationCache(str(tmp_path / 'cache'))
+    config = ConfigValidator(cache=cache, store=ConfigStore()).validate_file(config_file)
+
+    def fail(*args, **kwargs):
+        raise AssertionError('cache was not used')
+
+    monkeypatch.setattr(yaml_loader, 'safe_load', fail)
+    monkeypatch.setattr(ConfigValidator, 'validate_config', fail)
+    validator = ConfigValidator(cache=cache, store=ConfigStore())
+    assert validator.validate_file(config_file) == config
+
+
+def test_schema_change_invalidates(tmp_path, config_file, monkeypatch):
+    """Test that keys change when the schema fingerprint changes."""
+    cache = ValidationCache(str(tmp_path / 'cache'))
+    data = 'content-hash'
+    key = cache.key(data)
+    cache.put(key, [], {'version': '1.0'})
+    assert cache.get(key) is not None
+
+    monkeypatch.setattr(cache_module, '_fingerprint', 'changed-schemas')
+    assert cache.key(data) != key
+    assert cache.get(cache.key(data)) is None
+
+
+def test_invalid_results_are_cached(tmp_path):
+    """Test that failures are cached and still raise from validate_file."""
+    path = tmp_path / 'bad.yaml'
+    path.write_text('version: "1.0"\n')
+    validator = ConfigValidator(cache=ValidationCache(str(tmp_path / 'cache')))
+    with pytest.raises(ValidationError):
+        validator.validate_file(str(path))
+    issues = validator.check_file(str(path))
+    assert issues and isinstance(issues[0], ValidationIssue)
+    with pytest.raises(ValidationError):
+        validator.validate_file(str(path))
+
+
+def test_eviction_bounds_size(tmp_path):
+    """Test that least recently used entries are evicted."""
+    cache = ValidationCache(str(tmp_path / 'cache'), max_bytes=2000)
+    keys = [cache.key(str(i)) for i in range(20)]
+    for key in keys:
+        cache.put(key, [], {'padding': 'x' * 200})
+    sizes = sum(entry.stat().st_size for entry in os.scandir(cache.cache_dir))
+    assert sizes <= 2000
+    assert cache.get(keys[-1]) is not None
+    assert cache.get(keys[0]) is None
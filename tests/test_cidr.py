@@ -0,0 +1,86 @@
+"""Tests for the CIDR semantic checks."""
+
+import copy
+import os
+
+import pytest
+from jsonschema import ValidationError
+
+from src.config.cidr import find_cidr_issues, find_cidr_warnings, parse_cidr
+from src.config.validator import ConfigValidator
+from src.config.yaml_loader import load_file
+
+EXAMPLE = os.path.join(os.path.dirname(__file__), '../examples/pbmm_config.yaml')
+
+
+def _subnets(*cidrs):
+    return {'networking': {'base_network': {'subnets': [
+        {'subnet_name': f'subnet-{i}', 'subnet_ip': cidr} for i, cidr in enumerate(cidrs)]}}}
+
+
+def test_parse_cidr():
+    """Test that ranges are parsed into inclusive integer intervals."""
+    assert parse_cidr('10.0.0.0/24') == (4, 0x0A000000, 0x0A0000FF)
+    assert parse_cidr('0.0.0.0/0') == (4, 0, 2**32 - 1)
+    assert parse_cidr('fd00::/127')[0] == 6
+    for invalid in ('10.0.0.1/24', '256.0.0.0/8', '10.0.0.0/33'):
+        with pytest.raises(ValueError):
+            parse_cidr(invalid)
+
+
+def test_overlaps_are_reported_per_scope():
+    """Test that overlapping and nested ranges in one scope are reported."""
+    issues = find_cidr_issues(_subnets('10.0.1.0/24', '10.0.0.0/16', '10.1.0.0/24', '10.0.200.0/24'))
+    assert [(issue.rule, issue.path) for issue in issues] == [
+        ('overlap', '$.networking.base_network.subnets[0].subnet_ip'),
+        ('overlap', '$.networking.base_network.subnets[3].subnet_ip'),
+    ]
+    assert '10.0.0.0/16 at $.networking.base_network.subnets[1].subnet_ip' in issues[0].message
+
+    # The same range in a different address space is fine
+    config = _subnets('10.0.0.0/24')
+    config['fortigate'] = {'config': {'networks': [{'name': 'external', 'cidr': '10.0.0.0/24'}]}}
+    assert find_cidr_issues(config) == []
+
+
+def test_invalid_ranges_are_errors_and_public_ranges_warnings():
+    """Test that malformed ranges are errors and non-private ranges only warnings."""
+    config = _subnets('10.0.0.1/24', '8.8.8.0/24', '172.0.0.0/11')
+    assert [issue.rule for issue in find_cidr_issues(config)] == ['invalid']
+    assert [issue.path for issue in find_cidr_warnings(config)] == [
+        '$.networking.base_network.subnets[1].subnet_ip', '$.networking.base_network.subnets[2].subnet_ip']
+
+
+def test_gke_range_names_are_skipped():
+    """Test that secondary range names are not treated as CIDRs."""
+    config = {'app_infra': {'environments': [{'environment': 'development', 'business_units': [
+        {'name': 'bu1', 'gke_clusters': [{'name': f'gke-{i}', 'network_config': {
+            'network': 'app-network', 'ip_range_pods': 'pods', 'ip_range_services': f'10.{i}.0.0/16'}}
+            for i in range(2)]}]}]}}
+    assert find_cidr_issues(config) == []
+    config['app_infra']['environments'][0]['business_units'][0]['gke_clusters'][1][
+        'network_config']['ip_range_services'] = '10.0.128.0/17'
+    assert [issue.rule for issue in find_cidr_issues(config)] == ['overlap']
+
+
+def test_validator_runs_cidr_stage():
+    """Test that CIDR issues fail validation and are collected with schema errors."""
+    config = copy.deepcopy(load_file(EXAMPLE))
+    config['business_units'][0]['development']['base']['ip_ranges']['subnet2'] = '10.0.0.128/25'
+    validator = ConfigValidator()
+    with pytest.raises(ValidationError) as exc_info:
+        validator.validate_config(config)
+    assert 'overlaps' in str(exc_info.value)
+
+    issues = validator.find_errors(config)
+    assert [(issue.schema, issue.schema_path) for issue in issues] == [('cidr', 'cidr/overlap')]
+
+
+def test_public_ranges_do_not_fail_validation():
+    """Test that a VPC using public address space is valid, with a warning."""
+    config = copy.deepcopy(load_file(EXAMPLE))
+    config['business_units'][0]['development']['base']['ip_ranges']['subnet2'] = '35.0.0.0/24'
+    validator = ConfigValidator()
+    validator.validate_config(config)
+    assert validator.find_errors(config) == []
+    assert [issue.schema_path for issue in validator.find_warnings(config)] == ['cidr/parent']
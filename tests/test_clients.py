@@ -0,0 +1,75 @@
+"""Tests for the shared Cloud Build client pool."""
+
+import threading
+from types import SimpleNamespace
+
+from src.config.clients import DEFAULT_ENDPOINT, ClientPool
+from src.config.monitor import BuildMonitor, monitor_builds
+
+
+class FakeClient:
+    """Cloud Build client reporting each call as an RPC, like the channel interceptor."""
+
+    def __init__(self, credentials, endpoint, on_rpc):
+        self.credentials = credentials
+        self.endpoint = endpoint
+        self.on_rpc = on_rpc
+        self.closed = False
+        self.transport = SimpleNamespace(close=self.close)
+
+    def close(self):
+        self.closed = True
+
+    def create_build(self, project_id, build):
+        self.on_rpc('CreateBuild')
+        return SimpleNamespace(metadata=SimpleNamespace(build=SimpleNamespace(id='b1')))
+
+    def get_build(self, project_id, id):
+        self.on_rpc('GetBuild')
+        return SimpleNamespace(status=SimpleNamespace(name='SUCCESS'), steps=[])
+
+
+def test_clients_are_cached_per_credentials_and_endpoint():
+    """Test that a (credentials, endpoint) pair opens one connection however often it is used."""
+    pool = ClientPool(FakeClient)
+    credentials = object()
+
+    default = pool.get()
+    assert pool.get() is default and pool.get(None, DEFAULT_ENDPOINT) is default
+    assert default.endpoint == DEFAULT_ENDPOINT
+
+    regional = pool.get(endpoint='northamerica-northeast1-cloudbuild.googleapis.com')
+    with_credentials = pool.get(credentials)
+    assert len({id(default), id(regional), id(with_credentials)}) == 3
+    assert pool.get(credentials) is with_credentials
+    assert pool.stats.connections_opened == 3
+
+    pool.close()
+    assert default.closed and regional.closed
+    assert pool.get() is not default
+
+
+def test_submission_and_monitoring_share_one_connection():
+    """Test that submitting and following a build reuses the pooled client and counts its RPCs."""
+    pool = ClientPool(FakeClient)
+
+    operation = pool.get().create_build(project_id='proj', build=None)
+    monitor_builds(BuildMonitor(pool.get(), 'proj'), [operation.metadata.build.id])
+
+    assert pool.stats.connections_opened == 1
+    assert pool.stats.rpcs == {'CreateBuild': 1, 'GetBuild': 1}
+    assert pool.stats.describe() == '1 connection, 2 RPCs (CreateBuild: 1, GetBuild: 1)'
+
+
+def test_concurrent_first_use_opens_one_connection():
+    """Test that threads asking for the same client at once share it."""
+    pool = ClientPool(FakeClient)
+    clients = []
+    threads = [threading.Thread(target=lambda: clients.append(pool.get())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert pool.stats.connections_opened == 1
+    assert len({id(client) for client in clients}) == 1
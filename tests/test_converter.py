@@ -0,0 +1,129 @@
+"""Tests for the tfvars converter."""
+
+import os
+import shutil
+
+import pytest
+
+from src.config import yaml_loader
+from src.config.converter import (ConversionError, ConversionTarget, LandingZoneTypeError, RenderError, build_tfvars,
+                                  convert_config, convert_file, index_environments, run_conversions)
+
+EXAMPLE = os.path.join(os.path.dirname(__file__), '../examples/pbmm_config.yaml')
+
+
+def test_convert_file_parses_once_for_all_targets(tmp_path, monkeypatch):
+    """Test that full and common outputs come from a single parse."""
+    config_file = tmp_path / 'config.yaml'
+    shutil.copy(EXAMPLE, config_file)
+    parses = []
+    monkeypatch.setattr(yaml_loader, 'safe_load', lambda stream: parses.append(stream) or
+                        yaml_loader.yaml.load(stream, Loader=yaml_loader.SafeLoader))
+
+    full, common = tmp_path / 'development.auto.tfvars', tmp_path / 'common.auto.tfvars'
+    convert_file(str(config_file), [ConversionTarget(str(full)), ConversionTarget(str(common), True)])
+    assert len(parses) == 1
+    assert 'environments' in full.read_text()
+    assert 'environments' not in common.read_text()
+    assert 'business_code' in common.read_text()
+
+
+def test_build_tfvars_rejects_unknown_type():
+    """Test that an unsupported landing zone type is reported."""
+    with pytest.raises(ValueError, match='Unsupported landing zone type'):
+        build_tfvars({'landing_zone': {'type': 'aws'}})
+    with pytest.raises(ValueError, match='not specified'):
+        build_tfvars({})
+
+
+def test_convert_config_matches_files_without_disk_io(tmp_path, monkeypatch):
+    """Test that in-memory content equals what convert_file writes."""
+    config = yaml_loader.load_file(EXAMPLE)
+    targets = [ConversionTarget(str(tmp_path / 'full.auto.tfvars')),
+               ConversionTarget(str(tmp_path / 'common.auto.tfvars'), common_only=True),
+               ConversionTarget(str(tmp_path / 'full.auto.tfvars.json'), output_format='json')]
+    convert_file(EXAMPLE, targets)
+
+    monkeypatch.setattr('builtins.open', None)
+    rendered = convert_config(config, targets)
+    monkeypatch.undo()
+
+    assert isinstance(rendered[targets[0].output_file], str)
+    assert isinstance(rendered[targets[2].output_file], bytes)
+    for target in targets:
+        with open(target.output_file, 'rb') as f:
+            expected = f.read()
+        content = rendered[target.output_file]
+        assert (content.encode('utf-8') if isinstance(content, str) else content) == expected
+
+
+def test_convert_config_raises_typed_errors():
+    """Test that conversion failures are reported as ConversionError subclasses."""
+    target = ConversionTarget('out.auto.tfvars')
+    with pytest.raises(LandingZoneTypeError):
+        convert_config({'landing_zone': {'type': 'aws'}}, [target])
+    with pytest.raises(ConversionError, match='must be a mapping'):
+        convert_config(['not', 'a', 'mapping'], [target])
+    with pytest.raises(ConversionError, match='Malformed configuration'):
+        convert_config({'landing_zone': {'type': 'pbmm-gcp'}, 'business_units': ['bu']}, [target])
+    with pytest.raises(ConversionError, match='Unsupported tfvars format'):
+        convert_config({'landing_zone': {'type': 'gcp'}}, [target._replace(output_format='yaml')])
+
+    with pytest.raises(RenderError) as excinfo:
+        convert_config({'landing_zone': {'type': 'gcp'}, 'regions': [float('nan')]}, [target])
+    assert excinfo.value.target == 'out.auto.tfvars'
+    assert isinstance(excinfo.value, ValueError)
+
+
+def test_run_conversions_reports_first_failure_in_order():
+    """Test that the earliest failing task is reported regardless of timing."""
+    import threading
+    import time
+
+    done = []
+    release = threading.Event()
+
+    def slow_failure():
+        release.wait(1)
+        raise ValueError('first')
+
+    def fast_failure():
+        release.set()
+        raise ValueError('second')
+
+    tasks = [('a.yaml', lambda: done.append('a')), ('b.yaml', slow_failure), ('c.yaml', fast_failure)]
+    failure = run_conversions(tasks, jobs=3)
+    assert failure.path == 'b.yaml'
+    assert str(failure.error) == 'first'
+    assert done == ['a']
+
+    assert run_conversions([('a.yaml', lambda: time.sleep(0))], jobs=4) is None
+
+
+def test_index_environments_reports_duplicate_missing_and_undeclared_entries():
+    """Test that the environment index keeps first entries and reports the others."""
+    config = {
+        'environments': [{'name': 'development'}, {'name': 'production'}, {'name': 'development'}],
+        'projects': {'environments': [
+            {'environment': 'development', 'projects': ['first']},
+            {'environment': 'development', 'projects': ['second']},
+            {'environment': 'staging', 'projects': []},
+        ]},
+        'app_infra': {'environments': [{'environment': 'production', 'business_units': []}]},
+    }
+
+    index = index_environments(config)
+
+    assert index.names == ['development', 'production']
+    assert index.environment_tfvars('development') == {
+        'environment': 'development', 'projects': ['first'], 'app_infra': {}}
+    assert index.environment_tfvars('production')['app_infra'] == {'environment': 'production', 'business_units': []}
+    assert [issue.path for issue in index.issues] == [
+        'environments[2]',
+        'projects.environments[1]',
+        'projects.environments[2]',
+        'projects.environments',
+        'app_infra.environments',
+    ]
+    assert "'production'" in index.issues[3].message
+    assert "'development'" in index.issues[4].message
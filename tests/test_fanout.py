@@ -0,0 +1,99 @@
+"""Tests for the multi-project deployment matrix."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.config.fanout import ERROR_STATUS, MatrixTarget, merge_overrides, parse_matrix, run_matrix
+
+
+def finished_build(status):
+    return SimpleNamespace(status=SimpleNamespace(name=status), steps=[])
+
+
+def test_parse_matrix():
+    """Test that targets are read from a mapping or a list and checked."""
+    targets = parse_matrix({'targets': [
+        {'project_id': 'p1'},
+        {'name': 'org-b', 'project_id': 'p2', 'overrides': {'bootstrap': {'org_id': '2'}}},
+    ]})
+    assert targets == [MatrixTarget('p1', 'p1', {}), MatrixTarget('org-b', 'p2', {'bootstrap': {'org_id': '2'}})]
+    assert parse_matrix([{'project_id': 'p1'}]) == targets[:1]
+
+    with pytest.raises(ValueError, match=r'targets\[1\]: project_id is required'):
+        parse_matrix([{'project_id': 'p1'}, {'name': 'x'}])
+    with pytest.raises(ValueError, match='duplicate target name'):
+        parse_matrix([{'project_id': 'p1'}, {'project_id': 'p1'}])
+    with pytest.raises(ValueError, match='overrides must be a mapping'):
+        parse_matrix([{'project_id': 'p1', 'overrides': ['x']}])
+    with pytest.raises(ValueError, match='non-empty'):
+        parse_matrix({'targets': []})
+
+
+@pytest.mark.parametrize('overrides, path', [
+    ({'networking': {'base_network': {'subnets': []}}}, 'networking'),
+    ({'business_units': []}, 'business_units'),
+    ({'bootstrap': {'org_id': '2', 'project_prefix': 'x'}}, 'bootstrap.project_prefix'),
+    ({'bootstrap': {'groups': {'required_groups': {'group_billing_admins': 'a@b.c'}}}},
+     'bootstrap.groups.required_groups.group_billing_admins'),
+    ({'org': 'folders/1'}, 'org'),
+])
+def test_parse_matrix_rejects_overrides_builds_do_not_receive(overrides, path):
+    """Test that overrides that would be silently dropped from the build are rejected."""
+    with pytest.raises(ValueError, match=rf'targets\[0\]\.overrides\.{path}: cannot be overridden'):
+        parse_matrix([{'project_id': 'p1', 'overrides': overrides}])
+
+    # Every substitution can be overridden
+    targets = parse_matrix([{'project_id': 'p1', 'overrides': {
+        'bootstrap': {'default_region': 'r', 'org_id': '1', 'billing_account': 'b',
+                      'groups': {'required_groups': {'group_org_admins': 'a@b.c'}}},
+        'org': {'parent_folder': 'folders/1'}}}])
+    assert targets[0].project_id == 'p1'
+
+
+def test_merge_overrides_does_not_modify_the_config():
+    """Test that mappings merge, other values replace and the inputs stay as they were."""
+    config = {'bootstrap': {'org_id': '1', 'default_region': 'r1'}, 'regions': ['a', 'b'], 'version': '1.0'}
+    merged = merge_overrides(config, {'bootstrap': {'org_id': '2'}, 'regions': ['c']})
+
+    assert merged == {'bootstrap': {'org_id': '2', 'default_region': 'r1'}, 'regions': ['c'], 'version': '1.0'}
+    assert config['bootstrap']['org_id'] == '1' and config['regions'] == ['a', 'b']
+
+
+def test_run_matrix_limits_concurrency_and_isolates_failures():
+    """Test that at most `concurrency` builds run, and a failing target does not stop the others."""
+    targets = [MatrixTarget(f't{i}', f'p{i}') for i in range(6)]
+    running, peak, submitted = set(), [0], []
+
+    async def submit(target):
+        if target.name == 't2':
+            raise RuntimeError('quota exceeded')
+        running.add(target.name)
+        peak[0] = max(peak[0], len(running))
+        return f'build-{target.name}'
+
+    async def watch(target, build_id):
+        await asyncio.sleep(0.01)
+        running.discard(target.name)
+        return finished_build('FAILURE' if target.name == 't4' else 'SUCCESS')
+
+    class CountingLimiter:
+        acquired = 0
+
+        async def acquire(self):
+            CountingLimiter.acquired += 1
+
+    results = asyncio.run(run_matrix(targets, submit, watch, concurrency=2, limiter=CountingLimiter(),
+                                     on_submitted=lambda target, build_id: submitted.append(build_id)))
+
+    assert peak[0] == 2
+    assert CountingLimiter.acquired == 6
+    assert [result.target.name for result in results] == [target.name for target in targets]
+    assert [result.status for result in results] == ['SUCCESS', 'SUCCESS', ERROR_STATUS, 'SUCCESS', 'FAILURE',
+                                                     'SUCCESS']
+    assert results[2].error == 'quota exceeded' and results[2].build_id is None and results[2].duration is None
+    assert len(submitted) == 5
+    assert all(result.duration >= 0.01 for result in results if result.submitted is not None)
+    assert results[5].started > results[0].started
+    assert [result.succeeded for result in results].count(True) == 4
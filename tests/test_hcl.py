@@ -0,0 +1,67 @@
+"""Tests for the streaming HCL tfvars writer."""
+
+import io
+
+import pytest
+
+from src.config import hcl
+
+
+def test_quote_escapes_strings():
+    """Test that quotes, escapes and template sequences are escaped."""
+    assert hcl.quote('plain') == '"plain"'
+    assert hcl.quote('say "hi"\\now\n') == '"say \\"hi\\"\\\\now\\n"'
+    assert hcl.quote('${var.x} %{if} $5 %d') == '"$${var.x} %%{if} $5 %d"'
+    assert hcl.quote('tab\there\x01') == '"tab\\there\\u0001"'
+
+
+def test_dumps_writes_native_hcl():
+    """Test that nested values are written as HCL objects, tuples and literals."""
+    tfvars = {
+        'regions': {'primary': 'ca', 'non-production': None},
+        'business_units': [{'code': 'bu1', 'enabled': True, 'count': 3, 'ratio': 0.5,
+                            'ranges': {}, 'tags': [], '1st': 'x', 'null': False}],
+        'name': 'lz',
+    }
+    assert hcl.dumps(tfvars) == (
+        'regions = {\n'
+        '  primary = "ca"\n'
+        '  non-production = null\n'
+        '}\n'
+        'business_units = [\n'
+        '  {\n'
+        '    code = "bu1"\n'
+        '    enabled = true\n'
+        '    count = 3\n'
+        '    ratio = 0.5\n'
+        '    ranges = {}\n'
+        '    tags = []\n'
+        '    "1st" = "x"\n'
+        '    "null" = false\n'
+        '  },\n'
+        ']\n'
+        'name = "lz"\n'
+    )
+
+
+def test_write_tfvars_streams_in_chunks():
+    """Test that large values are written in several chunks."""
+    class Recorder(io.StringIO):
+        writes = 0
+
+        def write(self, text):
+            Recorder.writes += 1
+            return super().write(text)
+
+    stream = Recorder()
+    hcl.write_tfvars({'items': [{'id': str(i)} for i in range(5000)]}, stream)
+    assert Recorder.writes > 1
+    assert stream.getvalue().count('id = ') == 5000
+
+
+def test_write_tfvars_rejects_unrepresentable_values():
+    """Test that invalid names and non-finite numbers are rejected."""
+    with pytest.raises(ValueError):
+        hcl.dumps({'bad name': 1})
+    with pytest.raises(ValueError):
+        hcl.dumps({'x': float('nan')})
@@ -0,0 +1,21 @@
+"""Tests for the command line entry point."""
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+MAIN = os.path.join(ROOT, 'src', 'main.py')
+EXAMPLE = os.path.join(ROOT, 'examples', 'pbmm_config.yaml')
+
+
+def test_convert_skips_heavy_imports(tmp_path):
+    """Test that convert does not import the Cloud Build client, rich or jsonschema."""
+    output_file = tmp_path / 'out.auto.tfvars'
+    result = subprocess.run([sys.executable, '-X', 'importtime', MAIN, 'convert', EXAMPLE, str(output_file)],
+                            capture_output=True, text=True, check=True)
+    imported = {line.split('|')[-1].strip() for line in result.stderr.splitlines()
+                if line.startswith('import time:')}
+    assert output_file.exists()
+    assert not {name for name in imported
+                if name.startswith(('google.cloud', 'rich', 'jsonschema'))}
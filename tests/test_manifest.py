@@ -0,0 +1,70 @@
+"""Tests for the conversion manifest."""
+
+import os
+
+from src.config import manifest as manifest_module
+from src.config.manifest import MANIFEST_NAME, ConversionManifest, section_hashes
+
+OPTIONS = {'format': 'hcl'}
+CONFIG = {'regions': ['northamerica-northeast1'], 'projects': {'a': 1}}
+
+
+def _generate(tmp_path, files=None):
+    """Write an output, record it and save the manifest."""
+    output = tmp_path / 'out.auto.tfvars'
+    output.write_text('regions = []\n')
+    manifest = ConversionManifest(str(tmp_path))
+    manifest.record(str(output), OPTIONS, files or {'config.yaml': 'h1'}, section_hashes(CONFIG, ['regions']))
+    manifest.save()
+    return str(output)
+
+
+def test_unchanged_files_are_fresh_without_hashing_sections(tmp_path):
+    """Test that matching file hashes make the output fresh without reading sections."""
+    output = _generate(tmp_path)
+
+    def sections():
+        raise AssertionError('sections should not be hashed')
+
+    assert ConversionManifest(str(tmp_path)).is_fresh(output, OPTIONS, {'config.yaml': 'h1'}, sections)
+
+
+def test_changes_outside_the_sections_read_keep_output_fresh(tmp_path):
+    """Test that a changed file is fresh if the sections the output reads did not change."""
+    output = _generate(tmp_path)
+    changed = dict(CONFIG, projects={'a': 2})
+
+    manifest = ConversionManifest(str(tmp_path))
+    assert manifest.is_fresh(output, OPTIONS, {'config.yaml': 'h2'}, lambda: section_hashes(changed, ['regions']))
+    manifest.save()
+
+    # The new file hash is remembered
+    assert ConversionManifest(str(tmp_path)).entries['out.auto.tfvars']['files'] == {'config.yaml': 'h2'}
+
+
+def test_stale_outputs(tmp_path):
+    """Test changed sections, options, missing entries and edited outputs."""
+    output = _generate(tmp_path)
+    manifest = ConversionManifest(str(tmp_path))
+    same_sections = lambda: section_hashes(CONFIG, ['regions'])  # noqa: E731
+
+    changed = dict(CONFIG, regions=['northamerica-northeast2'])
+    assert not manifest.is_fresh(output, OPTIONS, {'config.yaml': 'h2'}, lambda: section_hashes(changed, ['regions']))
+    assert not manifest.is_fresh(output, {'format': 'json'}, {'config.yaml': 'h1'}, same_sections)
+    assert not manifest.is_fresh(str(tmp_path / 'other.tfvars'), OPTIONS, {'config.yaml': 'h1'}, same_sections)
+
+    with open(output, 'a') as f:
+        f.write('# edited\n')
+    assert not manifest.is_fresh(output, OPTIONS, {'config.yaml': 'h1'}, same_sections)
+
+
+def test_manifest_from_other_converter_code_is_ignored(tmp_path, monkeypatch):
+    """Test that a converter change invalidates every entry, as does a corrupt manifest."""
+    _generate(tmp_path)
+    monkeypatch.setattr(manifest_module, '_fingerprint', 'other')
+    assert ConversionManifest(str(tmp_path)).entries == {}
+
+    monkeypatch.undo()
+    (tmp_path / MANIFEST_NAME).write_text('{not json')
+    assert ConversionManifest(str(tmp_path)).entries == {}
+    assert os.path.exists(tmp_path / MANIFEST_NAME)
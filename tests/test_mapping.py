@@ -0,0 +1,35 @@
+"""Tests for the declarative field mapping."""
+
+import pytest
+
+from src.config.mapping import Field, compile_projection, project_business_unit
+
+
+def test_project_business_unit_applies_defaults():
+    """Test that missing fields get defaults and environments are nested."""
+    bu = {'business_code': 'bu1', 'development': {'env_code': 'd'}, 'unrelated': 1}
+    result = project_business_unit(bu)
+    assert result['business_code'] == 'bu1'
+    assert result['location_kms'] == 'ca'
+    assert 'unrelated' not in result
+    assert list(result['environments']) == ['development']
+    assert result['environments']['development']['env_code'] == 'd'
+    assert result['environments']['development']['billing_code'] == 'none'
+    assert 'environments' not in project_business_unit(bu, common_only=True)
+
+
+def test_compiled_projection_copies_mutable_defaults():
+    """Test that each call gets its own copy of a mutable default."""
+    project = compile_projection([Field('test', 'base', {}, dict), Field('test', 'name', 'x', str)])
+    first, second = project({}), project({'name': 'y'})
+    assert first == {'base': {}, 'name': 'x'}
+    assert second == {'base': {}, 'name': 'y'}
+    assert first['base'] is not second['base']
+
+
+def test_compile_projection_rejects_invalid_defaults():
+    """Test that defaults must match their type and be literals."""
+    with pytest.raises(TypeError):
+        compile_projection([Field('test', 'enabled', 'no', bool)])
+    with pytest.raises(ValueError):
+        compile_projection([Field('test', 'items', {object()}, set)])
@@ -0,0 +1,222 @@
+"""Tests for the asynchronous build monitor."""
+
+import asyncio
+import enum
+import json
+import sys
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from src.config.fanout import MatrixTarget, run_matrix
+from src.config.monitor import (BuildMonitor, PollPolicy, PushBuildMonitor, build_state, create_monitor,
+                                monitor_builds)
+
+Status = enum.Enum('Status', 'STATUS_UNKNOWN QUEUED WORKING SUCCESS FAILURE')
+
+
+def make_build(status, *steps):
+    return SimpleNamespace(status=Status[status], steps=[SimpleNamespace(status=Status[s]) for s in steps])
+
+
+class FakeClient:
+    """Cloud Build client returning scripted builds; the last one repeats."""
+
+    def __init__(self, scripts):
+        self.scripts = {build_id: list(builds) for build_id, builds in scripts.items()}
+        self.calls = []
+
+    def get_build(self, project_id, id):
+        self.calls.append((project_id, id))
+        script = self.scripts[id]
+        return script.pop(0) if len(script) > 1 else script[0]
+
+
+class AsyncFakeClient(FakeClient):
+    async def get_build(self, project_id, id):
+        return FakeClient.get_build(self, project_id, id)
+
+
+def recording_sleep(delays):
+    async def sleep(seconds):
+        delays.append(seconds)
+        await asyncio.sleep(0)
+    return sleep
+
+
+def test_polls_fast_on_transitions_and_backs_off_during_long_steps():
+    """Test that intervals reset on status changes and grow while nothing changes."""
+    client = FakeClient({'b1': [
+        make_build('QUEUED', 'STATUS_UNKNOWN', 'STATUS_UNKNOWN'),
+        make_build('WORKING', 'WORKING', 'STATUS_UNKNOWN'),
+        *[make_build('WORKING', 'WORKING', 'STATUS_UNKNOWN')] * 5,
+        make_build('WORKING', 'SUCCESS', 'WORKING'),
+        make_build('SUCCESS', 'SUCCESS', 'SUCCESS'),
+    ]})
+    delays, updates = [], []
+    monitor = BuildMonitor(client, 'proj', PollPolicy(1.0, 4.0, 2.0),
+                           lambda build_id, build: updates.append(build_state(build)), recording_sleep(delays))
+
+    build = asyncio.run(monitor.watch('b1'))
+
+    assert build.status is Status.SUCCESS
+    assert delays == [1.0, 1.0, 2.0, 4.0, 4.0, 4.0, 4.0, 1.0]
+    assert updates == [('QUEUED', ('QUEUED', 'QUEUED')), ('WORKING', ('WORKING', 'QUEUED')),
+                       ('WORKING', ('SUCCESS', 'WORKING')), ('SUCCESS', ('SUCCESS', 'SUCCESS'))]
+    assert monitor.polls == len(client.calls) == 9
+    assert client.calls[0] == ('proj', 'b1')
+
+
+@pytest.mark.parametrize('client_class', [FakeClient, AsyncFakeClient])
+def test_watches_several_builds_in_one_loop(client_class):
+    """Test that builds are polled concurrently and each returns its final state."""
+    client = client_class({
+        'fast': [make_build('WORKING', 'WORKING'), make_build('FAILURE', 'FAILURE')],
+        'slow': [make_build('WORKING', 'WORKING')] * 4 + [make_build('SUCCESS', 'SUCCESS')],
+    })
+    monitor = BuildMonitor(client, 'proj', PollPolicy(0.001, 0.001), sleep=recording_sleep([]))
+
+    builds = asyncio.run(monitor.watch_all(['slow', 'fast', 'slow']))
+
+    assert list(builds) == ['slow', 'fast']
+    assert builds['fast'].status is Status.FAILURE
+    assert builds['slow'].status is Status.SUCCESS
+    # The second build was polled before the first one finished
+    order = [build_id for _, build_id in client.calls]
+    assert order.index('fast') < len(order) - 1 - order[::-1].index('slow')
+
+
+def test_polling_error_stops_other_builds():
+    """Test that a failing poll is raised and the remaining builds stop."""
+    class BrokenClient(FakeClient):
+        def get_build(self, project_id, id):
+            if id == 'broken':
+                raise RuntimeError('permission denied')
+            return super().get_build(project_id, id)
+
+    client = BrokenClient({'ok': [make_build('WORKING', 'WORKING')]})
+    with pytest.raises(RuntimeError, match='permission denied'):
+        monitor_builds(BuildMonitor(client, 'proj', PollPolicy(0.001, 0.001)), ['ok', 'broken'])
+
+
+class FakeMessage:
+    def __init__(self, build_id, status, *steps):
+        self.data = json.dumps({'id': build_id, 'status': status,
+                                'steps': [{'name': f'step{i}', 'status': s} for i, s in enumerate(steps)]}).encode()
+        self.attributes = {'buildId': build_id, 'status': status}
+        self.acked = False
+
+    def ack(self):
+        self.acked = True
+
+
+class FakeSubscriber:
+    """Pub/Sub subscriber delivering scripted messages from its own thread."""
+
+    def __init__(self, messages):
+        self.messages = messages
+        self.subscriptions = []
+        self.cancelled = threading.Event()
+
+    def subscribe(self, subscription, callback):
+        self.subscriptions.append(subscription)
+
+        def deliver():
+            for message in self.messages:
+                if self.cancelled.wait(0.005):
+                    return
+                callback(message)
+
+        threading.Thread(target=deliver, daemon=True).start()
+        return SimpleNamespace(cancel=self.cancelled.set)
+
+
+def test_push_monitor_updates_on_messages_without_polling():
+    """Test that status comes from messages, in order, with a single initial fetch per build."""
+    messages = [
+        FakeMessage('b1', 'WORKING', 'WORKING', 'QUEUED'),
+        FakeMessage('other', 'WORKING'),
+        FakeMessage('b2', 'WORKING', 'WORKING'),
+        FakeMessage('b1', 'WORKING', 'SUCCESS', 'WORKING'),
+        FakeMessage('b1', 'WORKING', 'WORKING', 'QUEUED'),  # delivered out of order
+        FakeMessage('b2', 'FAILURE', 'FAILURE'),
+        FakeMessage('b1', 'SUCCESS', 'SUCCESS', 'SUCCESS'),
+    ]
+    subscriber = FakeSubscriber(messages)
+    client = FakeClient({'b1': [make_build('QUEUED', 'STATUS_UNKNOWN', 'STATUS_UNKNOWN')],
+                         'b2': [make_build('QUEUED', 'STATUS_UNKNOWN')]})
+    updates = []
+    monitor = create_monitor(client, 'proj', 'builds-sub', lambda build_id, build: updates.append(
+        (build_id, build_state(build))), subscriber=subscriber)
+    assert isinstance(monitor, PushBuildMonitor)
+
+    builds = monitor_builds(monitor, ['b1', 'b2'])
+
+    assert subscriber.subscriptions == ['projects/proj/subscriptions/builds-sub']
+    assert subscriber.cancelled.is_set()
+    assert builds['b1'].status.name == 'SUCCESS' and builds['b2'].status.name == 'FAILURE'
+    assert monitor.polls == 2
+    assert all(message.acked for message in messages)
+    assert [state for build_id, state in updates if build_id == 'b1'] == [
+        ('QUEUED', ('QUEUED', 'QUEUED')),
+        ('WORKING', ('WORKING', 'QUEUED')),
+        ('WORKING', ('SUCCESS', 'WORKING')),
+        ('SUCCESS', ('SUCCESS', 'SUCCESS')),
+    ]
+
+
+def test_matrix_targets_in_one_project_share_a_subscription():
+    """Test that builds watched separately through one monitor share a pull and get their own messages."""
+    messages = [
+        FakeMessage('b1', 'WORKING', 'WORKING'),
+        FakeMessage('b2', 'WORKING', 'WORKING'),
+        FakeMessage('b2', 'SUCCESS', 'SUCCESS'),
+        FakeMessage('b1', 'FAILURE', 'FAILURE'),
+    ]
+    subscriber = FakeSubscriber(messages)
+    client = FakeClient({'b1': [make_build('QUEUED', 'STATUS_UNKNOWN')], 'b2': [make_build('QUEUED', 'STATUS_UNKNOWN')]})
+    updates = []
+    monitor = create_monitor(client, 'proj', 'builds-sub', lambda build_id, build: updates.append(
+        (build_id, build_state(build)[0])), subscriber=subscriber, heartbeat=5.0)
+    targets = [MatrixTarget('org-a', 'proj'), MatrixTarget('org-b', 'proj')]
+    build_ids = {'org-a': 'b1', 'org-b': 'b2'}
+
+    async def submit(target):
+        return build_ids[target.name]
+
+    async def watch(target, build_id):
+        return await monitor.watch(build_id, target.project_id)
+
+    results = asyncio.run(run_matrix(targets, submit, watch))
+
+    assert [result.status for result in results] == ['FAILURE', 'SUCCESS']
+    assert subscriber.subscriptions == ['projects/proj/subscriptions/builds-sub']
+    assert subscriber.cancelled.is_set()
+    assert monitor.polls == 2 and monitor.messages == 4
+    assert [state for build_id, state in updates if build_id == 'b2'] == ['QUEUED', 'WORKING', 'SUCCESS']
+
+
+def test_push_monitor_fetches_build_when_messages_stop():
+    """Test that a build is fetched after the heartbeat passes without messages."""
+    client = FakeClient({'b1': [make_build('WORKING', 'WORKING'), make_build('SUCCESS', 'SUCCESS')]})
+    monitor = PushBuildMonitor(FakeSubscriber([]), 'projects/proj/subscriptions/s', client, 'proj', heartbeat=0.01)
+
+    build = monitor_builds(monitor, ['b1'])
+
+    assert build['b1'].status is Status.SUCCESS
+    assert monitor.polls == 2
+
+
+def test_monitor_polls_without_subscription():
+    """Test that polling is used when no subscription is configured."""
+    monitor = create_monitor(FakeClient({}), 'proj', None, decode=json.loads, heartbeat=1.0)
+    assert isinstance(monitor, BuildMonitor)
+
+
+def test_monitor_polls_when_pubsub_is_not_installed(monkeypatch, capsys):
+    """Test that a configured subscription falls back to polling without the Pub/Sub library."""
+    monkeypatch.setitem(sys.modules, 'google.cloud.pubsub_v1', None)
+    monitor = create_monitor(FakeClient({}), 'proj', 'builds-sub')
+    assert isinstance(monitor, BuildMonitor)
+    assert 'polling' in capsys.readouterr().err
@@ -0,0 +1,40 @@
+"""Tests for skip-unchanged atomic writes."""
+
+import os
+
+import pytest
+
+from src.config.output import write_if_changed
+
+
+def test_write_if_changed_skips_identical_content(tmp_path):
+    """Test that identical content leaves the file and its mtime untouched."""
+    path = tmp_path / 'dev.auto.tfvars'
+    assert write_if_changed(str(path), lambda f: f.write('a = 1\n')) is True
+    os.utime(path, ns=(10**18, 10**18))
+
+    assert write_if_changed(str(path), lambda f: f.write('a = 1\n')) is False
+    assert path.stat().st_mtime_ns == 10**18
+
+    assert write_if_changed(str(path), lambda f: f.write('a = 2\n')) is True
+    assert path.read_text() == 'a = 2\n'
+    assert os.listdir(tmp_path) == ['dev.auto.tfvars']
+
+
+def test_write_if_changed_keeps_file_on_error(tmp_path):
+    """Test that a failing render neither truncates the file nor leaves temp files."""
+    path = tmp_path / 'dev.auto.tfvars'
+    path.write_text('a = 1\n')
+    path.chmod(0o640)
+
+    def render(f):
+        f.write('partial')
+        raise ValueError('boom')
+
+    with pytest.raises(ValueError):
+        write_if_changed(str(path), render)
+    assert path.read_text() == 'a = 1\n'
+    assert os.listdir(tmp_path) == ['dev.auto.tfvars']
+
+    write_if_changed(str(path), lambda f: f.write('a = 2\n'))
+    assert path.stat().st_mode & 0o777 == 0o640
@@ -0,0 +1,63 @@
+"""Tests for the token bucket rate limiter."""
+
+import asyncio
+
+import pytest
+
+from src.config.ratelimit import TokenBucket
+
+
+class FakeTime:
+    """Clock that only advances when something sleeps."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def clock(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_bursts_then_spreads_calls_at_the_rate():
+    """Test that a full bucket allows a burst, after which calls are spaced by 1/rate."""
+    fake = FakeTime()
+    bucket = TokenBucket(rate=2.0, capacity=2, clock=fake.clock, sleep=fake.sleep)
+
+    async def call_many():
+        times = []
+        for _ in range(5):
+            await bucket.acquire()
+            times.append(fake.now)
+        return times
+
+    assert asyncio.run(call_many()) == [0.0, 0.0, 0.5, 1.0, 1.5]
+    assert bucket.waited == pytest.approx(1.5)
+
+
+def test_concurrent_callers_share_the_rate():
+    """Test that concurrent callers are served one token at a time, in arrival order."""
+    fake = FakeTime()
+    bucket = TokenBucket(rate=10.0, capacity=1, clock=fake.clock, sleep=fake.sleep)
+    order = []
+
+    async def caller(name):
+        await bucket.acquire()
+        order.append((name, round(fake.now, 6)))
+
+    async def run():
+        await asyncio.gather(*(caller(name) for name in 'abc'))
+
+    asyncio.run(run())
+    assert order == [('a', 0.0), ('b', 0.1), ('c', 0.2)]
+
+
+def test_rejects_invalid_settings():
+    """Test that non-positive rates and oversized requests are refused."""
+    with pytest.raises(ValueError):
+        TokenBucket(0)
+    with pytest.raises(ValueError):
+        asyncio.run(TokenBucket(1.0, 2).acquire(3))
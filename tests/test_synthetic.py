@@ -0,0 +1,27 @@
+"""Tests for the synthetic config generator used by the benchmarks."""
+
+import ipaddress
+
+import pytest
+
+from benchmarks.synthetic import generate_config
+from src.config.validator import ConfigValidator
+
+
+@pytest.mark.parametrize('lz_type', ['pbmm-gcp', 'gcp'])
+def test_generated_configs_are_valid(lz_type):
+    """Test that generated configs pass schema validation."""
+    config = generate_config(lz_type, 25)
+    assert ConfigValidator().find_errors(config) == []
+
+
+def test_generated_ranges_do_not_overlap():
+    """Test that every generated CIDR is distinct and disjoint."""
+    config = generate_config('pbmm-gcp', 25)
+    ranges = [ipaddress.ip_network(s['subnet_ip']) for s in config['networking']['base_network']['subnets']]
+    for bu in config['business_units']:
+        for env in ('development', 'nonproduction', 'production'):
+            for kind in ('base', 'restricted'):
+                ranges.extend(ipaddress.ip_network(c) for c in bu[env][kind]['ip_ranges'].values())
+    ranges.sort()
+    assert all(not a.overlaps(b) for a, b in zip(ranges, ranges[1:]))
@@ -0,0 +1,54 @@
+"""Tests for the .tfvars.json writer."""
+
+import datetime
+import json
+
+import pytest
+
+from src.config import tfjson
+from src.config.converter import ConversionTarget, convert_file, tfvars_filename
+
+TFVARS = {'regions': {'primary': 'ca'}, 'business_units': [{'code': 'bü1', 'enabled': True, 'tags': []}],
+          'created': datetime.date(2024, 1, 2), 'updated': datetime.datetime(2024, 1, 1, 10, 0),
+          'serial': 2 ** 70}
+
+
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_dumps_is_compact_json(monkeypatch, use_orjson):
+    """Test that both encoders write compact, equivalent JSON."""
+    if not use_orjson:
+        monkeypatch.setattr(tfjson, 'orjson', None)
+    elif tfjson.orjson is None:
+        pytest.skip('orjson is not installed')
+
+    data = tfjson.dumps(TFVARS)
+    assert b'\n' not in data and b', ' not in data
+    assert json.loads(data) == {**TFVARS, 'created': '2024-01-02', 'updated': '2024-01-01 10:00:00'}
+    # The same bytes as the standard library encoder
+    assert data == json.dumps(TFVARS, separators=(',', ':'), ensure_ascii=False, default=str).encode('utf-8')
+    # Without the integer orjson cannot encode, orjson itself writes the datetime
+    assert tfjson.dumps({'updated': TFVARS['updated']}) == b'{"updated":"2024-01-01 10:00:00"}'
+
+
+@pytest.mark.parametrize('use_orjson', [True, False])
+@pytest.mark.parametrize('value', [float('nan'), float('inf'), -float('inf')])
+def test_dumps_rejects_non_finite_floats(monkeypatch, use_orjson, value):
+    """Test that both encoders raise instead of writing NaN or infinity as null."""
+    if not use_orjson:
+        monkeypatch.setattr(tfjson, 'orjson', None)
+    elif tfjson.orjson is None:
+        pytest.skip('orjson is not installed')
+
+    with pytest.raises(ValueError, match='Out of range float values'):
+        tfjson.dumps({'network': {'mtu': [1460, value]}})
+
+
+def test_convert_file_writes_json_target(tmp_path):
+    """Test that a json target is written as a .tfvars.json document."""
+    config_file = tmp_path / 'config.yaml'
+    config_file.write_text('landing_zone: {type: pbmm-gcp}\nbusiness_units: [{business_code: bu1}]\n')
+    output = tmp_path / tfvars_filename('common.auto.tfvars', 'json')
+    assert output.name == 'common.auto.tfvars.json'
+
+    convert_file(str(config_file), [ConversionTarget(str(output), True, 'json')])
+    assert json.loads(output.read_text())['business_units'][0]['business_code'] == 'bu1'
@@ -0,0 +1,107 @@
+"""Tests for caching Terraform and its providers between deploy builds."""
+
+import os
+import shutil
+import subprocess
+import zipfile
+
+import pytest
+
+from src.config.buildsteps import longest_chain, translate_step
+from src.config.toolcache import (RESTORE_SCRIPT, RESTORE_STEP, SAVE_SCRIPT, SAVE_STEP, ToolCache,
+                                  add_cache_steps)
+from src.config.yaml_loader import load_file
+
+PBMM_CLOUDBUILD = os.path.join(os.path.dirname(__file__), '../landing-zones/pbmm-gcp/cloudbuild.yaml')
+
+
+def test_cache_steps_wrap_the_deployment():
+    """Test that the cache is restored after checkout and saved after every other step."""
+    steps = load_file(PBMM_CLOUDBUILD)['steps']
+    cached = add_cache_steps(steps, ToolCache('gs://bucket/tools/'))
+
+    assert [step.get('id') for step in cached] == [
+        'check-out-source', RESTORE_STEP, 'get-sa-key', 'Install Tools and Perform Deployment', SAVE_STEP]
+    assert cached[1]['waitFor'] == ['check-out-source']
+    assert 'TOOL_CACHE=gs://bucket/tools' in cached[3]['env']
+    assert cached[1]['args'][1].count('$$TOOL_CACHE') == RESTORE_SCRIPT.count('$TOOL_CACHE')
+    assert all(cached[i]['allowFailure'] for i in (1, 4))
+    assert longest_chain(cached).steps == [
+        'check-out-source', RESTORE_STEP, 'Install Tools and Perform Deployment', SAVE_STEP]
+    for index, step in enumerate(cached):
+        translate_step(step, index)
+    assert 'env' not in steps[2]
+
+
+def test_explicit_waits_on_the_checkout_also_wait_for_the_restore():
+    """Test that steps waiting for the checkout by id wait for the restored tools too."""
+    steps = [{'name': 'git', 'id': 'src'}, {'name': 'tf', 'waitFor': ['src'], 'env': ['A=1']}]
+    cached = add_cache_steps(steps, ToolCache('/cache'), after='src')
+    assert cached[2]['waitFor'] == ['src', RESTORE_STEP]
+    assert cached[2]['env'][0] == 'A=1'
+
+    with pytest.raises(ValueError, match="no step has the id 'checkout'"):
+        add_cache_steps(steps, ToolCache('/cache'), after='checkout')
+
+
+VERSIONS_TF = """terraform {
+  required_providers {
+    google = {
+      source  = "hashicorp/google"
+      version = "%s"
+    }
+  }
+}
+"""
+
+
+@pytest.mark.skipif(not all(shutil.which(tool) for tool in ('bash', 'curl', 'python3', 'sha256sum', 'tar')),
+                    reason='needs bash, curl, python3, sha256sum and tar')
+def test_scripts_restore_and_save_with_a_local_cache(tmp_path):
+    """Test builds without committed lock files against a local cache directory."""
+    release = tmp_path / 'terraform.zip'
+    with zipfile.ZipFile(release, 'w') as archive:
+        archive.writestr('terraform', '#!/bin/sh\necho fake terraform\n')
+    cache = tmp_path / 'cache'
+    missing = (tmp_path / 'missing.zip').as_uri()
+
+    def build(name, constraint, providers, url=missing):
+        workspace = tmp_path / name
+        (workspace / 'stage').mkdir(parents=True)
+        (workspace / 'stage' / 'versions.tf').write_text(VERSIONS_TF % constraint)
+        env = dict(os.environ, TERRAFORM_URL=url)
+        env.update(entry.split('=', 1) for entry in ToolCache(str(cache)).env())
+        env.update(TOOLS_DIR=str(workspace / 'bin'), TF_PLUGIN_CACHE_DIR=str(workspace / 'plugins'))
+
+        def run(script):
+            return subprocess.run(['bash', '-c', script], cwd=workspace, env=env, check=True,
+                                  capture_output=True, text=True).stdout
+
+        restore = run(RESTORE_SCRIPT)
+        assert os.access(workspace / 'bin' / 'terraform', os.X_OK)
+        restored = sorted(os.listdir(workspace / 'plugins'))
+        # terraform init writes a lock file and fills the plugin cache
+        (workspace / 'stage' / '.terraform.lock.hcl').write_text(f'{constraint} {providers}')
+        for provider in providers:
+            (workspace / 'plugins' / provider).mkdir(exist_ok=True)
+            (workspace / 'plugins' / provider / 'provider').write_text(constraint)
+        return restore, restored, run(SAVE_SCRIPT)
+
+    restore, restored, save = build('cold', '~> 5.0', ['google'], release.as_uri())
+    assert 'Downloaded Terraform 1.6.0' in restore and 'No providers cached' in restore
+    assert 'Saved providers' in save
+    assert (cache / 'terraform' / '1.6.0' / 'terraform').exists()
+
+    restore, restored, save = build('warm', '~> 5.0', ['google'])
+    assert 'Restored Terraform 1.6.0' in restore and restored == ['google']
+    assert 'already cached' in save
+
+    # A provider added by init is saved even though providers were restored
+    restore, restored, save = build('added', '~> 5.0', ['google', 'random'])
+    assert restored == ['google'] and 'Saved providers' in save
+    restore, restored, save = build('rewarmed', '~> 5.0', ['google', 'random'])
+    assert restored == ['google', 'random'] and 'already cached' in save
+
+    restore, restored, save = build('upgraded', '~> 5.1', ['google'])
+    assert 'No providers cached' in restore and restored == [] and 'Saved providers' in save
+    assert len(os.listdir(cache / 'providers')) == 2
@@ -75,4 +75,29 @@ def test_invalid_email():
     }
     with pytest.raises(ValidationError) as exc_info:
         validator.validate_config(invalid_config)
-    assert 'email' in str(exc_info.value) 
\ No newline at end of file
+    assert 'email' in str(exc_info.value) 
+
+def test_validators_are_reused():
+    """Test that compiled validators are shared across instances."""
+    first = ConfigValidator()
+    second = ConfigValidator()
+    assert first.registry is second.registry
+    assert first.registry.get('pbmm-gcp') is second.registry.get('pbmm-gcp')
+    assert first.registry.get('base') is first.registry.get('base')
+
+
+def test_find_errors_collects_all_violations():
+    """Test that every violation is reported as a structured record."""
+    validator = ConfigValidator()
+    invalid_config = {
+        'version': 'invalid',
+        'landing_zone': {'type': 'pbmm-gcp'},
+        'bootstrap': {'org_id': '123'}
+    }
+    issues = validator.find_errors(invalid_config)
+    paths = {issue.path for issue in issues}
+    assert '$.version' in paths
+    assert '$.bootstrap.org_id' in paths
+    assert {'base', 'pbmm-gcp'} <= {issue.schema for issue in issues}
+    org_id = next(issue for issue in issues if issue.path == '$.bootstrap.org_id')
+    assert org_id.schema_path == 'properties/bootstrap/properties/org_id/pattern'
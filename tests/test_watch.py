@@ -0,0 +1,45 @@
+"""Tests for the polling file watcher."""
+
+import os
+
+from src.config.watch import ChangeSet, FileWatcher, watch
+
+
+def _touch(path, mtime_ns):
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_poll_reports_changed_new_and_removed_files(tmp_path):
+    """Test that only files whose mtime or size changed are reported."""
+    a, b, c = (str(tmp_path / name) for name in ('a.yaml', 'b.yaml', 'c.yaml'))
+    for path in (a, b):
+        open(path, 'w').close()
+        _touch(path, 10**18)
+    watched = [a, b]
+    watcher = FileWatcher(lambda: list(watched))
+
+    assert watcher.poll() == ChangeSet([a, b], [])
+    assert watcher.poll() == ChangeSet([], [])
+
+    _touch(b, 2 * 10**18)
+    with open(c, 'w') as f:
+        f.write('x')
+    watched[:] = [b, c]
+    assert watcher.poll() == ChangeSet([b, c], [a])
+    assert watcher.poll() == ChangeSet([], [])
+
+
+def test_watch_calls_back_on_changes_until_stopped(tmp_path):
+    """Test that the initial state and later changes reach the callback."""
+    path = tmp_path / 'config.yaml'
+    seen = []
+    polls = iter(range(3))
+
+    def stop():
+        n = next(polls)
+        if n == 0:
+            path.write_text('version: "1.0"\n')
+        return n == 2
+
+    watch(FileWatcher(lambda: [str(path)]), seen.append, interval=0, stop=stop)
+    assert seen == [ChangeSet([str(path)], []), ChangeSet([str(path)], [])]
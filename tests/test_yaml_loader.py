@@ -0,0 +1,42 @@
+"""Tests for the shared YAML loader."""
+
+import os
+
+import pytest
+import yaml
+
+from src.config import yaml_loader
+from src.config.yaml_loader import ConfigStore, load_file, safe_load
+
+
+def test_load_file_matches_safe_load(tmp_path):
+    """Test that the shared loader parses like yaml.safe_load."""
+    text = 'version: "1.0"\nregions:\n  primary: northamerica-northeast1\nenabled: true\n'
+    path = tmp_path / 'config.yaml'
+    path.write_text(text)
+    assert load_file(str(path)) == yaml.safe_load(text)
+
+
+def test_rejects_python_tags():
+    """Test that the loader stays safe with the libyaml fast path."""
+    with pytest.raises(yaml.YAMLError):
+        safe_load('!!python/object/apply:os.system ["true"]')
+
+
+def test_store_parses_once_until_modified(tmp_path, monkeypatch):
+    """Test that the store memoizes by path and modification time."""
+    path = tmp_path / 'config.yaml'
+    path.write_text('version: "1.0"\n')
+    store = ConfigStore()
+    calls = []
+    real_load = yaml_loader.safe_load
+    monkeypatch.setattr(yaml_loader, 'safe_load', lambda data: calls.append(data) or real_load(data))
+
+    first = store.load(str(path)).data
+    assert store.load(str(tmp_path / '.' / 'config.yaml')).data is first
+    assert len(calls) == 1
+
+    path.write_text('version: "2.0"\n')
+    os.utime(path, ns=(0, 10**9))
+    assert store.load(str(path)).data == {'version': '2.0'}
+    assert len(calls) == 2